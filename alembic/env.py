@@ -17,6 +17,9 @@ from app.models.survey import Survey
 from app.models.team_member import TeamMember  
 from app.models.question import SurveyQuestion
 from app.models.response import Response
+from app.models.analytics_snapshot import SurveyAnalyticsSnapshot
+from app.models.invitation import InvitationOutbox
+from app.models.idempotency import IdempotencyRecord
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
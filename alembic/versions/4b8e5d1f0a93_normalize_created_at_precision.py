@@ -0,0 +1,38 @@
+"""Normalize created_at to microsecond precision
+
+Revision ID: 4b8e5d1f0a93
+Revises: c6f19e2d7a34
+Create Date: 2025-07-15 14:07:12.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e5d1f0a93'
+down_revision: Union[str, None] = 'c6f19e2d7a34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose rows got created_at from the CURRENT_TIMESTAMP server default
+# before it was also set client-side
+TABLES = ('survey_questions', 'surveys', 'team_members', 'responses')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 'YYYY-MM-DD HH:MM:SS' sorts before the 'YYYY-MM-DD HH:MM:SS.ffffff' written
+    # for every bound datetime, so keyset cursors skipped same-second rows
+    for table in TABLES:
+        op.execute(sa.text(
+            f"UPDATE {table} SET created_at = created_at || '.000000' WHERE length(created_at) = 19"
+        ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The padded values denote the same instants; nothing to undo
+    pass
@@ -0,0 +1,30 @@
+"""Add keyset pagination indexes
+
+Revision ID: 8c41d2a7f3b9
+Revises: 5e9753d63fbb
+Create Date: 2025-06-18 10:12:44.201377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d2a7f3b9'
+down_revision: Union[str, None] = '5e9753d63fbb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_surveys_manager_id_created_at_id', 'surveys', ['manager_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_team_members_survey_id_created_at_id', 'team_members', ['survey_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_team_members_survey_id_created_at_id', table_name='team_members')
+    op.drop_index('ix_surveys_manager_id_created_at_id', table_name='surveys')
@@ -0,0 +1,41 @@
+"""Add survey analytics snapshots
+
+Revision ID: b7e2f04c91d6
+Revises: 8c41d2a7f3b9
+Create Date: 2025-06-24 09:41:17.552019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f04c91d6'
+down_revision: Union[str, None] = '8c41d2a7f3b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('survey_analytics_snapshots',
+    sa.Column('survey_id', sa.UUID(), nullable=False),
+    sa.Column('total_members', sa.Integer(), nullable=False),
+    sa.Column('completed_responses', sa.Integer(), nullable=False),
+    sa.Column('question_analytics', sa.JSON(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['survey_id'], ['surveys.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('survey_id')
+    )
+    op.create_index(op.f('ix_survey_analytics_snapshots_id'), 'survey_analytics_snapshots', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_survey_analytics_snapshots_id'), table_name='survey_analytics_snapshots')
+    op.drop_table('survey_analytics_snapshots')
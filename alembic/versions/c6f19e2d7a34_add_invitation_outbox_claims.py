@@ -0,0 +1,31 @@
+"""Add invitation outbox claim token and claimed_at
+
+Revision ID: c6f19e2d7a34
+Revises: a9d4e71b3c58
+Create Date: 2025-07-14 09:52:31.604218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f19e2d7a34'
+down_revision: Union[str, None] = 'a9d4e71b3c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('invitation_outbox', sa.Column('claim_token', sa.UUID(), nullable=True))
+    op.add_column('invitation_outbox', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('invitation_outbox') as batch_op:
+        batch_op.drop_column('claimed_at')
+        batch_op.drop_column('claim_token')
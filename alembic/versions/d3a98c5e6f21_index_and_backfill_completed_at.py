@@ -0,0 +1,50 @@
+"""Index and backfill team member completed_at
+
+Revision ID: d3a98c5e6f21
+Revises: b7e2f04c91d6
+Create Date: 2025-06-27 16:05:38.914402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a98c5e6f21'
+down_revision: Union[str, None] = 'b7e2f04c91d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # completed_at was never set before; the first response is when a member completed
+    team_members = sa.table(
+        'team_members',
+        sa.column('id', sa.UUID()),
+        sa.column('has_completed', sa.Boolean()),
+        sa.column('completed_at', sa.DateTime(timezone=True))
+    )
+    responses = sa.table(
+        'responses',
+        sa.column('team_member_id', sa.UUID()),
+        sa.column('submitted_at', sa.DateTime(timezone=True))
+    )
+    op.execute(
+        team_members.update()
+        .where(team_members.c.has_completed == sa.true(), team_members.c.completed_at.is_(None))
+        .values(completed_at=(
+            sa.select(sa.func.min(responses.c.submitted_at))
+            .where(responses.c.team_member_id == team_members.c.id)
+            .scalar_subquery()
+        ))
+    )
+
+    op.create_index('ix_team_members_survey_id_completed_at', 'team_members', ['survey_id', 'completed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_team_members_survey_id_completed_at', table_name='team_members')
@@ -0,0 +1,31 @@
+"""Add team member last_reminded_at
+
+Revision ID: e5c17b3a8d42
+Revises: d3a98c5e6f21
+Create Date: 2025-07-01 11:28:06.377150
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c17b3a8d42'
+down_revision: Union[str, None] = 'd3a98c5e6f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('team_members', sa.Column('last_reminded_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_team_members_has_completed_created_at_id', 'team_members', ['has_completed', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_team_members_has_completed_created_at_id', table_name='team_members')
+    with op.batch_alter_table('team_members') as batch_op:
+        batch_op.drop_column('last_reminded_at')
@@ -0,0 +1,49 @@
+"""Add invitation outbox
+
+Revision ID: f2a86d4c1e07
+Revises: e5c17b3a8d42
+Create Date: 2025-07-03 14:52:40.118273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a86d4c1e07'
+down_revision: Union[str, None] = 'e5c17b3a8d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('invitation_outbox',
+    sa.Column('survey_id', sa.UUID(), nullable=False),
+    sa.Column('team_member_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'SENDING', 'SENT', 'FAILED', name='invitationstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['survey_id'], ['surveys.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['team_member_id'], ['team_members.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('team_member_id')
+    )
+    op.create_index(op.f('ix_invitation_outbox_id'), 'invitation_outbox', ['id'], unique=False)
+    op.create_index('ix_invitation_outbox_status_next_attempt_at', 'invitation_outbox', ['status', 'next_attempt_at'], unique=False)
+    op.create_index('ix_invitation_outbox_survey_id_created_at_id', 'invitation_outbox', ['survey_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_invitation_outbox_survey_id_created_at_id', table_name='invitation_outbox')
+    op.drop_index('ix_invitation_outbox_status_next_attempt_at', table_name='invitation_outbox')
+    op.drop_index(op.f('ix_invitation_outbox_id'), table_name='invitation_outbox')
+    op.drop_table('invitation_outbox')
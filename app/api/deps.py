@@ -1,73 +1,181 @@
 """
 API dependencies for dependency injection
 """
-from typing import Generator
-from fastapi import Depends  # <-- ADD THIS IMPORT
-from sqlalchemy.orm import Session
-
-from app.database.session import SessionLocal
+from typing import Any, Callable, Coroutine, Generator
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.analytics_worker import AnalyticsWorker, analytics_worker
+from app.core.benchmark import BenchmarkIndex, benchmark_index
+from app.core.confidence import ConfidenceIntervals, confidence_intervals
+from app.core.idempotency import IdempotencyStore, idempotency_store
+from app.core.invitation_worker import InvitationWorker, invitation_worker
+from app.core.question_catalog import QuestionCatalog, question_catalog
+from app.core.survey_page_cache import SurveyPageCache, survey_page_cache
+from app.database.session import UnitOfWork
 from app.repositories.survey import SurveyRepository
 from app.repositories.team_member import TeamMemberRepository
 from app.repositories.question import QuestionRepository
 from app.repositories.response import ResponseRepository
+from app.repositories.analytics_snapshot import AnalyticsSnapshotRepository
+from app.repositories.invitation import InvitationRepository
 from app.services.survey_service import SurveyService
 from app.services.response_service import ResponseService
 from app.services.analytics_service import AnalyticsService
+from app.services.export_service import ExportService
+from app.services.ratings_engine import RatingsEngine, ratings_engine
+
 
 
+def get_unit_of_work(request: Request) -> Generator[UnitOfWork, None, None]:
+    """
+    Get the request's lazily opened unit of work
 
-def get_db() -> Generator:
-    """Get database session"""
-    db = SessionLocal()
+    It is kept on ``request.state`` so ``UnitOfWorkRoute`` can release it
+    as soon as the endpoint returns; releasing it again once the request is
+    over covers routes that do not use that route class.
+    """
+    unit_of_work = UnitOfWork()
+    request.state.unit_of_work = unit_of_work
     try:
-        yield db
+        yield unit_of_work
     finally:
-        db.close()
+        unit_of_work.release()
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Route releasing the request's unit of work when the endpoint returns.
+
+    The session goes back to the pool before the response is sent instead
+    of after it, whatever the FastAPI version does with the exit code of
+    dependencies with yield.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def release_after_endpoint(request: Request) -> Response:
+            try:
+                return await handler(request)
+            finally:
+                unit_of_work = getattr(request.state, "unit_of_work", None)
+                if unit_of_work is not None:
+                    unit_of_work.release()
+
+        return release_after_endpoint
 
 
-def get_survey_repository(db: Session = Depends(get_db)) -> SurveyRepository:
+def get_survey_repository(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> SurveyRepository:
     """Get survey repository"""
-    return SurveyRepository(db)
+    return SurveyRepository(unit_of_work)
 
 
-def get_team_member_repository(db: Session = Depends(get_db)) -> TeamMemberRepository:
+def get_team_member_repository(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> TeamMemberRepository:
     """Get team member repository"""
-    return TeamMemberRepository(db)
+    return TeamMemberRepository(unit_of_work)
 
 
-def get_question_repository(db: Session = Depends(get_db)) -> QuestionRepository:
+def get_question_repository(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> QuestionRepository:
     """Get question repository"""
-    return QuestionRepository(db)
+    return QuestionRepository(unit_of_work)
 
 
-def get_response_repository(db: Session = Depends(get_db)) -> ResponseRepository:
+def get_response_repository(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> ResponseRepository:
     """Get response repository"""
-    return ResponseRepository(db)
+    return ResponseRepository(unit_of_work)
+
+
+def get_analytics_snapshot_repository(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> AnalyticsSnapshotRepository:
+    """Get analytics snapshot repository"""
+    return AnalyticsSnapshotRepository(unit_of_work)
+
+
+def get_invitation_repository(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> InvitationRepository:
+    """Get invitation outbox repository"""
+    return InvitationRepository(unit_of_work)
+
+
+def get_benchmark_index() -> BenchmarkIndex:
+    """Get the process-wide benchmark index"""
+    return benchmark_index
+
+
+def get_confidence_intervals() -> ConfidenceIntervals:
+    """Get the process-wide confidence interval calculator"""
+    return confidence_intervals
+
+
+def get_analytics_worker() -> AnalyticsWorker:
+    """Get the process-wide analytics worker"""
+    return analytics_worker
+
+
+def get_invitation_worker() -> InvitationWorker:
+    """Get the process-wide invitation worker"""
+    return invitation_worker
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Get the process-wide idempotency key store"""
+    return idempotency_store
+
+
+def get_question_catalog() -> QuestionCatalog:
+    """Get the process-wide question catalog"""
+    return question_catalog
+
+
+def get_survey_page_cache() -> SurveyPageCache:
+    """Get the process-wide rendered survey page cache"""
+    return survey_page_cache
+
+
+def get_ratings_engine() -> RatingsEngine:
+    """Get the process-wide ratings engine"""
+    return ratings_engine
 
 
 def get_survey_service(
         survey_repo: SurveyRepository = Depends(get_survey_repository),
         team_member_repo: TeamMemberRepository = Depends(get_team_member_repository),
-        question_repo: QuestionRepository = Depends(get_question_repository)
+        question_repo: QuestionRepository = Depends(get_question_repository),
+        invitation_repo: InvitationRepository = Depends(get_invitation_repository),
+        worker: InvitationWorker = Depends(get_invitation_worker),
+        catalog: QuestionCatalog = Depends(get_question_catalog),
+        page_cache: SurveyPageCache = Depends(get_survey_page_cache)
 ) -> SurveyService:
     """Get survey service with injected repositories"""
-    return SurveyService(survey_repo, team_member_repo, question_repo)
+    return SurveyService(survey_repo, team_member_repo, question_repo, invitation_repo, worker, catalog, page_cache)
 
 
 def get_response_service(
         response_repo: ResponseRepository = Depends(get_response_repository),
         team_member_repo: TeamMemberRepository = Depends(get_team_member_repository),
-        question_repo: QuestionRepository = Depends(get_question_repository)
+        question_repo: QuestionRepository = Depends(get_question_repository),
+        worker: AnalyticsWorker = Depends(get_analytics_worker),
+        engine: RatingsEngine = Depends(get_ratings_engine),
+        catalog: QuestionCatalog = Depends(get_question_catalog)
 ) -> ResponseService:
     """Get response service with injected repositories"""
-    return ResponseService(response_repo, team_member_repo, question_repo)
+    return ResponseService(response_repo, team_member_repo, question_repo, worker, engine, catalog)
 
 
 def get_analytics_service(
         survey_repo: SurveyRepository = Depends(get_survey_repository),
         team_member_repo: TeamMemberRepository = Depends(get_team_member_repository),
-        response_repo: ResponseRepository = Depends(get_response_repository)
+        response_repo: ResponseRepository = Depends(get_response_repository),
+        snapshot_repo: AnalyticsSnapshotRepository = Depends(get_analytics_snapshot_repository),
+        benchmark: BenchmarkIndex = Depends(get_benchmark_index),
+        intervals: ConfidenceIntervals = Depends(get_confidence_intervals)
 ) -> AnalyticsService:
     """Get analytics service with injected repositories"""
-    return AnalyticsService(survey_repo, team_member_repo, response_repo)
+    return AnalyticsService(survey_repo, team_member_repo, response_repo, snapshot_repo, benchmark, intervals)
+
+
 
+def get_export_service(
+        survey_repo: SurveyRepository = Depends(get_survey_repository)
+) -> ExportService:
+    """Get export service with injected repositories"""
+    return ExportService(survey_repo)
@@ -3,8 +3,11 @@ Main API router
 """
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import surveys, responses
+from app.api.v1.endpoints import surveys, responses, analytics, questions
 api_router = APIRouter()
 
 api_router.include_router(surveys.router, prefix="/surveys", tags=["surveys"])
-api_router.include_router(responses.router, prefix="/survey", tags=["responses"])
\ No newline at end of file
+api_router.include_router(surveys.collection_router, tags=["surveys"])
+api_router.include_router(responses.router, prefix="/survey", tags=["responses"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(questions.router, prefix="/questions", tags=["questions"])
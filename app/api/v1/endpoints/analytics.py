@@ -0,0 +1,89 @@
+"""
+Analytics endpoints - Cross-survey aggregates
+"""
+import asyncio
+from datetime import date
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import get_ratings_engine, UnitOfWorkRoute
+from app.config import settings
+from app.services.ratings_engine import RatingsEngine, RatingsGroupBy
+from app.schemas.analytics import RatingsAggregate, RatingsAggregateResponse, RatingsGroup
+from app.schemas.common import ErrorResponse
+from app.utils.statistics import RATING_SCALE
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+@router.get(
+    "/ratings",
+    response_model=RatingsAggregateResponse,
+    responses={400: {"model": ErrorResponse}},
+    summary="Aggregate ratings across surveys",
+    description="Group every rating by manager, survey, question or month with optional filters"
+)
+async def aggregate_ratings(
+        group_by: RatingsGroupBy = Query(RatingsGroupBy.MANAGER, alias="groupBy"),
+        question_id: Optional[UUID] = Query(None, alias="questionId"),
+        manager_id: Optional[str] = Query(None, alias="managerId", max_length=255),
+        since: Optional[date] = Query(None, description="First submission day (inclusive)"),
+        until: Optional[date] = Query(None, description="Last submission day (inclusive)"),
+        engine: RatingsEngine = Depends(get_ratings_engine)
+):
+    """
+    Aggregate ratings across all surveys from the in-memory ratings engine.
+
+    - **groupBy**: `manager`, `survey`, `question` or `month`
+    - **questionId**, **managerId**: Restrict to one question / manager
+    - **since**, **until**: Submission day range (YYYY-MM-DD)
+
+    The first call loads the snapshot from the database; later calls and
+    new submissions are served from memory. Groups rated by fewer people
+    than the anonymity threshold only report their rating count.
+    """
+    try:
+        if since and until and since > until:
+            raise ValueError("'since' must not be after 'until'")
+
+        if not engine.is_loaded:
+            await asyncio.to_thread(engine.ensure_loaded)
+
+        # Every respondent rates each question once, so ratings per respondent is
+        # 1 within a single question and the question count otherwise
+        per_respondent = 1 if question_id or group_by is RatingsGroupBy.QUESTION else max(engine.question_count, 1)
+        min_ratings = settings.ANONYMITY_MIN_RESPONSES * per_respondent
+
+        groups = []
+        for group in engine.aggregate(group_by, question_id, manager_id, since, until):
+            if group["response_count"] < min_ratings:
+                groups.append(RatingsGroup(key=group["key"], responseCount=group["response_count"], suppressed=True))
+                continue
+            groups.append(RatingsGroup(
+                key=group["key"],
+                responseCount=group["response_count"],
+                averageScore=round(group["average_score"], 2),
+                ratingDistribution={
+                    str(rating): count for rating, count in zip(RATING_SCALE, group["distribution"])
+                }
+            ))
+
+        return RatingsAggregateResponse(data=RatingsAggregate(
+            groupBy=group_by.value,
+            totalRatings=sum(group.responseCount for group in groups),
+            groups=groups
+        ))
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to aggregate ratings"
+        )
@@ -0,0 +1,38 @@
+"""
+Question endpoints - Predefined survey questions
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.deps import get_survey_service, UnitOfWorkRoute
+from app.services.survey_service import SurveyService
+from app.schemas.survey import SurveyQuestionsResponse
+from app.utils.serialization import json_response
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+@router.get(
+    "/",
+    response_model=SurveyQuestionsResponse,
+    summary="List survey questions",
+    description="The predefined questions every survey asks, in order"
+)
+async def list_questions(
+        survey_service: SurveyService = Depends(get_survey_service)
+):
+    """
+    List the predefined survey questions with their rating scale.
+
+    The questions only change when the database is re-seeded, so the
+    response may be cached by browsers and proxies.
+    """
+    try:
+        questions = await survey_service.get_questions()
+
+        return json_response(SurveyQuestionsResponse.model_construct(data=questions))
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list questions"
+        )
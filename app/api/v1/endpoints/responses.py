@@ -1,15 +1,18 @@
 """
 Response endpoints - Survey completion and submission
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
 
-from app.api.deps import get_survey_service, get_response_service
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+
+from app.api.deps import get_survey_service, get_response_service, get_idempotency_store, UnitOfWorkRoute
+from app.core.idempotency import IdempotencyConflict, IdempotencyStore
 from app.services.survey_service import SurveyService
 from app.services.response_service import ResponseService
 from app.schemas.survey import SurveyDataResponse
 from app.schemas.response import SurveySubmission, SurveySubmissionResponse
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.get(
@@ -34,15 +37,15 @@ async def get_survey_by_token(
     - List of questions to answer
     """
     try:
-        survey_data = await survey_service.get_survey_by_token(token)
+        survey_page = await survey_service.get_survey_by_token(token)
 
-        if not survey_data:
+        if survey_page is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Survey not found or invalid link"
             )
 
-        return SurveyDataResponse(data=survey_data)
+        return Response(content=survey_page, media_type="application/json")
 
     except HTTPException:
         raise
@@ -68,7 +71,9 @@ async def get_survey_by_token(
 async def submit_survey_response(
         token: str,
         submission: SurveySubmission,
-        response_service: ResponseService = Depends(get_response_service)
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+        response_service: ResponseService = Depends(get_response_service),
+        idempotency: IdempotencyStore = Depends(get_idempotency_store)
 ):
     """
     Submit survey responses.
@@ -78,12 +83,32 @@ async def submit_survey_response(
 
     Must include exactly 3 responses (one for each question).
     Ratings must be between 1 and 5.
+    Retries sent with the same `Idempotency-Key` header get the original
+    response back instead of being rejected as already completed.
     """
+    scope = f"POST /survey/{token}/response"
     try:
-        response_data = await response_service.submit_survey_response(token, submission)
-
-        return SurveySubmissionResponse(data=response_data)
+        replay = await idempotency.begin(scope, idempotency_key, submission)
+        if replay is not None:
+            return replay
+
+        try:
+            response_data = await response_service.submit_survey_response(token, submission)
+            return await idempotency.respond(
+                scope,
+                idempotency_key,
+                submission,
+                status.HTTP_201_CREATED,
+                SurveySubmissionResponse(data=response_data)
+            )
+        finally:
+            idempotency.release(scope, idempotency_key)
 
+    except IdempotencyConflict as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,18 +1,42 @@
 """
 Survey endpoints - Creation and Analytics
 """
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_survey_service, get_analytics_service
+from app.api.deps import (
+    UnitOfWorkRoute,
+    get_analytics_service,
+    get_export_service,
+    get_idempotency_store,
+    get_survey_service
+)
+from app.core.idempotency import IdempotencyConflict, IdempotencyStore
 from app.services.survey_service import SurveyService
 from app.services.analytics_service import AnalyticsService
-from app.schemas.survey import SurveyCreate, SurveyResponse
-from app.schemas.analytics import SurveyAnalyticsResponse
-from app.schemas.common import ErrorResponse
+from app.services.export_service import ExportService
+from app.schemas.survey import SurveyBulkCreate, SurveyBulkResponse, SurveyCreate, SurveyResponse, SurveySummary, TeamMemberWithLink
+from app.schemas.analytics import (
+    ManagerTrendResponse,
+    SurveyAnalyticsBatchRequest,
+    SurveyAnalyticsBatchResponse,
+    SurveyAnalyticsResponse,
+    SurveyTimingResponse,
+    TimingGranularity
+)
+from app.schemas.common import ErrorResponse, PageResponse
+from app.schemas.export import ExportFormat
+from app.schemas.invitation import SurveyInvitationsResponse
+from app.utils.serialization import json_response
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+# Routes whose path extends the collection name itself (``/surveys:bulk``),
+# which a router prefixed with ``/surveys`` cannot express
+collection_router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post(
@@ -24,20 +48,44 @@ router = APIRouter()
 )
 async def create_survey(
         survey_data: SurveyCreate,
-        survey_service: SurveyService = Depends(get_survey_service)
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+        survey_service: SurveyService = Depends(get_survey_service),
+        idempotency: IdempotencyStore = Depends(get_idempotency_store)
 ):
     """
     Create a new survey with team members.
 
     - **managerId**: Manager identifier
     - **teamMembers**: List of team members (name + email)
+    - **sendInvitations**: Queue invitation emails, delivered in the background
 
     Returns survey ID and unique links for each team member.
+    Retries sent with the same `Idempotency-Key` header get the original
+    response back instead of creating another survey.
     """
+    scope = "POST /surveys"
     try:
-        survey_create_data = await survey_service.create_survey(survey_data)
-        return SurveyResponse(data=survey_create_data)
+        replay = await idempotency.begin(scope, idempotency_key, survey_data)
+        if replay is not None:
+            return replay
 
+        try:
+            survey_create_data = await survey_service.create_survey(survey_data)
+            return await idempotency.respond(
+                scope,
+                idempotency_key,
+                survey_data,
+                status.HTTP_201_CREATED,
+                SurveyResponse(data=survey_create_data)
+            )
+        finally:
+            idempotency.release(scope, idempotency_key)
+
+    except IdempotencyConflict as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,6 +98,116 @@ async def create_survey(
         )
 
 
+@collection_router.post(
+    "/surveys:bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many surveys",
+    response_model=SurveyBulkResponse,
+    description="Create up to 1000 surveys in one transaction and return their links"
+)
+async def create_surveys_bulk(
+        bulk_data: SurveyBulkCreate,
+        survey_service: SurveyService = Depends(get_survey_service)
+):
+    """
+    Create many surveys at once, e.g. for an org-wide rollout.
+
+    - **surveys**: List of surveys (managerId, teamMembers, sendInvitations)
+
+    Either every survey is created or none is, so the links are returned
+    together once the single commit succeeds, in request order.
+    """
+    try:
+        created = await survey_service.create_surveys_bulk(bulk_data)
+
+        return json_response(
+            SurveyBulkResponse.model_construct(success=True, data=created),
+            status_code=status.HTTP_201_CREATED
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create surveys"
+        )
+
+
+@router.get(
+    "/",
+    response_model=PageResponse[SurveySummary],
+    summary="List manager surveys",
+    description="List a manager's surveys with cursor-based pagination"
+)
+async def list_manager_surveys(
+        manager_id: str = Query(..., alias="managerId", min_length=1, max_length=255),
+        cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+        limit: int = Query(20, ge=1, le=100),
+        survey_service: SurveyService = Depends(get_survey_service)
+):
+    """
+    List surveys of a manager, oldest first.
+
+    - **managerId**: Manager identifier
+    - **cursor**: `nextCursor` from the previous page (omit for the first page)
+    - **limit**: Page size (1-100)
+    """
+    try:
+        page = await survey_service.list_manager_surveys(manager_id, limit, cursor)
+        return PageResponse[SurveySummary](data=page)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list surveys"
+        )
+
+
+@router.post(
+    "/analytics:batch",
+    response_model=SurveyAnalyticsBatchResponse,
+    summary="Get analytics for many surveys",
+    description="Get the analytics of up to 100 surveys in one request with a fixed number of queries"
+)
+async def get_batch_analytics(
+        batch_request: SurveyAnalyticsBatchRequest,
+        analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Get analytics for many surveys at once.
+
+    - **surveyIds**: Survey UUIDs (1-100)
+    - **confidence**: Add bootstrap confidence intervals to each question average
+
+    Unknown survey IDs are listed in `notFound` instead of failing the request.
+    """
+    try:
+        batch = await analytics_service.get_batch_analytics(
+            batch_request.surveyIds, batch_request.confidence
+        )
+        return SurveyAnalyticsBatchResponse(data=batch)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get batch analytics"
+        )
+
+
 @router.get(
     "/{survey_id}/analytics",
     response_model=SurveyAnalyticsResponse,
@@ -58,12 +216,14 @@ async def create_survey(
 )
 async def get_survey_analytics(
         survey_id: UUID,
+        confidence: bool = Query(False, description="Include bootstrap confidence intervals"),
         analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
     """
     Get analytics for a survey.
 
     - **survey_id**: UUID of the survey
+    - **confidence**: Add a bootstrap confidence interval to each question average
 
     Returns:
     - Completion statistics
@@ -71,7 +231,7 @@ async def get_survey_analytics(
     - Overall average score
     """
     try:
-        analytics = await analytics_service.get_survey_analytics(survey_id)
+        analytics = await analytics_service.get_survey_analytics(survey_id, confidence)
 
         if not analytics:
             raise HTTPException(
@@ -90,6 +250,43 @@ async def get_survey_analytics(
         )
 
 
+@router.get(
+    "/{survey_id}/timing",
+    response_model=SurveyTimingResponse,
+    summary="Get survey completion timing",
+    description="Time-to-complete distribution and hourly/daily submission curve of a survey"
+)
+async def get_survey_timing(
+        survey_id: UUID,
+        granularity: TimingGranularity = Query(TimingGranularity.HOUR, description="Submission curve period"),
+        analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Get when team members complete a survey, to decide when to send reminders.
+
+    - **survey_id**: UUID of the survey
+    - **granularity**: `hour` (default) or `day` periods for the submission curve
+    """
+    try:
+        timing = await analytics_service.get_survey_timing(survey_id, granularity)
+
+        if not timing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Survey not found"
+            )
+
+        return SurveyTimingResponse(data=timing)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get survey timing"
+        )
+
+
 @router.get(
     "/{survey_id}/status",
     summary="Get survey status",
@@ -97,17 +294,20 @@ async def get_survey_analytics(
 )
 async def get_survey_status(
         survey_id: UUID,
+        pending_only: bool = Query(False, alias="pendingOnly"),
         survey_service: SurveyService = Depends(get_survey_service)
 ):
     """
     Get survey status and team member completion info.
 
     - **survey_id**: UUID of the survey
+    - **pendingOnly**: Only list team members who have not completed the survey
 
     Returns survey status and completion details for each team member.
+    The progress summary always covers the whole team.
     """
     try:
-        status_data = await survey_service.get_survey_status(survey_id)
+        status_data = await survey_service.get_survey_status(survey_id, pending_only)
 
         if not status_data:
             raise HTTPException(
@@ -125,3 +325,242 @@ async def get_survey_status(
             detail="Failed to get survey status"
         )
 
+
+
+@router.get(
+    "/{survey_id}/team-members",
+    response_model=PageResponse[TeamMemberWithLink],
+    summary="List survey team members",
+    description="List a survey's team members and their links with cursor-based pagination"
+)
+async def list_team_members(
+        survey_id: UUID,
+        cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+        limit: int = Query(50, ge=1, le=500),
+        survey_service: SurveyService = Depends(get_survey_service)
+):
+    """
+    List team members of a survey, oldest first.
+
+    - **survey_id**: UUID of the survey
+    - **cursor**: `nextCursor` from the previous page (omit for the first page)
+    - **limit**: Page size (1-500)
+    """
+    try:
+        page = await survey_service.list_team_members(survey_id, limit, cursor)
+
+        if page is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Survey not found"
+            )
+
+        return json_response(PageResponse[TeamMemberWithLink].model_construct(data=page))
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list team members"
+        )
+
+
+@router.get(
+    "/{survey_id}/invitations",
+    response_model=SurveyInvitationsResponse,
+    summary="Get invitation delivery status",
+    description="Invitation counts per delivery status and per-recipient status with cursor-based pagination"
+)
+async def get_survey_invitations(
+        survey_id: UUID,
+        cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+        limit: int = Query(50, ge=1, le=500),
+        survey_service: SurveyService = Depends(get_survey_service)
+):
+    """
+    Get the delivery status of a survey's invitation emails.
+
+    - **survey_id**: UUID of the survey
+    - **cursor**: `nextCursor` from the previous page (omit for the first page)
+    - **limit**: Page size (1-500)
+
+    The summary always covers every invitation of the survey.
+    """
+    try:
+        invitations = await survey_service.get_invitations(survey_id, limit, cursor)
+
+        if invitations is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Survey not found"
+            )
+
+        return SurveyInvitationsResponse(data=invitations)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get survey invitations"
+        )
+
+
+def _export_response(
+        export_service: ExportService,
+        filename: str,
+        export_format: ExportFormat,
+        compress: bool,
+        **filters
+) -> StreamingResponse:
+    """Build a streaming download for a raw response export"""
+    extension = export_format.value + (".gz" if compress else "")
+    return StreamingResponse(
+        export_service.stream_responses(export_format, compress=compress, **filters),
+        media_type="application/gzip" if compress else export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'}
+    )
+
+
+@router.get(
+    "/{survey_id}/responses/export",
+    summary="Export survey responses",
+    description="Stream the raw responses of a survey as CSV or NDJSON, optionally gzipped"
+)
+async def export_survey_responses(
+        survey_id: UUID,
+        export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+        compress: bool = Query(False, alias="gzip"),
+        export_service: ExportService = Depends(get_export_service)
+):
+    """
+    Export raw responses for a survey.
+
+    - **survey_id**: UUID of the survey
+    - **format**: `csv` (default) or `ndjson`
+    - **gzip**: Compress the stream on the fly
+
+    Rows are streamed in batches, so memory use does not grow with the survey size.
+    """
+    try:
+        if not await export_service.survey_exists(survey_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Survey not found"
+            )
+
+        return _export_response(
+            export_service,
+            f"survey-{survey_id}-responses",
+            export_format,
+            compress,
+            survey_id=survey_id
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export survey responses"
+        )
+
+
+@router.get(
+    "/managers/{manager_id}/responses/export",
+    summary="Export manager responses",
+    description="Stream the raw responses of all surveys of a manager as CSV or NDJSON, optionally gzipped"
+)
+async def export_manager_responses(
+        manager_id: str,
+        export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+        compress: bool = Query(False, alias="gzip"),
+        export_service: ExportService = Depends(get_export_service)
+):
+    """
+    Export raw responses across all surveys of a manager.
+
+    - **manager_id**: Manager identifier
+    - **format**: `csv` (default) or `ndjson`
+    - **gzip**: Compress the stream on the fly
+    """
+    try:
+        if not await export_service.manager_exists(manager_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No surveys found for manager"
+            )
+
+        return _export_response(
+            export_service,
+            f"manager-{manager_id}-responses",
+            export_format,
+            compress,
+            manager_id=manager_id
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export manager responses"
+        )
+
+
+@router.get(
+    "/managers/{manager_id}/trend",
+    response_model=ManagerTrendResponse,
+    summary="Get manager trend",
+    description="Per-question averages across a manager's surveys with deltas and a moving average"
+)
+async def get_manager_trend(
+        manager_id: str,
+        window: int = Query(3, ge=1, le=20, description="Surveys in the moving average"),
+        confidence: bool = Query(False, description="Include bootstrap confidence intervals"),
+        analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Get how a manager's question averages evolve across repeated surveys.
+
+    - **manager_id**: Manager identifier
+    - **window**: Number of surveys in the trailing moving average
+    - **confidence**: Add a bootstrap confidence interval to each point
+
+    Points are ordered by survey creation time; `delta` is the change since
+    the previous survey with responses.
+    """
+    try:
+        trend = await analytics_service.get_manager_trend(manager_id, window, confidence)
+
+        if not trend:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No surveys found for manager"
+            )
+
+        return ManagerTrendResponse(data=trend)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get manager trend"
+        )
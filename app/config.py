@@ -1,5 +1,6 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -35,11 +36,74 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Analytics
+    # Per-question results based on fewer responses are suppressed to protect anonymity
+    ANONYMITY_MIN_RESPONSES: int = 3
+    BENCHMARK_REFRESH_SECONDS: int = 3600
+    CONFIDENCE_RESAMPLES: int = 2000
+    CONFIDENCE_LEVEL: float = 0.95
+    CONFIDENCE_CACHE_SIZE: int = 10000
+    # Batches with at least this many uncached histograms go to the process pool
+    CONFIDENCE_POOL_THRESHOLD: int = 16
+    CONFIDENCE_MAX_WORKERS: Optional[int] = None
 
+    # Email delivery ("file" appends JSON lines to EMAIL_FILE_PATH, "smtp" sends)
+    EMAIL_BACKEND: str = "file"
+    EMAIL_FILE_PATH: str = "outbox.jsonl"
+    EMAIL_FROM: str = "no-reply@leadership-survey.local"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+
+    # Reminders
+    REMINDER_INTERVAL_HOURS: int = 72
+    REMINDER_PAGE_SIZE: int = 500
+    REMINDER_BATCH_SIZE: int = 50
+    REMINDER_CONCURRENCY: int = 4
+
+    # Invitations
+    INVITATION_BATCH_SIZE: int = 50
+    INVITATION_CONCURRENCY: int = 4
+    INVITATION_MAX_ATTEMPTS: int = 5
+    INVITATION_RETRY_SECONDS: int = 30
+    INVITATION_POLL_SECONDS: float = 5.0
+    # Claims older than this are considered abandoned by a stopped worker
+    INVITATION_CLAIM_TIMEOUT_SECONDS: int = 300
+
+    # Idempotency-Key replay window and size of the in-memory front cache
+    IDEMPOTENCY_TTL_HOURS: int = 24
+    IDEMPOTENCY_CACHE_SIZE: int = 10000
+
+    # Pre-rendered GET /survey/{token} pages, refreshed at least this often
+    SURVEY_PAGE_CACHE_TTL_SECONDS: float = 60.0
+    SURVEY_PAGE_CACHE_SIZE: int = 10000
+    # In-memory question catalog, reloaded from the database at least this often
+    QUESTION_CATALOG_TTL_SECONDS: float = 300.0
+
+    # Response compression (brotli needs the optional "brotli" package)
+    COMPRESSION_MINIMUM_SIZE: int = 500
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Cache-Control max-age of question data and of analytics reads
+    QUESTIONS_CACHE_SECONDS: int = 86400
+    ANALYTICS_CACHE_SECONDS: int = 60
+
+    # Token-bucket rate limits of the public survey token endpoints
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_IP_PER_MINUTE: int = 120
+    RATE_LIMIT_IP_BURST: int = 30
+    RATE_LIMIT_TOKEN_PER_MINUTE: int = 30
+    RATE_LIMIT_TOKEN_BURST: int = 10
+    # Buckets kept per limiter; the least recently used are evicted
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    # Only behind a proxy that sets X-Forwarded-For
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+
+@lru_cache
 def get_settings() -> Settings:
+    """Settings parsed once from the environment and .env, then shared"""
     return Settings()
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,149 @@
+"""
+In-process background queue freezing the final analytics of completed surveys
+"""
+import asyncio
+import logging
+from typing import Callable, Optional, Set
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.benchmark import BenchmarkIndex, benchmark_index
+from app.core.survey_page_cache import SurveyPageCache, survey_page_cache
+from app.database.session import create_database_session
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsWorker:
+    """
+    Asyncio task that finalizes surveys once their last team member answers.
+
+    Finalizing a survey marks it completed and freezes its aggregates into a
+    ``survey_analytics_snapshots`` row, which from then on serves every read
+    of its analytics. The worker runs for the lifetime of the app: on start it
+    queues every completed survey that has no snapshot yet (missed while the
+    app was down), then waits for survey IDs queued by response submissions.
+    Each job runs in a thread with its own session so the event loop never
+    blocks on the database.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], Session] = create_database_session,
+            benchmark: BenchmarkIndex = benchmark_index,
+            page_cache: SurveyPageCache = survey_page_cache
+    ):
+        self.session_factory = session_factory
+        self.benchmark = benchmark
+        self.page_cache = page_cache
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[UUID] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """Start consuming the queue and schedule the surveys missed while stopped"""
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="analytics-worker")
+
+    async def stop(self):
+        """Cancel the worker; unfinished surveys are picked up again on the next start"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._queue = None
+        self._queued.clear()
+
+    def enqueue(self, survey_id: UUID):
+        """Schedule a survey for finalization (no-op while stopped or already queued)"""
+        if self._queue is None or survey_id in self._queued:
+            return
+        self._queued.add(survey_id)
+        self._queue.put_nowait(survey_id)
+
+    async def join(self):
+        """Wait until every queued survey has been processed"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _run(self):
+        try:
+            for survey_id in await asyncio.to_thread(self._find_backlog):
+                self.enqueue(survey_id)
+        except Exception:
+            logger.exception("Failed to scan for completed surveys without analytics snapshot")
+
+        while True:
+            survey_id = await self._queue.get()
+            try:
+                await asyncio.to_thread(self.finalize, survey_id)
+            except Exception:
+                logger.exception("Failed to finalize analytics of survey %s", survey_id)
+            finally:
+                self._queued.discard(survey_id)
+                self._queue.task_done()
+
+    def _find_backlog(self):
+        from app.repositories.survey import SurveyRepository
+
+        db = self.session_factory()
+        try:
+            return SurveyRepository(db).get_unfinalized_completed_ids()
+        finally:
+            db.close()
+
+    def finalize(self, survey_id: UUID) -> bool:
+        """
+        Freeze the analytics of a survey if all its team members have answered.
+
+        Returns False when the survey is missing, still has pending members or
+        was already finalized.
+        """
+        from app.repositories.analytics_snapshot import AnalyticsSnapshotRepository
+        from app.repositories.response import ResponseRepository
+        from app.repositories.survey import SurveyRepository
+        from app.repositories.team_member import TeamMemberRepository
+
+        db = self.session_factory()
+        try:
+            snapshot_repo = AnalyticsSnapshotRepository(db)
+            survey = SurveyRepository(db).get_by_id(survey_id)
+            if survey is None or snapshot_repo.get_by_survey_id(survey_id) is not None:
+                return False
+
+            completion_stats = TeamMemberRepository(db).get_completion_stats(survey_id)
+            if completion_stats["total"] == 0 or completion_stats["pending"] > 0:
+                return False
+
+            question_analytics = ResponseRepository(db).get_analytics_for_survey(survey_id)
+            snapshot_repo.freeze(
+                survey,
+                completion_stats["total"],
+                completion_stats["completed"],
+                question_analytics
+            )
+        finally:
+            db.close()
+
+        # Links of a completed survey open it read-only; drop the page rendered while active
+        self.page_cache.invalidate(survey_id)
+
+        # Final averages of a survey only enter the benchmark once, when it completes
+        self.benchmark.add_survey(survey_id, {
+            qa_data["question_id"]: qa_data["average_score"] for qa_data in question_analytics
+        })
+        return True
+
+
+analytics_worker = AnalyticsWorker()
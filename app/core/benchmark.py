@@ -0,0 +1,143 @@
+"""
+Organization-wide benchmark index of per-survey question averages
+"""
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.session import create_database_session
+
+
+class BenchmarkIndex:
+    """
+    Sorted arrays of completed surveys' question averages, one per question.
+
+    The index is rebuilt in a background thread with one grouped query once it
+    is older than ``refresh_seconds`` and extended in place as surveys
+    complete, so ranking a survey against the whole organization is a binary
+    search instead of a scan of the responses table.
+
+    Surveys are tracked by ID, so a survey the rebuild query already saw is
+    not added a second time, and surveys added while a rebuild is running
+    carry a sequence number so the rebuild replays the ones its query may
+    have missed instead of dropping them.
+    """
+
+    def __init__(self, refresh_seconds: int = settings.BENCHMARK_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._scores: Dict[str, array] = {}
+        self._survey_ids: Set[str] = set()
+        # survey_id -> (sequence, question averages) of surveys added during a rebuild
+        self._added: Dict[str, Tuple[int, Dict[str, float]]] = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._built_at: Optional[float] = None
+        self._refreshing = False
+
+    @property
+    def is_ready(self) -> bool:
+        return self._built_at is not None
+
+    def is_stale(self) -> bool:
+        return self._built_at is None or time.monotonic() - self._built_at > self.refresh_seconds
+
+    def rebuild(self, rows: Iterable[Tuple[object, object, float]], since: Optional[int] = None):
+        """
+        Replace the index from (survey_id, question_id, average_score) rows
+
+        ``since`` is the sequence number read before the rows were queried;
+        surveys added after it and missing from ``rows`` are kept.
+        """
+        surveys = defaultdict(dict)
+        for survey_id, question_id, average_score in rows:
+            surveys[str(survey_id)][str(question_id)] = float(average_score)
+
+        with self._lock:
+            if since is not None:
+                for survey_id, (sequence, question_averages) in self._added.items():
+                    if sequence > since and survey_id not in surveys:
+                        surveys[survey_id] = question_averages
+            self._added = {}
+
+            grouped = defaultdict(list)
+            for question_averages in surveys.values():
+                for question_id, average_score in question_averages.items():
+                    grouped[question_id].append(average_score)
+
+            self._scores = {question_id: array("d", sorted(values)) for question_id, values in grouped.items()}
+            self._survey_ids = set(surveys)
+            self._built_at = time.monotonic()
+
+    def add_survey(self, survey_id: object, question_averages: Dict[str, float]):
+        """
+        Insert the final question averages of a newly completed survey
+
+        A survey already in the index is ignored. Before the first build the
+        survey is only remembered if a build is running, since a later build
+        queries it anyway.
+        """
+        survey_id = str(survey_id)
+        question_averages = {
+            str(question_id): float(average_score) for question_id, average_score in question_averages.items()
+        }
+        with self._lock:
+            if self._refreshing:
+                self._sequence += 1
+                self._added[survey_id] = (self._sequence, question_averages)
+            if self._built_at is None or survey_id in self._survey_ids:
+                return
+            self._survey_ids.add(survey_id)
+            for question_id, average_score in question_averages.items():
+                insort(self._scores.setdefault(question_id, array("d")), average_score)
+
+    def percentile(self, question_id: str, average_score: float) -> Optional[float]:
+        """
+        Percentile rank of an average among all completed surveys (mid-rank for ties).
+
+        Returns None until the index is built or when nothing is indexed for the question.
+        """
+        scores = self._scores.get(question_id)
+        if not scores:
+            return None
+        below = bisect_left(scores, average_score)
+        equal = bisect_right(scores, average_score) - below
+        return round((below + equal / 2) / len(scores) * 100, 2)
+
+    def ensure_fresh(self, session_factory: Callable[[], Session] = create_database_session):
+        """Start a background rebuild if the index is missing or stale"""
+        if not self.is_stale():
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        threading.Thread(
+            target=self._refresh,
+            args=(session_factory,),
+            name="benchmark-index-refresh",
+            daemon=True
+        ).start()
+
+    def _refresh(self, session_factory: Callable[[], Session]):
+        from app.repositories.response import ResponseRepository
+
+        with self._lock:
+            since = self._sequence
+        db = session_factory()
+        try:
+            self.rebuild(ResponseRepository(db).get_completed_survey_question_averages(), since)
+        finally:
+            db.close()
+            with self._lock:
+                self._refreshing = False
+                self._added = {}
+
+
+benchmark_index = BenchmarkIndex()
@@ -0,0 +1,137 @@
+"""
+Bootstrap confidence intervals for question averages, cached per histogram
+"""
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.utils.statistics import bootstrap_mean_interval
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+Interval = Tuple[float, float]
+Histogram = Tuple[int, ...]
+
+
+def _bootstrap_chunk(histograms: List[Histogram], resamples: int, level: float) -> List[Optional[Interval]]:
+    """Worker entry point: intervals for a chunk of histograms"""
+    return [bootstrap_mean_interval(counts, resamples, level) for counts in histograms]
+
+
+class ConfidenceIntervals:
+    """
+    Bootstrap confidence intervals computed from rating histograms.
+
+    Results are cached in an LRU keyed by the histogram, so an interval is
+    reused until a new submission changes the counts of its question; the
+    stale entry is then never hit again and ages out. Small requests are
+    resampled on a worker thread, while batches with many uncached
+    histograms are split across a lazily started ``ProcessPoolExecutor`` so
+    they use every core; neither blocks the event loop.
+    """
+
+    def __init__(
+            self,
+            resamples: int = settings.CONFIDENCE_RESAMPLES,
+            level: float = settings.CONFIDENCE_LEVEL,
+            cache_size: int = settings.CONFIDENCE_CACHE_SIZE,
+            pool_threshold: int = settings.CONFIDENCE_POOL_THRESHOLD,
+            max_workers: Optional[int] = settings.CONFIDENCE_MAX_WORKERS
+    ):
+        self.resamples = resamples
+        self.level = level
+        self.cache_size = cache_size
+        self.pool_threshold = pool_threshold
+        self.max_workers = max_workers
+        self._cache: "OrderedDict[Histogram, Optional[Interval]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: Optional["ProcessPoolExecutor"] = None
+
+    def _cached(self, key: Histogram) -> Tuple[bool, Optional[Interval]]:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return True, self._cache[key]
+        return False, None
+
+    def _store(self, key: Histogram, interval: Optional[Interval]):
+        with self._lock:
+            self._cache[key] = interval
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _get_pool(self) -> "ProcessPoolExecutor":
+        # multiprocessing is only imported once a batch is large enough to need it
+        from concurrent.futures import ProcessPoolExecutor
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def interval(self, counts: Sequence[int]) -> Optional[Interval]:
+        """Interval of one histogram, resampled inline on a cache miss"""
+        key = tuple(counts)
+        hit, interval = self._cached(key)
+        if not hit:
+            interval = bootstrap_mean_interval(key, self.resamples, self.level)
+            self._store(key, interval)
+        return interval
+
+    async def intervals(self, histograms: Sequence[Sequence[int]]) -> List[Optional[Interval]]:
+        """
+        Intervals of many histograms, in order.
+
+        Cache misses are deduplicated; below ``pool_threshold`` they are
+        resampled on a worker thread, otherwise in chunks on the process pool.
+        """
+        keys = [tuple(counts) for counts in histograms]
+        results = {}
+        missing = []
+        for key in keys:
+            if key in results:
+                continue
+            hit, interval = self._cached(key)
+            if hit:
+                results[key] = interval
+            else:
+                results[key] = None
+                missing.append(key)
+
+        if missing and len(missing) < self.pool_threshold:
+            computed = await asyncio.to_thread(_bootstrap_chunk, missing, self.resamples, self.level)
+            for key, interval in zip(missing, computed):
+                results[key] = interval
+                self._store(key, interval)
+        elif missing:
+            pool = self._get_pool()
+            workers = self.max_workers or os.cpu_count() or 1
+            chunk_size = -(-len(missing) // workers)
+            chunks = [missing[start:start + chunk_size] for start in range(0, len(missing), chunk_size)]
+
+            loop = asyncio.get_running_loop()
+            computed = await asyncio.gather(*(
+                loop.run_in_executor(pool, _bootstrap_chunk, chunk, self.resamples, self.level)
+                for chunk in chunks
+            ))
+            for chunk, intervals in zip(chunks, computed):
+                for key, interval in zip(chunk, intervals):
+                    results[key] = interval
+                    self._store(key, interval)
+
+        return [results[key] for key in keys]
+
+    def shutdown(self):
+        """Stop the worker processes, if any were started"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+confidence_intervals = ConfidenceIntervals()
@@ -0,0 +1,205 @@
+"""
+Idempotency-Key support: replay the stored response of a retried request
+"""
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Set
+
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.session import create_database_session
+from app.utils.serialization import dump_json
+
+REPLAY_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyConflict(Exception):
+    """An Idempotency-Key cannot be used for this request right now"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Response recorded for an idempotency key"""
+    request_hash: str
+    status_code: int
+    body: bytes
+    created_at: datetime
+
+    def to_response(self) -> Response:
+        return Response(
+            content=self.body,
+            status_code=self.status_code,
+            media_type="application/json",
+            headers={REPLAY_HEADER: "true"}
+        )
+
+
+class IdempotencyStore:
+    """
+    Responses of requests sent with an ``Idempotency-Key`` header.
+
+    A key is scoped to its endpoint (e.g. ``POST /surveys`` or one survey
+    token's submission) and remembered for ``ttl``. The first successful
+    response is stored in the ``idempotency_keys`` table and in an LRU front
+    cache, so a retry is answered from memory without touching the database,
+    or with a single lookup on the unique key after a restart. A retry sent
+    while the original is still running gets a 409, and a key reused with a
+    different payload gets a 422. Failed requests are not stored, so they can
+    be retried with the same key.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], Session] = create_database_session,
+            ttl: timedelta = timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS),
+            cache_size: int = settings.IDEMPOTENCY_CACHE_SIZE
+    ):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._in_flight: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(*parts: str) -> str:
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _cached(self, key: str, now: datetime) -> Optional[StoredResponse]:
+        with self._lock:
+            stored = self._cache.get(key)
+            if stored is None:
+                return None
+            if stored.created_at <= now - self.ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return stored
+
+    def _store(self, key: str, stored: StoredResponse):
+        with self._lock:
+            self._cache[key] = stored
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _load(self, key: str, now: datetime) -> Optional[StoredResponse]:
+        from app.repositories.idempotency import IdempotencyRepository
+
+        db = self.session_factory()
+        try:
+            record = IdempotencyRepository(db).get_by_key(key, now - self.ttl)
+            if record is None:
+                return None
+            return StoredResponse(
+                request_hash=record.request_hash,
+                status_code=record.status_code,
+                body=record.response_body,
+                created_at=record.created_at.replace(tzinfo=record.created_at.tzinfo or timezone.utc)
+            )
+        finally:
+            db.close()
+
+    def _save(self, key: str, stored: StoredResponse):
+        from app.repositories.idempotency import IdempotencyRepository
+
+        db = self.session_factory()
+        try:
+            IdempotencyRepository(db).save(
+                key,
+                stored.request_hash,
+                stored.status_code,
+                stored.body,
+                stored.created_at,
+                stored.created_at - self.ttl
+            )
+        finally:
+            db.close()
+
+    async def begin(self, scope: str, idempotency_key: Optional[str], payload: BaseModel) -> Optional[Response]:
+        """
+        Start a request, or return the stored response if the key was already used
+
+        Returns None when the request must run; it must then be finished with
+        ``respond`` and ``release``. Raises IdempotencyConflict if the key is in
+        use by a running request or was used with a different payload.
+        """
+        if idempotency_key is None:
+            return None
+
+        key = self._digest(scope, idempotency_key)
+        request_hash = self._digest(payload.model_dump_json())
+        now = datetime.now(timezone.utc)
+
+        stored = self._cached(key, now)
+        if stored is None:
+            stored = await asyncio.to_thread(self._load, key, now)
+            if stored is not None:
+                self._store(key, stored)
+
+        if stored is not None:
+            if stored.request_hash != request_hash:
+                raise IdempotencyConflict(422, "Idempotency-Key was already used with a different request")
+            return stored.to_response()
+
+        with self._lock:
+            # The original may have finished while the database was checked
+            stored = self._cache.get(key)
+            if stored is not None and stored.request_hash == request_hash:
+                return stored.to_response()
+            if key in self._in_flight:
+                raise IdempotencyConflict(409, "A request with this Idempotency-Key is still being processed")
+            self._in_flight.add(key)
+        return None
+
+    async def respond(
+            self,
+            scope: str,
+            idempotency_key: Optional[str],
+            payload: BaseModel,
+            status_code: int,
+            content: BaseModel
+    ) -> Response:
+        """Serialize a successful response, storing it first when a key was given"""
+        body = dump_json(content)
+        if idempotency_key is not None:
+            key = self._digest(scope, idempotency_key)
+            stored = StoredResponse(
+                request_hash=self._digest(payload.model_dump_json()),
+                status_code=status_code,
+                body=body,
+                created_at=datetime.now(timezone.utc)
+            )
+            await asyncio.to_thread(self._save, key, stored)
+            self._store(key, stored)
+        return Response(content=body, status_code=status_code, media_type="application/json")
+
+    def release(self, scope: str, idempotency_key: Optional[str]):
+        """Finish a request started with ``begin``, whether it succeeded or not"""
+        if idempotency_key is not None:
+            with self._lock:
+                self._in_flight.discard(self._digest(scope, idempotency_key))
+
+    def purge_expired(self) -> int:
+        """Delete records older than the replay window"""
+        from app.repositories.idempotency import IdempotencyRepository
+
+        db = self.session_factory()
+        try:
+            return IdempotencyRepository(db).purge_created_before(datetime.now(timezone.utc) - self.ttl)
+        finally:
+            db.close()
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,187 @@
+"""
+In-process background worker draining the invitation outbox
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.mail import EmailSender, OutgoingEmail, create_email_sender
+from app.database.session import create_database_session
+from app.utils.link_generator import build_survey_link
+
+logger = logging.getLogger(__name__)
+
+
+def invitation_email(row: Row) -> OutgoingEmail:
+    """Render the invitation of a claimed outbox row"""
+    return OutgoingEmail(
+        reference=str(row.id),
+        to=row.email,
+        subject=f"You're invited: {row.survey_title}",
+        body=(
+            f"Hi {row.name},\n\n"
+            f"Your manager asked for your anonymous feedback in \"{row.survey_title}\".\n"
+            f"Please answer three short questions: {build_survey_link(row.unique_link)}\n"
+        )
+    )
+
+
+class InvitationWorker:
+    """
+    Asyncio task delivering queued survey invitations by email.
+
+    Survey creation writes one ``invitation_outbox`` row per team member and
+    calls ``notify``; the worker also polls every ``poll_seconds`` so retries
+    and invitations queued by another process are picked up. Due rows are
+    claimed in batches of ``batch_size``, at most ``concurrency`` batches are
+    delivered at once, and each recipient's outcome is recorded separately: a
+    failed email is retried with exponential backoff (``retry_seconds``
+    doubled per attempt) until ``max_attempts`` is reached. Database and SMTP
+    work runs in threads, each with its own session, so the event loop never
+    blocks. Each claim is tagged with its own token, so workers of several
+    processes can share the outbox without delivering a row twice; a claim
+    still SENDING after ``claim_timeout_seconds`` is taken for one abandoned
+    by a stopped worker and queued again.
+    """
+
+    def __init__(
+            self,
+            sender_factory: Callable[[], EmailSender] = create_email_sender,
+            session_factory: Callable[[], Session] = create_database_session,
+            batch_size: int = settings.INVITATION_BATCH_SIZE,
+            concurrency: int = settings.INVITATION_CONCURRENCY,
+            max_attempts: int = settings.INVITATION_MAX_ATTEMPTS,
+            retry_seconds: float = settings.INVITATION_RETRY_SECONDS,
+            poll_seconds: float = settings.INVITATION_POLL_SECONDS,
+            claim_timeout_seconds: float = settings.INVITATION_CLAIM_TIMEOUT_SECONDS
+    ):
+        self.sender_factory = sender_factory
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.poll_seconds = poll_seconds
+        self.claim_timeout_seconds = claim_timeout_seconds
+        self._sender: Optional[EmailSender] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """Start draining the outbox"""
+        if self.is_running:
+            return
+        self._sender = self.sender_factory()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="invitation-worker")
+
+    async def stop(self):
+        """Cancel the worker; undelivered invitations stay in the outbox"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._wakeup = None
+        self._sender.close()
+        self._sender = None
+
+    def notify(self):
+        """Wake the worker up after invitations were queued (no-op while stopped)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self._release_expired_claims)
+            except Exception:
+                logger.exception("Failed to release abandoned invitation claims")
+
+            try:
+                delivered = await self.drain_once()
+            except Exception:
+                logger.exception("Failed to drain the invitation outbox")
+                delivered = 0
+
+            if delivered == 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def drain_once(self) -> int:
+        """Claim and deliver one round of due invitations; returns how many were claimed"""
+        rows = await asyncio.to_thread(self._claim, self.batch_size * self.concurrency)
+        await asyncio.gather(*(
+            self._deliver(rows[start:start + self.batch_size])
+            for start in range(0, len(rows), self.batch_size)
+        ))
+        return len(rows)
+
+    async def _deliver(self, batch: List[Row]):
+        try:
+            failures = await asyncio.to_thread(
+                self._sender.send_batch, [invitation_email(row) for row in batch]
+            )
+        except Exception as e:
+            failures = {str(row.id): str(e) or e.__class__.__name__ for row in batch}
+        await asyncio.to_thread(self._record, batch, failures)
+
+    def _claim(self, limit: int) -> List[Row]:
+        from app.repositories.invitation import InvitationRepository
+
+        db = self.session_factory()
+        try:
+            return InvitationRepository(db).claim_due(limit, datetime.now(timezone.utc))
+        finally:
+            db.close()
+
+    def _record(self, batch: List[Row], failures: dict):
+        from app.repositories.invitation import InvitationRepository
+
+        now = datetime.now(timezone.utc)
+        db = self.session_factory()
+        try:
+            invitation_repo = InvitationRepository(db)
+            sent = [row.id for row in batch if str(row.id) not in failures]
+            if sent:
+                # Every row of a batch comes from the same claim_due call and shares its token
+                invitation_repo.mark_sent(sent, batch[0].claim_token, now)
+
+            for row in batch:
+                error = failures.get(str(row.id))
+                if error is None:
+                    continue
+                next_attempt_at = None
+                if row.attempts < self.max_attempts:
+                    next_attempt_at = now + timedelta(seconds=self.retry_seconds * 2 ** (row.attempts - 1))
+                invitation_repo.mark_failed(row.id, row.claim_token, error, next_attempt_at)
+        finally:
+            db.close()
+
+    def _release_expired_claims(self):
+        from app.repositories.invitation import InvitationRepository
+
+        claimed_before = datetime.now(timezone.utc) - timedelta(seconds=self.claim_timeout_seconds)
+        db = self.session_factory()
+        try:
+            InvitationRepository(db).release_expired_claims(claimed_before)
+        finally:
+            db.close()
+
+
+invitation_worker = InvitationWorker()
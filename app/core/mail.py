@@ -0,0 +1,99 @@
+"""
+Outgoing email delivery backends shared by reminders and invitations
+"""
+import json
+import smtplib
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Dict, Sequence
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    """One plain-text email; ``reference`` identifies the recipient record it was built for"""
+    reference: str
+    to: str
+    subject: str
+    body: str
+
+
+class EmailSender(ABC):
+    """Delivery backend for emails; senders must be safe to call from worker threads"""
+
+    @abstractmethod
+    def send_batch(self, emails: Sequence[OutgoingEmail]) -> Dict[str, str]:
+        """
+        Deliver a batch of emails.
+
+        Returns the error message of each email that could not be delivered,
+        keyed by reference; raises if the whole batch failed.
+        """
+
+    def close(self):
+        """Release resources held by the sender"""
+
+
+class FileEmailSender(EmailSender):
+    """Append emails as JSON lines to a file (local development sink)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def send_batch(self, emails: Sequence[OutgoingEmail]) -> Dict[str, str]:
+        lines = "".join(json.dumps(asdict(email)) + "\n" for email in emails)
+        with self._lock, self.path.open("a", encoding="utf-8") as sink:
+            sink.write(lines)
+        return {}
+
+
+class SMTPEmailSender(EmailSender):
+    """
+    Send emails through an SMTP server, one connection per batch.
+
+    Defaults target a local stand-in such as ``python -m aiosmtpd -n -l localhost:1025``.
+    """
+
+    def __init__(
+            self,
+            host: str = settings.SMTP_HOST,
+            port: int = settings.SMTP_PORT,
+            from_email: str = settings.EMAIL_FROM,
+            timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.from_email = from_email
+        self.timeout = timeout
+
+    def send_batch(self, emails: Sequence[OutgoingEmail]) -> Dict[str, str]:
+        failures = {}
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            for email in emails:
+                message = EmailMessage()
+                message["From"] = self.from_email
+                message["To"] = email.to
+                message["Subject"] = email.subject
+                message.set_content(email.body)
+                try:
+                    smtp.send_message(message)
+                except smtplib.SMTPRecipientsRefused as e:
+                    failures[email.reference] = str(e)
+        return failures
+
+
+def create_email_sender(
+        backend: str = settings.EMAIL_BACKEND,
+        file_path: str = settings.EMAIL_FILE_PATH
+) -> EmailSender:
+    """Build the configured email sender ('file' or 'smtp')"""
+    if backend == "smtp":
+        return SMTPEmailSender()
+    if backend == "file":
+        return FileEmailSender(Path(file_path))
+    raise ValueError(f"Unknown email backend: {backend}")
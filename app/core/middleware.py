@@ -0,0 +1,212 @@
+"""
+ASGI middleware: response compression and per-route Cache-Control headers
+"""
+import zlib
+from typing import Mapping, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import compile_path, get_route_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency, gzip only without it
+    brotli = None
+
+# Already compressed, or must reach the client unbuffered
+EXCLUDED_MEDIA_TYPES = (
+    "application/gzip",
+    "application/zip",
+    "image/",
+    "audio/",
+    "video/",
+    "text/event-stream",
+)
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        # Sync-flush so every streamed chunk reaches the client right away
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+def _accepted_encodings(accept_encoding: str) -> Mapping[str, float]:
+    """Parse an Accept-Encoding header into {coding: q}"""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip, whichever the client prefers.
+
+    Brotli is used when the optional ``brotli`` package is installed. Bodies
+    sent in one piece are compressed only from ``minimum_size`` bytes on;
+    streamed bodies (exports, NDJSON) are compressed chunk by chunk and
+    flushed after each chunk so they keep streaming. Responses that already
+    carry a Content-Encoding, or whose media type is already compressed, are
+    passed through untouched.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = 500,
+            gzip_level: int = 6,
+            brotli_quality: int = 4,
+            excluded_media_types: Sequence[str] = EXCLUDED_MEDIA_TYPES
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_media_types = tuple(excluded_media_types)
+
+    def select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """The coding to use for a request, or None to send the body as is"""
+        accepted = _accepted_encodings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        candidates = ("br", "gzip") if brotli is not None else ("gzip",)
+        best, best_quality = None, 0.0
+        for coding in candidates:
+            quality = accepted.get(coding, wildcard)
+            if quality > best_quality:
+                best, best_quality = coding, quality
+        return best
+
+    def _encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        encoder = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows the body size
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                media_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or start_message["status"] in (204, 304)
+                    or media_type.startswith(self.excluded_media_types)
+                    or (not more_body and len(body) < self.minimum_size)
+                )
+                if not passthrough:
+                    encoder = self._encoder(encoding)
+                    headers["Content-Encoding"] = encoding
+                    headers.add_vary_header("Accept-Encoding")
+                    if more_body:
+                        del headers["Content-Length"]
+                    else:
+                        body = encoder.finish(body)
+                        headers["Content-Length"] = str(len(body))
+                        message = {"type": "http.response.body", "body": body}
+                await send(start_message)
+                start_message = None
+                if passthrough or not more_body:
+                    await send(message)
+                    return
+                await send({"type": "http.response.body", "body": encoder.compress(body), "more_body": True})
+                return
+
+            if passthrough:
+                await send(message)
+            elif more_body:
+                await send({"type": "http.response.body", "body": encoder.compress(body), "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": encoder.finish(body)})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class CacheControlMiddleware:
+    """
+    Set Cache-Control on GET/HEAD responses according to the requested route.
+
+    ``policies`` maps route path templates (as declared, e.g.
+    ``/api/v1/surveys/{survey_id}/analytics``) to a Cache-Control value;
+    every other route, and every error response, gets ``default``. Headers
+    set by an endpoint itself are left alone.
+    """
+
+    def __init__(self, app: ASGIApp, policies: Mapping[str, str], default: str = "no-store"):
+        self.app = app
+        self.policies = [(compile_path(template)[0], policy) for template, policy in policies.items()]
+        self.default = default
+
+    def policy_for(self, path: str) -> str:
+        for path_regex, policy in self.policies:
+            if path_regex.match(path):
+                return policy
+        return self.default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_policy(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if "cache-control" not in headers:
+                    policy = self.default
+                    if message["status"] < 400:
+                        policy = self.policy_for(get_route_path(scope))
+                    headers["Cache-Control"] = policy
+            await send(message)
+
+        await self.app(scope, receive, send_with_policy)
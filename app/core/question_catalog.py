@@ -0,0 +1,100 @@
+"""
+In-memory catalog of the predefined survey questions
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.config import settings
+from app.repositories.question import QuestionRepository
+from app.schemas.survey import SurveyQuestion
+
+
+@dataclass(frozen=True)
+class CatalogQuestion:
+    """Immutable copy of a survey question, safe to share across requests"""
+    id: UUID
+    question_text: str
+    question_order: int
+    scale_min: int
+    scale_max: int
+    scale_min_label: str
+    scale_max_label: str
+
+
+def to_survey_questions(questions: Sequence[CatalogQuestion]) -> List[SurveyQuestion]:
+    """Response models of catalog questions, built without re-validating them"""
+    return [
+        SurveyQuestion.model_construct(
+            id=str(question.id),
+            questionText=question.question_text,
+            questionOrder=question.question_order,
+            scaleMin=question.scale_min,
+            scaleMax=question.scale_max,
+            scaleMinLabel=question.scale_min_label,
+            scaleMaxLabel=question.scale_max_label
+        )
+        for question in questions
+    ]
+
+
+class QuestionCatalog:
+    """
+    Ordered survey questions, loaded once and served from memory.
+
+    The questions are predefined and seeded before the app starts, yet every
+    survey fetch and submission used to query them. The catalog loads them on
+    first use (or during startup warmup) and reloads them once they are older
+    than ``ttl_seconds``, so edited questions are picked up without a
+    restart. A reload that finds the same questions keeps the previous
+    snapshot, so pages rendered from it stay valid; an empty result is not
+    cached so a database seeded after startup is picked up.
+    """
+
+    def __init__(self, ttl_seconds: float = settings.QUESTION_CATALOG_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._questions: Optional[Tuple[CatalogQuestion, ...]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._questions is not None
+
+    def get_ordered(self, question_repo: QuestionRepository) -> Tuple[CatalogQuestion, ...]:
+        """Questions ordered by question_order, loaded through ``question_repo`` on a miss or expiry"""
+        with self._lock:
+            questions, loaded_at = self._questions, self._loaded_at
+        if questions is not None:
+            if time.monotonic() - loaded_at < self.ttl_seconds:
+                return questions
+            self.invalidate()
+
+        loaded = tuple(
+            CatalogQuestion(
+                id=question.id,
+                question_text=question.question_text,
+                question_order=question.question_order,
+                scale_min=question.scale_min,
+                scale_max=question.scale_max,
+                scale_min_label=question.scale_min_label,
+                scale_max_label=question.scale_max_label
+            )
+            for question in question_repo.get_all_ordered()
+        )
+        if loaded == questions:
+            loaded = questions
+        if loaded:
+            with self._lock:
+                self._questions = loaded
+                self._loaded_at = time.monotonic()
+        return loaded
+
+    def invalidate(self):
+        """Drop the cached questions so the next use reloads them"""
+        with self._lock:
+            self._questions = None
+
+question_catalog = QuestionCatalog()
@@ -0,0 +1,145 @@
+"""
+In-process token-bucket rate limiting of the public survey token endpoints
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Mapping, Optional, Sequence
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.routing import compile_path, get_route_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class TokenBucketLimiter:
+    """
+    One token bucket per key, holding at most ``burst`` tokens and refilled
+    at ``rate`` tokens per second.
+
+    Buckets live in an LRU of ``max_keys`` entries. An evicted bucket is the
+    least recently used one, which has usually refilled completely, so
+    evicting it is the same as keeping it; memory stays bounded however many
+    distinct keys (IPs, tokens) are seen.
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # key -> [tokens, monotonic time of the last refill]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _refill(self, key: str, now: float) -> List[float]:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now]
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        return bucket
+
+    def retry_after(self, key: str, now: Optional[float] = None) -> float:
+        """0 when a token is available, else the seconds until one is; takes nothing"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._refill(key, now)
+            return 0.0 if bucket[0] >= 1 else (1 - bucket[0]) / self.rate
+
+    def acquire(self, key: str, now: Optional[float] = None) -> float:
+        """Take one token; returns 0 when allowed, else the seconds until a token is available"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._refill(key, now)
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / self.rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RateLimitMiddleware:
+    """
+    Reject requests over the per-IP or per-token limit with a 429.
+
+    Only requests whose path matches one of ``route_templates`` (e.g.
+    ``/api/v1/survey/{token}``) are limited; the ``token`` path parameter
+    keys the per-token bucket. Running as middleware, a rejected request
+    never reaches the router, so no dependency or database session is
+    created for it.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            route_templates: Sequence[str],
+            ip_limiter: TokenBucketLimiter,
+            token_limiter: TokenBucketLimiter,
+            trust_forwarded_for: bool = False
+    ):
+        self.app = app
+        self.routes = [compile_path(template)[0] for template in route_templates]
+        self.ip_limiter = ip_limiter
+        self.token_limiter = token_limiter
+        self.trust_forwarded_for = trust_forwarded_for
+
+    def _client_ip(self, scope: Scope) -> str:
+        if self.trust_forwarded_for:
+            forwarded_for = Headers(scope=scope).get("x-forwarded-for")
+            if forwarded_for:
+                # The entry appended by the proxy itself; earlier ones are client-supplied
+                return forwarded_for.rsplit(",", 1)[-1].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _match(self, path: str) -> Optional[Mapping[str, str]]:
+        for path_regex in self.routes:
+            match = path_regex.match(path)
+            if match:
+                return match.groupdict()
+        return None
+
+    def check(self, scope: Scope) -> float:
+        """0 when the request may proceed, else the seconds the client should wait"""
+        path_params = self._match(get_route_path(scope))
+        if path_params is None:
+            return 0.0
+
+        buckets = [(self.ip_limiter, self._client_ip(scope))]
+        if "token" in path_params:
+            buckets.append((self.token_limiter, path_params["token"]))
+
+        # Take a token only once every bucket allows the request, so traffic
+        # rejected by one limit does not spend the budget of the other. Nothing
+        # awaits in between, so no other request interleaves on the event loop.
+        now = time.monotonic()
+        retry_after = max(limiter.retry_after(key, now) for limiter, key in buckets)
+        if retry_after:
+            return retry_after
+        for limiter, key in buckets:
+            limiter.acquire(key, now)
+        return 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self.check(scope)
+        if retry_after:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests, please retry later"},
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,123 @@
+"""
+Pre-rendered JSON of the survey page served by GET /survey/{token}
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from app.config import settings
+from app.core.question_catalog import CatalogQuestion, to_survey_questions
+from app.schemas.survey import SurveyQuestion
+from app.utils.serialization import get_type_adapter
+
+_TRUE = b"true"
+_FALSE = b"false"
+
+
+def _json(value) -> bytes:
+    return get_type_adapter(type(value)).dump_json(value)
+
+
+@dataclass(frozen=True)
+class RenderedSurveyPage:
+    """
+    SurveyDataResponse body of one survey, split around its per-member fields
+
+    ``head`` ends right before the ``teamMemberName`` value and ``tail``
+    starts right after the ``hasCompleted`` value, so a member's page is a
+    concatenation of byte strings.
+    """
+    head: bytes
+    tail: bytes
+    questions: Tuple[CatalogQuestion, ...]
+    rendered_at: float
+
+    def render(self, team_member_name: str, has_completed: bool) -> bytes:
+        return b"".join((
+            self.head,
+            _json(team_member_name),
+            b',"hasCompleted":',
+            _TRUE if has_completed else _FALSE,
+            self.tail
+        ))
+
+
+def render_survey_page(
+        title: str,
+        description: str,
+        questions: Tuple[CatalogQuestion, ...]
+) -> RenderedSurveyPage:
+    """Serialize the member-independent parts of a survey page once"""
+    survey_questions = to_survey_questions(questions)
+    # Keys follow the field order of SurveyDataResponse / SurveyData
+    head = b"".join((
+        b'{"success":true,"data":{"surveyTitle":',
+        _json(title),
+        b',"description":',
+        _json(description),
+        b',"teamMemberName":'
+    ))
+    tail = b"".join((
+        b',"questions":',
+        get_type_adapter(List[SurveyQuestion]).dump_json(survey_questions),
+        b"}}"
+    ))
+    return RenderedSurveyPage(head=head, tail=tail, questions=questions, rendered_at=time.monotonic())
+
+
+class SurveyPageCache:
+    """
+    Rendered survey pages of active and completed surveys, keyed by survey ID.
+
+    Every member of a survey gets the same page apart from their name and
+    completion flag, so the page is serialized once and those two fields are
+    spliced in per request. A page is dropped when its survey is finalized
+    (``invalidate``), when the question catalog reloads changed questions
+    (the page keeps the catalog snapshot it was rendered from, see
+    ``QuestionCatalog.ttl_seconds``) and after ``ttl_seconds``,
+    which bounds how long a change made by another process can go unseen.
+    """
+
+    def __init__(
+            self,
+            ttl_seconds: float = settings.SURVEY_PAGE_CACHE_TTL_SECONDS,
+            cache_size: int = settings.SURVEY_PAGE_CACHE_SIZE
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[UUID, RenderedSurveyPage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, survey_id: UUID, questions: Tuple[CatalogQuestion, ...]) -> Optional[RenderedSurveyPage]:
+        """The cached page of a survey, or None if missing or stale"""
+        with self._lock:
+            page = self._cache.get(survey_id)
+            if page is None:
+                return None
+            if page.questions is not questions or time.monotonic() - page.rendered_at >= self.ttl_seconds:
+                del self._cache[survey_id]
+                return None
+            self._cache.move_to_end(survey_id)
+            return page
+
+    def put(self, survey_id: UUID, page: RenderedSurveyPage):
+        with self._lock:
+            self._cache[survey_id] = page
+            self._cache.move_to_end(survey_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, survey_id: UUID):
+        """Drop the page of a survey whose data or status changed"""
+        with self._lock:
+            self._cache.pop(survey_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+survey_page_cache = SurveyPageCache()
@@ -0,0 +1,94 @@
+"""
+Startup warmup: pay the lazy first-use costs before the app reports ready
+"""
+import logging
+import time
+from typing import Callable, Dict
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, configure_mappers
+
+from app.core.question_catalog import QuestionCatalog, question_catalog
+from app.database.connection import engine
+from app.database.session import create_database_session
+
+logger = logging.getLogger(__name__)
+
+
+def _open_pool(bind: Engine):
+    """Open as many pooled connections as the pool keeps, then return them to it"""
+    pool_size = getattr(bind.pool, "size", lambda: 1)()
+    connections = []
+    try:
+        for _ in range(max(pool_size, 1)):
+            connection = bind.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def _validate_schemas(app: FastAPI):
+    """Build the OpenAPI document and run the hot request schemas once"""
+    from app.schemas.response import SurveySubmission
+    from app.schemas.survey import SurveyCreate
+
+    app.openapi()
+    SurveyCreate.model_validate({
+        "managerId": "warmup",
+        "teamMembers": [{"name": "Warmup", "email": "warmup@example.com"}]
+    })
+    SurveySubmission.model_validate({
+        "responses": [
+            {"questionId": f"00000000-0000-0000-0000-00000000000{index}", "rating": 3}
+            for index in range(3)
+        ]
+    })
+
+
+def _warm_caches(session_factory: Callable[[], Session], catalog: QuestionCatalog):
+    """Load the question catalog and compile the token lookup statement"""
+    from app.repositories.question import QuestionRepository
+    from app.repositories.team_member import TeamMemberRepository
+
+    db = session_factory()
+    try:
+        catalog.get_ordered(QuestionRepository(db))
+        team_member_repo = TeamMemberRepository(db)
+        team_member_repo.get_by_unique_link("")
+        team_member_repo.get_page_fields_by_unique_link("")
+    finally:
+        db.close()
+
+
+def warm_up(
+        app: FastAPI,
+        bind: Engine = engine,
+        session_factory: Callable[[], Session] = create_database_session,
+        catalog: QuestionCatalog = question_catalog
+) -> Dict[str, float]:
+    """
+    Run every warmup step and return how long each took, in seconds.
+
+    1. Configure the ORM mappers
+    2. Open the pooled database connections
+    3. Build the OpenAPI document and validate sample request payloads
+    4. Load the question catalog and run a token lookup so its SQL is compiled
+       and cached
+    """
+    steps = (
+        ("mappers", configure_mappers),
+        ("pool", lambda: _open_pool(bind)),
+        ("schemas", lambda: _validate_schemas(app)),
+        ("caches", lambda: _warm_caches(session_factory, catalog)),
+    )
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - started
+    logger.info("Warmup finished: %s", ", ".join(f"{name} {elapsed * 1000:.0f}ms" for name, elapsed in timings.items()))
+    return timings
@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import Callable, Generator, Optional
 from sqlalchemy.orm import Session
 from app.database.connection import SessionLocal
 
@@ -36,4 +36,41 @@ def create_database_session() -> Session:
     :return: A new database session instance.
     :rtype: Session
     """
-    return SessionLocal()
\ No newline at end of file
+    return SessionLocal()
+
+class UnitOfWork:
+    """
+    Request-scoped database session, opened on first use.
+
+    Repositories built on a unit of work share its session but only ask for
+    it when they run a query, so a request that ends early (invalid input,
+    a cache hit, a rate limit) never creates a session, and the pooled
+    connection is only checked out by the first statement. ``release``
+    closes the session, returning the connection to the pool; a later query
+    transparently opens a new one.
+
+    :ivar session_factory: Callable creating the session on first use.
+    :type session_factory: Callable[[], Session]
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+        self._session: Optional[Session] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    @property
+    def session(self) -> Session:
+        """The session of this unit of work, created on first access"""
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    def release(self):
+        """Close the session, if one was opened, rolling back anything uncommitted"""
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
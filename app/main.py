@@ -1,17 +1,80 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.v1.api import api_router
 from app.config import settings
+from app.core.analytics_worker import analytics_worker
+from app.core.confidence import confidence_intervals
+from app.core.idempotency import idempotency_store
+from app.core.invitation_worker import invitation_worker
+from app.core.middleware import CacheControlMiddleware, CompressionMiddleware
+from app.core.rate_limit import RateLimitMiddleware, TokenBucketLimiter
+from app.core.warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up(app: FastAPI):
+    try:
+        await asyncio.to_thread(warm_up, app)
+    except Exception:
+        logger.exception("Startup warmup failed; the app stays not ready")
+        return
+    app.state.ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Liveness (/health) answers right away, readiness (/ready) once warm
+    app.state.ready = False
+    warmup = asyncio.create_task(_warm_up(app), name="warmup")
+    await asyncio.to_thread(idempotency_store.purge_expired)
+    await analytics_worker.start()
+    await invitation_worker.start()
+    yield
+    warmup.cancel()
+    await invitation_worker.stop()
+    await analytics_worker.stop()
+    # Stop the bootstrap worker processes started by large analytics requests
+    confidence_intervals.shutdown()
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="0.1.0",
     description="AI-driven leadership feedback survey tool backend",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
+# Rate limiting of the public token endpoints; added before CORS so that
+# 429 responses still carry the CORS headers
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        route_templates=[
+            "/api/v1/survey/{token}",
+            "/api/v1/survey/{token}/response",
+            "/api/v1/survey/{token}/responses",
+        ],
+        ip_limiter=TokenBucketLimiter(
+            settings.RATE_LIMIT_IP_PER_MINUTE / 60,
+            settings.RATE_LIMIT_IP_BURST,
+            settings.RATE_LIMIT_MAX_KEYS
+        ),
+        token_limiter=TokenBucketLimiter(
+            settings.RATE_LIMIT_TOKEN_PER_MINUTE / 60,
+            settings.RATE_LIMIT_TOKEN_BURST,
+            settings.RATE_LIMIT_MAX_KEYS
+        ),
+        trust_forwarded_for=settings.RATE_LIMIT_TRUST_FORWARDED_FOR
+    )
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -21,6 +84,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Cache-Control per route template; token endpoints, links and everything
+# not listed here are never stored
+_analytics_cache = f"private, max-age={settings.ANALYTICS_CACHE_SECONDS}"
+app.add_middleware(
+    CacheControlMiddleware,
+    policies={
+        "/api/v1/questions/": f"public, max-age={settings.QUESTIONS_CACHE_SECONDS}, immutable",
+        "/api/v1/surveys/{survey_id}/analytics": _analytics_cache,
+        "/api/v1/surveys/{survey_id}/timing": _analytics_cache,
+        "/api/v1/surveys/managers/{manager_id}/trend": _analytics_cache,
+        "/api/v1/analytics/ratings": _analytics_cache,
+    },
+    default="no-store"
+)
+
+# Compression
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
+)
+
 
 # Health check endpoint
 @app.get("/")
@@ -37,18 +123,17 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "API is running"}
 
-# Include API routes
-app.include_router(api_router, prefix="/api/v1")
-
 
-@app.get("/")
-async def root():
-    """Health check endpoint"""
-    return {"message": "Leadership Feedback Survey API", "status": "running"}
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until startup warmup has finished"""
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming up"}
+        )
+    return {"status": "ready"}
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy"}
-
+# Include API routes
+app.include_router(api_router, prefix="/api/v1")
@@ -3,6 +3,9 @@ from app.models.survey import Survey, SurveyStatus
 from app.models.team_member import TeamMember
 from app.models.question import SurveyQuestion
 from app.models.response import Response
+from app.models.analytics_snapshot import SurveyAnalyticsSnapshot
+from app.models.invitation import InvitationOutbox, InvitationStatus
+from app.models.idempotency import IdempotencyRecord
 
 __all__ = [
     "BaseModel",
@@ -11,4 +14,8 @@ __all__ = [
     "TeamMember",
     "SurveyQuestion",
     "Response",
+    "SurveyAnalyticsSnapshot",
+    "InvitationOutbox",
+    "InvitationStatus",
+    "IdempotencyRecord",
 ]
\ No newline at end of file
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, ForeignKey, Integer, JSON
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+from app.models.base import BaseModel
+
+
+class SurveyAnalyticsSnapshot(BaseModel):
+    """
+    Frozen final analytics of a completed survey.
+
+    Once every team member of a survey has answered, its results can no longer
+    change, so the aggregates are computed once by the analytics worker and
+    stored here. Reads of completed surveys are served from this row instead
+    of re-aggregating the responses. ``created_at`` records when the snapshot
+    was taken.
+
+    :ivar survey_id: Identifier of the completed survey.
+    :type survey_id: UUID
+    :ivar survey: Relationship with the Survey entity the snapshot belongs to.
+    :type survey: Survey
+    :ivar total_members: Number of team members of the survey.
+    :type total_members: int
+    :ivar completed_responses: Number of team members who answered.
+    :type completed_responses: int
+    :ivar question_analytics: Per-question aggregates (averages, counts, sums and
+        the 1-5 distribution) in the shape returned by
+        ``ResponseRepository.get_analytics_for_survey``.
+    :type question_analytics: list
+    """
+    __tablename__ = "survey_analytics_snapshots"
+
+    survey_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("surveys.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True
+    )
+    survey = relationship("Survey", back_populates="analytics_snapshot")
+
+    total_members = Column(Integer, nullable=False)
+    completed_responses = Column(Integer, nullable=False)
+    question_analytics = Column(JSON, nullable=False)
+
+    def __repr__(self):
+        return f"<SurveyAnalyticsSnapshot(id={self.id}, survey_id={self.survey_id})>"
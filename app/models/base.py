@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime, timezone
 from sqlalchemy import Column, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
@@ -28,8 +29,11 @@ class BaseModel(Base):
         index=True
     )
 
+    # Set client-side as well so every row carries the same sub-second precision,
+    # which keeps (created_at, id) keyset cursors exact
     created_at = Column(
         DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False
     )
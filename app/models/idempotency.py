@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, LargeBinary, String
+from app.models.base import BaseModel
+
+
+class IdempotencyRecord(BaseModel):
+    """
+    Stored outcome of a request made with an ``Idempotency-Key`` header.
+
+    A retried request with the same key is answered from this row instead of
+    running the operation again. Only a digest of the endpoint scope and the
+    client key is stored, along with a digest of the request payload so a key
+    reused for a different request can be rejected. Records older than the
+    replay window are ignored and purged on startup.
+
+    :ivar key: SHA-256 hex digest of the endpoint scope and the client key.
+    :type key: str
+    :ivar request_hash: SHA-256 hex digest of the request payload.
+    :type request_hash: str
+    :ivar status_code: HTTP status code of the stored response.
+    :type status_code: int
+    :ivar response_body: Serialized JSON body of the stored response.
+    :type response_body: bytes
+    """
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(64), unique=True, nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=False)
+    response_body = Column(LargeBinary, nullable=False)
+
+    def __repr__(self):
+        return f"<IdempotencyRecord(id={self.id}, status_code={self.status_code})>"
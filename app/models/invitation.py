@@ -0,0 +1,89 @@
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+from app.models.base import BaseModel
+
+
+class InvitationStatus(str, Enum):
+    """
+    Delivery status of a survey invitation.
+
+    :cvar PENDING: Waiting for its first or next delivery attempt.
+    :cvar SENDING: Claimed by an invitation worker and being delivered.
+    :cvar SENT: Accepted by the email backend.
+    :cvar FAILED: Gave up after the maximum number of attempts.
+    """
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class InvitationOutbox(BaseModel):
+    """
+    Outbox entry for delivering the survey link of one team member by email.
+
+    Rows are written in the same request that creates the survey and drained
+    by the invitation worker, so delivery survives restarts and never holds up
+    survey creation. Failed attempts are retried with exponential backoff
+    until the maximum number of attempts is reached.
+
+    :ivar survey_id: Identifier of the survey the invitation belongs to.
+    :type survey_id: UUID
+    :ivar team_member_id: Identifier of the invited team member.
+    :type team_member_id: UUID
+    :ivar team_member: Relationship with the invited TeamMember.
+    :type team_member: TeamMember
+    :ivar status: Current delivery status.
+    :type status: InvitationStatus
+    :ivar attempts: Number of delivery attempts made so far.
+    :type attempts: int
+    :ivar next_attempt_at: Earliest time of the next delivery attempt.
+    :type next_attempt_at: datetime
+    :ivar last_error: Error of the latest failed attempt, or None.
+    :type last_error: Optional[str]
+    :ivar sent_at: Timestamp of successful delivery, or None.
+    :type sent_at: Optional[datetime]
+    :ivar claim_token: Token of the worker claim that moved the row to SENDING, or None.
+    :type claim_token: Optional[UUID]
+    :ivar claimed_at: Timestamp of that claim, after which its lease runs out.
+    :type claimed_at: Optional[datetime]
+    """
+    __tablename__ = "invitation_outbox"
+
+    survey_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("surveys.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    team_member_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("team_members.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True
+    )
+    team_member = relationship("TeamMember")
+
+    status = Column(
+        SQLEnum(InvitationStatus),
+        default=InvitationStatus.PENDING,
+        nullable=False
+    )
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    claim_token = Column(UUID(as_uuid=True), nullable=True)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Due invitations for the worker, oldest first
+        Index("ix_invitation_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+        # Keyset pages and status counts per survey
+        Index("ix_invitation_outbox_survey_id_created_at_id", "survey_id", "created_at", "id"),
+    )
+
+    def __repr__(self):
+        return f"<InvitationOutbox(id={self.id}, team_member_id={self.team_member_id}, status={self.status})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Enum as SQLEnum
+from sqlalchemy import Column, Index, String, Text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.models.base import BaseModel
@@ -40,6 +40,8 @@ class Survey(BaseModel):
     :type status: SurveyStatus
     :ivar team_members: List of team members associated with this survey.
     :type team_members: list
+    :ivar analytics_snapshot: Frozen final analytics, once the survey is completed.
+    :type analytics_snapshot: SurveyAnalyticsSnapshot
     """
     __tablename__ = "surveys"
 
@@ -67,6 +69,17 @@ class Survey(BaseModel):
         cascade="all, delete-orphan"
     )
 
+    analytics_snapshot = relationship(
+        "SurveyAnalyticsSnapshot",
+        back_populates="survey",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (
+        Index("ix_surveys_manager_id_created_at_id", "manager_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Survey(id={self.id}, manager_id={self.manager_id}, status={self.status})>"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base import BaseModel
@@ -23,6 +23,8 @@ class TeamMember(BaseModel):
     :type has_completed: bool
     :ivar completed_at: Timestamp when the survey was completed, or None if not completed.
     :type completed_at: Optional[datetime]
+    :ivar last_reminded_at: Timestamp of the latest completion reminder, or None if never reminded.
+    :type last_reminded_at: Optional[datetime]
     :ivar survey_id: Foreign key referencing the associated survey's ID.
     :type survey_id: UUID
     :ivar survey: Relationship to the associated Survey object.
@@ -40,6 +42,7 @@ class TeamMember(BaseModel):
 
     has_completed = Column(Boolean, default=False, nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    last_reminded_at = Column(DateTime(timezone=True), nullable=True)
 
     survey_id = Column(
         UUID(as_uuid=True),
@@ -54,6 +57,14 @@ class TeamMember(BaseModel):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index("ix_team_members_survey_id_created_at_id", "survey_id", "created_at", "id"),
+        # Range scans over a survey's completions for timing analytics
+        Index("ix_team_members_survey_id_completed_at", "survey_id", "completed_at"),
+        # Keyset pages over pending members for the reminder job
+        Index("ix_team_members_has_completed_created_at_id", "has_completed", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<TeamMember(id={self.id}, name={self.name}, has_completed={self.has_completed})>"
 
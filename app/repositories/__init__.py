@@ -7,11 +7,17 @@ from .survey import SurveyRepository
 from .team_member import TeamMemberRepository
 from .question import QuestionRepository
 from .response import ResponseRepository
+from .analytics_snapshot import AnalyticsSnapshotRepository
+from .invitation import InvitationRepository
+from .idempotency import IdempotencyRepository
 
 __all__ = [
     "BaseRepository",
     "SurveyRepository",
     "TeamMemberRepository",
     "QuestionRepository",
-    "ResponseRepository"
+    "ResponseRepository",
+    "AnalyticsSnapshotRepository",
+    "InvitationRepository",
+    "IdempotencyRepository"
 ]
\ No newline at end of file
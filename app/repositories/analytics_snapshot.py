@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.models.analytics_snapshot import SurveyAnalyticsSnapshot
+from app.models.survey import Survey, SurveyStatus
+from app.repositories.base import BaseRepository, SessionSource
+
+
+class AnalyticsSnapshotRepository(BaseRepository[SurveyAnalyticsSnapshot]):
+    """Repository for SurveyAnalyticsSnapshot model"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(SurveyAnalyticsSnapshot, db)
+
+    def get_by_survey_id(self, survey_id: UUID) -> Optional[SurveyAnalyticsSnapshot]:
+        """Get the analytics snapshot of a survey"""
+        return (
+            self.db.query(SurveyAnalyticsSnapshot)
+            .filter(SurveyAnalyticsSnapshot.survey_id == survey_id)
+            .first()
+        )
+
+    def get_by_survey_ids(self, survey_ids: List[UUID]) -> Dict[UUID, SurveyAnalyticsSnapshot]:
+        """Get the analytics snapshots of many surveys, keyed by survey ID"""
+        snapshots = (
+            self.db.query(SurveyAnalyticsSnapshot)
+            .filter(SurveyAnalyticsSnapshot.survey_id.in_(survey_ids))
+            .all()
+        )
+        return {snapshot.survey_id: snapshot for snapshot in snapshots}
+
+    def freeze(
+            self,
+            survey: Survey,
+            total_members: int,
+            completed_responses: int,
+            question_analytics: List[dict]
+    ) -> SurveyAnalyticsSnapshot:
+        """Store the final analytics of a survey and mark it completed in one transaction"""
+        snapshot = SurveyAnalyticsSnapshot(
+            survey_id=survey.id,
+            total_members=total_members,
+            completed_responses=completed_responses,
+            question_analytics=question_analytics
+        )
+        self.db.add(snapshot)
+        survey.status = SurveyStatus.COMPLETED
+        self.db.commit()
+        return snapshot
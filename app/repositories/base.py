@@ -1,20 +1,34 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, tuple_
 
 from app.database.connection import Base
+from app.database.session import UnitOfWork
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# A plain session, or a request's unit of work whose session opens on first query
+SessionSource = Union[Session, UnitOfWork]
+
+# Position of a row in (created_at, id) order, used as a keyset pagination cursor
+PageKey = Tuple[datetime, UUID]
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository class with common CRUD operations"""
 
-    def __init__(self, model: Type[ModelType], db: Session):
+    def __init__(self, model: Type[ModelType], db: SessionSource):
         self.model = model
-        self.db = db
+        self._db = db
+
+    @property
+    def db(self) -> Session:
+        """Session to query with, opened by the unit of work on first use"""
+        db = self._db
+        return db.session if isinstance(db, UnitOfWork) else db
 
     def get_by_id(self, id: UUID) -> Optional[ModelType]:
         """Get a single record by ID"""
@@ -24,9 +38,26 @@ class BaseRepository(Generic[ModelType]):
         """Get a single record by field value"""
         return self.db.query(self.model).filter(getattr(self.model, field) == value).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Get all records with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+    def get_all(self, limit: int = 100, after: Optional[PageKey] = None) -> List[ModelType]:
+        """Get all records with keyset pagination"""
+        return self.get_page(limit, after)
+
+    def get_page(self, limit: int, after: Optional[PageKey] = None, *criteria: Any) -> List[ModelType]:
+        """
+        Get a page of records in stable (created_at, id) order.
+
+        Keyset pagination seeks directly to the rows after ``after`` through the
+        index instead of skipping ``offset`` rows, so deep pages cost the same as
+        the first one.
+        """
+        query = self.db.query(self.model).filter(*criteria)
+        if after is not None:
+            query = query.filter(tuple_(self.model.created_at, self.model.id) > tuple_(*after))
+        return (
+            query.order_by(self.model.created_at, self.model.id)
+            .limit(limit)
+            .all()
+        )
 
     def create(self, obj_in: Dict[str, Any]) -> ModelType:
         """Create a new record"""
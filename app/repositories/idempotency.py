@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+
+from app.models.idempotency import IdempotencyRecord
+from app.repositories.base import BaseRepository, SessionSource
+
+
+class IdempotencyRepository(BaseRepository[IdempotencyRecord]):
+    """Repository for IdempotencyRecord model"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(IdempotencyRecord, db)
+
+    def get_by_key(self, key: str, created_after: datetime) -> Optional[IdempotencyRecord]:
+        """Get the stored response of a key, unless it is older than ``created_after``"""
+        return (
+            self.db.query(IdempotencyRecord)
+            .filter(IdempotencyRecord.key == key, IdempotencyRecord.created_at > created_after)
+            .first()
+        )
+
+    def save(
+            self,
+            key: str,
+            request_hash: str,
+            status_code: int,
+            response_body: bytes,
+            now: datetime,
+            expired_before: datetime
+    ):
+        """Store the response of a key, replacing a record of the same key that expired"""
+        self.db.execute(
+            delete(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key, IdempotencyRecord.created_at <= expired_before)
+        )
+        self.db.add(IdempotencyRecord(
+            key=key,
+            request_hash=request_hash,
+            status_code=status_code,
+            response_body=response_body,
+            created_at=now
+        ))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Stored concurrently by another process; the first response wins
+            self.db.rollback()
+
+    def purge_created_before(self, cutoff: datetime) -> int:
+        """Delete every record older than ``cutoff``"""
+        result = self.db.execute(delete(IdempotencyRecord).where(IdempotencyRecord.created_at < cutoff))
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,205 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import func, insert, or_, select, tuple_, update
+from sqlalchemy.engine import Row
+
+from app.models.invitation import InvitationOutbox, InvitationStatus
+from app.models.survey import Survey
+from app.models.team_member import TeamMember
+from app.repositories.base import BaseRepository, PageKey, SessionSource
+
+
+class InvitationRepository(BaseRepository[InvitationOutbox]):
+    """Repository for InvitationOutbox model"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(InvitationOutbox, db)
+
+    @staticmethod
+    def pending_rows(survey_id: UUID, team_member_ids: List[UUID], now: datetime) -> List[dict]:
+        """Build the outbox rows queueing one invitation per team member"""
+        return [
+            {
+                "id": uuid4(),
+                "survey_id": survey_id,
+                "team_member_id": team_member_id,
+                "status": InvitationStatus.PENDING,
+                "attempts": 0,
+                "next_attempt_at": now,
+                "created_at": now
+            }
+            for team_member_id in team_member_ids
+        ]
+
+    def enqueue(self, survey_id: UUID, team_member_ids: List[UUID], now: datetime) -> int:
+        """Queue one pending invitation per team member with a single bulk INSERT"""
+        if not team_member_ids:
+            return 0
+        self.db.execute(insert(InvitationOutbox), self.pending_rows(survey_id, team_member_ids, now))
+        self.db.commit()
+        return len(team_member_ids)
+
+    def claim_due(self, limit: int, now: datetime) -> List[Row]:
+        """
+        Claim up to ``limit`` due invitations for delivery
+
+        Claimed rows move to SENDING with one more attempt and a fresh claim
+        token, and only the rows carrying this claim's token are returned, so
+        a row another worker claimed concurrently is never returned twice.
+        Rows are lean (id, attempts, claim_token, name, email, unique_link,
+        survey_title); the token must be passed back to ``mark_sent`` and
+        ``mark_failed`` to record the outcome.
+        """
+        ids = self.db.execute(
+            select(InvitationOutbox.id)
+            .where(
+                InvitationOutbox.status == InvitationStatus.PENDING,
+                InvitationOutbox.next_attempt_at <= now
+            )
+            .order_by(InvitationOutbox.next_attempt_at)
+            .limit(limit)
+        ).scalars().all()
+        if not ids:
+            return []
+
+        claim_token = uuid4()
+        result = self.db.execute(
+            update(InvitationOutbox)
+            .where(InvitationOutbox.id.in_(ids), InvitationOutbox.status == InvitationStatus.PENDING)
+            .values(
+                status=InvitationStatus.SENDING,
+                attempts=InvitationOutbox.attempts + 1,
+                claim_token=claim_token,
+                claimed_at=now
+            )
+        )
+        self.db.commit()
+        if result.rowcount == 0:
+            return []
+
+        return self.db.execute(
+            select(
+                InvitationOutbox.id,
+                InvitationOutbox.attempts,
+                InvitationOutbox.claim_token,
+                TeamMember.name,
+                TeamMember.email,
+                TeamMember.unique_link,
+                Survey.title.label("survey_title")
+            )
+            .join(TeamMember, InvitationOutbox.team_member_id == TeamMember.id)
+            .join(Survey, InvitationOutbox.survey_id == Survey.id)
+            .where(InvitationOutbox.id.in_(ids), InvitationOutbox.claim_token == claim_token)
+        ).all()
+
+    def mark_sent(self, invitation_ids: List[UUID], claim_token: UUID, sent_at: datetime) -> int:
+        """
+        Mark many invitations as delivered with one UPDATE
+
+        Only rows still SENDING under ``claim_token`` are updated, so a worker
+        whose claim expired and was taken over cannot overwrite the outcome
+        of the newer claim.
+        """
+        result = self.db.execute(
+            update(InvitationOutbox)
+            .where(
+                InvitationOutbox.id.in_(invitation_ids),
+                InvitationOutbox.claim_token == claim_token,
+                InvitationOutbox.status == InvitationStatus.SENDING
+            )
+            .values(status=InvitationStatus.SENT, sent_at=sent_at, last_error=None, claim_token=None)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def mark_failed(
+            self,
+            invitation_id: UUID,
+            claim_token: UUID,
+            error: str,
+            next_attempt_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Record a failed attempt; retry at ``next_attempt_at`` or give up when it is None
+
+        Like ``mark_sent``, only a row still SENDING under ``claim_token`` is updated.
+        """
+        values = {"last_error": error, "claim_token": None}
+        if next_attempt_at is None:
+            values["status"] = InvitationStatus.FAILED
+        else:
+            values["status"] = InvitationStatus.PENDING
+            values["next_attempt_at"] = next_attempt_at
+
+        result = self.db.execute(
+            update(InvitationOutbox)
+            .where(
+                InvitationOutbox.id == invitation_id,
+                InvitationOutbox.claim_token == claim_token,
+                InvitationOutbox.status == InvitationStatus.SENDING
+            )
+            .values(**values)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def release_expired_claims(self, claimed_before: datetime) -> int:
+        """
+        Return invitations claimed before ``claimed_before`` and still SENDING to the queue
+
+        Only claims whose lease ran out are released, so rows another live
+        worker is still delivering are left alone.
+        """
+        result = self.db.execute(
+            update(InvitationOutbox)
+            .where(
+                InvitationOutbox.status == InvitationStatus.SENDING,
+                # Rows claimed before claims were recorded have no claimed_at
+                or_(InvitationOutbox.claimed_at < claimed_before, InvitationOutbox.claimed_at.is_(None))
+            )
+            .values(status=InvitationStatus.PENDING, claim_token=None)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def get_status_counts(self, survey_id: UUID) -> Dict[InvitationStatus, int]:
+        """Count the invitations of a survey per status"""
+        rows = self.db.execute(
+            select(InvitationOutbox.status, func.count())
+            .where(InvitationOutbox.survey_id == survey_id)
+            .group_by(InvitationOutbox.status)
+        ).all()
+        counts = {invitation_status: 0 for invitation_status in InvitationStatus}
+        counts.update({invitation_status: count for invitation_status, count in rows})
+        return counts
+
+    def get_page_by_survey_id(
+            self,
+            survey_id: UUID,
+            limit: int,
+            after: Optional[PageKey] = None
+    ) -> List[Row]:
+        """Get a keyset page of a survey's invitations with their recipient, oldest first"""
+        stmt = (
+            select(
+                InvitationOutbox.id,
+                InvitationOutbox.created_at,
+                InvitationOutbox.team_member_id,
+                TeamMember.name,
+                TeamMember.email,
+                InvitationOutbox.status,
+                InvitationOutbox.attempts,
+                InvitationOutbox.last_error,
+                InvitationOutbox.next_attempt_at,
+                InvitationOutbox.sent_at
+            )
+            .join(TeamMember, InvitationOutbox.team_member_id == TeamMember.id)
+            .where(InvitationOutbox.survey_id == survey_id)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(InvitationOutbox.created_at, InvitationOutbox.id) > tuple_(*after))
+
+        return self.db.execute(
+            stmt.order_by(InvitationOutbox.created_at, InvitationOutbox.id).limit(limit)
+        ).all()
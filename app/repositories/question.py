@@ -1,16 +1,15 @@
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
 from sqlalchemy import asc
 
 from app.models.question import SurveyQuestion
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, SessionSource
 
 
 class QuestionRepository(BaseRepository[SurveyQuestion]):
     """Repository for SurveyQuestion model"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: SessionSource):
         super().__init__(SurveyQuestion, db)
 
     def get_all_ordered(self) -> List[SurveyQuestion]:
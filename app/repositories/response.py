@@ -1,16 +1,19 @@
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import Integer, String, and_, case, cast, func, literal_column, select, type_coerce
+from sqlalchemy.engine import Row
 from app.models.response import Response
 from app.models.question import SurveyQuestion
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, SessionSource
+from app.utils.statistics import RATING_SCALE
+
+_ROWID = literal_column("responses.rowid")
 
 
 class ResponseRepository(BaseRepository[Response]):
     """Repository for Response model"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: SessionSource):
         super().__init__(Response, db)
 
     def get_by_team_member(self, team_member_id: UUID) -> list[type[Response]]:
@@ -31,6 +34,120 @@ class ResponseRepository(BaseRepository[Response]):
             .all()
         )
 
+    def stream_export_rows(
+            self,
+            survey_id: Optional[UUID] = None,
+            manager_id: Optional[str] = None,
+            batch_size: int = 1000,
+            min_responses: int = 0
+    ) -> Iterator[List[Row]]:
+        """
+        Stream raw response rows for a survey or a manager in batches.
+
+        Only plain columns are selected and rows are fetched ``batch_size`` at a
+        time from the cursor, so no ORM objects are built and memory stays
+        bounded regardless of the number of responses. Surveys answered by
+        fewer than ``min_responses`` team members are left out.
+
+        No timestamp or respondent column is selected and rows are ordered by
+        survey, question and rating, so neither the values nor the row order
+        tie the ratings of one respondent together.
+        """
+        from app.models.survey import Survey
+        from app.models.team_member import TeamMember
+
+        stmt = (
+            select(
+                Survey.id.label("survey_id"),
+                Survey.manager_id,
+                Response.question_id,
+                SurveyQuestion.question_order,
+                Response.rating
+            )
+            .join(TeamMember, Response.team_member_id == TeamMember.id)
+            .join(Survey, TeamMember.survey_id == Survey.id)
+            .join(SurveyQuestion, Response.question_id == SurveyQuestion.id)
+        )
+        if survey_id is not None:
+            stmt = stmt.where(TeamMember.survey_id == survey_id)
+        if manager_id is not None:
+            stmt = stmt.where(Survey.manager_id == manager_id)
+
+        if min_responses > 0:
+            eligible = (
+                select(TeamMember.survey_id)
+                .where(TeamMember.has_completed == True)
+                .group_by(TeamMember.survey_id)
+                .having(func.count(TeamMember.id) >= min_responses)
+            )
+            if survey_id is not None:
+                eligible = eligible.where(TeamMember.survey_id == survey_id)
+            if manager_id is not None:
+                eligible = eligible.join(Survey, TeamMember.survey_id == Survey.id).where(
+                    Survey.manager_id == manager_id
+                )
+            eligible = eligible.subquery()
+            stmt = stmt.join(eligible, eligible.c.survey_id == Survey.id)
+
+        stmt = stmt.order_by(Survey.id, SurveyQuestion.question_order, Response.rating)
+        result = self.db.execute(stmt.execution_options(yield_per=batch_size))
+        yield from result.partitions()
+
+    def get_max_rowid(self) -> int:
+        """
+        Get the highest SQLite rowid of the responses table (0 when empty).
+
+        Rowids grow with every insert, so rows committed later always have a
+        higher rowid; bulk loaders use it as the boundary of their snapshot.
+        """
+        return self.db.execute(select(func.coalesce(func.max(_ROWID), 0)).select_from(Response)).scalar_one()
+
+    def stream_rating_columns(self, max_rowid: int, batch_size: int = 100_000) -> Iterator[List[tuple]]:
+        """
+        Stream (survey_id hex, manager_id, question_id hex, rating, day) for every
+        response up to ``max_rowid``.
+
+        IDs are returned in their stored hex form and the submission day as
+        days since the Unix epoch. Batches are plain tuples fetched from the
+        DBAPI cursor, skipping Row construction, which halves the load time
+        of bulk loaders over millions of rows. The manager of each survey
+        comes from the same statement, so every row is self-contained.
+        """
+        from app.models.survey import Survey
+        from app.models.team_member import TeamMember
+
+        stmt = (
+            select(
+                type_coerce(TeamMember.survey_id, String).label("survey_id"),
+                Survey.manager_id,
+                type_coerce(Response.question_id, String).label("question_id"),
+                Response.rating,
+                cast(func.julianday(Response.submitted_at) - 2440587.5, Integer).label("day")
+            )
+            .join(TeamMember, Response.team_member_id == TeamMember.id)
+            .join(Survey, TeamMember.survey_id == Survey.id)
+            .where(_ROWID <= max_rowid)
+        )
+
+        connection = self.db.connection()
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(str(stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})))
+            while batch := cursor.fetchmany(batch_size):
+                yield batch
+        finally:
+            cursor.close()
+
+    def get_team_members_with_responses(self, team_member_ids: List[UUID], max_rowid: int) -> List[UUID]:
+        """Get which of the given team members have responses up to ``max_rowid``"""
+        if not team_member_ids:
+            return []
+        return self.db.execute(
+            select(Response.team_member_id)
+            .where(Response.team_member_id.in_(team_member_ids), _ROWID <= max_rowid)
+            .distinct()
+        ).scalars().all()
+
     def create_batch(self, responses_data: List[dict]) -> List[Response]:
         """Create multiple responses in a single transaction"""
         responses = []
@@ -47,34 +164,153 @@ class ResponseRepository(BaseRepository[Response]):
 
         return responses
 
-    def get_analytics_for_survey(self, survey_id: UUID) -> List[Dict]:
-        """Get analytics data for a survey"""
+    def _question_analytics_query(self, *group_columns):
+        """Grouped per-question aggregates: averages, counts, sums and the 1-5 histogram"""
         from app.models.team_member import TeamMember
 
-        # Get average scores per question
-        analytics = (
+        return (
             self.db.query(
+                *group_columns,
                 Response.question_id,
                 SurveyQuestion.question_text,
                 func.avg(Response.rating).label("average_score"),
-                func.count(Response.id).label("response_count")
+                func.count(Response.id).label("response_count"),
+                func.sum(Response.rating).label("rating_sum"),
+                func.sum(Response.rating * Response.rating).label("rating_sum_squares"),
+                *[
+                    func.sum(case((Response.rating == rating, 1), else_=0)).label(f"rating_{rating}")
+                    for rating in RATING_SCALE
+                ]
             )
             .join(SurveyQuestion, Response.question_id == SurveyQuestion.id)
             .join(TeamMember, Response.team_member_id == TeamMember.id)
+            .group_by(
+                *group_columns,
+                Response.question_id,
+                SurveyQuestion.question_text,
+                SurveyQuestion.question_order
+            )
+        )
+
+    @staticmethod
+    def _question_analytics_data(row: Row) -> Dict:
+        return {
+            "question_id": str(row.question_id),
+            "question_text": row.question_text,
+            "average_score": float(row.average_score),
+            "response_count": row.response_count,
+            "rating_sum": row.rating_sum,
+            "rating_sum_squares": row.rating_sum_squares,
+            "distribution": [getattr(row, f"rating_{rating}") for rating in RATING_SCALE]
+        }
+
+    def get_analytics_for_survey(self, survey_id: UUID) -> List[Dict]:
+        """
+        Get analytics data for a survey
+
+        Averages, counts, the 1-5 histogram and the sums needed for the
+        standard deviation are all computed by one grouped aggregate query.
+        """
+        from app.models.team_member import TeamMember
+
+        analytics = (
+            self._question_analytics_query()
             .filter(TeamMember.survey_id == survey_id)
-            .group_by(Response.question_id, SurveyQuestion.question_text)
+            .order_by(SurveyQuestion.question_order)
             .all()
         )
 
-        return [
-            {
-                "question_id": str(row.question_id),
-                "question_text": row.question_text,
-                "average_score": float(row.average_score),
-                "response_count": row.response_count
-            }
-            for row in analytics
-        ]
+        return [self._question_analytics_data(row) for row in analytics]
+
+    def get_analytics_for_surveys(self, survey_ids: List[UUID]) -> Dict[UUID, List[Dict]]:
+        """
+        Get analytics data for many surveys with one query
+
+        Same aggregates as get_analytics_for_survey, grouped by survey and
+        question over ``survey_id IN (...)``. Surveys without responses are
+        absent from the result.
+        """
+        from app.models.team_member import TeamMember
+
+        analytics = (
+            self._question_analytics_query(TeamMember.survey_id)
+            .filter(TeamMember.survey_id.in_(survey_ids))
+            .order_by(TeamMember.survey_id, SurveyQuestion.question_order)
+            .all()
+        )
+
+        by_survey: Dict[UUID, List[Dict]] = {}
+        for row in analytics:
+            by_survey.setdefault(row.survey_id, []).append(self._question_analytics_data(row))
+        return by_survey
+
+    def get_manager_question_trend(self, manager_id: str) -> List[Row]:
+        """
+        Get per-question averages and counts of every survey of a manager.
+
+        One grouped query over all the manager's surveys, ordered by survey
+        creation time and question order. Surveys without responses yet are
+        not returned. Rows are (survey_id, title, created_at, question_id,
+        question_text, average_score, response_count, rating_1..rating_5).
+        """
+        from app.models.survey import Survey
+        from app.models.team_member import TeamMember
+
+        return self.db.execute(
+            select(
+                Survey.id.label("survey_id"),
+                Survey.title,
+                Survey.created_at,
+                Response.question_id,
+                SurveyQuestion.question_text,
+                func.avg(Response.rating).label("average_score"),
+                func.count(Response.id).label("response_count"),
+                *[
+                    func.sum(case((Response.rating == rating, 1), else_=0)).label(f"rating_{rating}")
+                    for rating in RATING_SCALE
+                ]
+            )
+            .join(TeamMember, TeamMember.survey_id == Survey.id)
+            .join(Response, Response.team_member_id == TeamMember.id)
+            .join(SurveyQuestion, Response.question_id == SurveyQuestion.id)
+            .where(Survey.manager_id == manager_id)
+            .group_by(
+                Survey.id,
+                Survey.title,
+                Survey.created_at,
+                Response.question_id,
+                SurveyQuestion.question_text,
+                SurveyQuestion.question_order
+            )
+            .order_by(Survey.created_at, Survey.id, SurveyQuestion.question_order)
+        ).all()
+
+    def get_completed_survey_question_averages(self) -> List[Row]:
+        """
+        Get per-question averages of every fully completed survey.
+
+        A survey counts as completed when none of its team members is pending.
+        Returns (survey_id, question_id, average_score) rows.
+        """
+        from app.models.team_member import TeamMember
+
+        completed_surveys = (
+            select(TeamMember.survey_id)
+            .group_by(TeamMember.survey_id)
+            .having(func.sum(case((TeamMember.has_completed == False, 1), else_=0)) == 0)
+            .subquery()
+        )
+
+        return self.db.execute(
+            select(
+                TeamMember.survey_id,
+                Response.question_id,
+                func.avg(Response.rating).label("average_score")
+            )
+            .join(TeamMember, Response.team_member_id == TeamMember.id)
+            .join(completed_surveys, completed_surveys.c.survey_id == TeamMember.survey_id)
+            .group_by(TeamMember.survey_id, Response.question_id)
+        ).all()
 
     def get_overall_average_for_survey(self, survey_id: UUID) -> Optional[float]:
         """Get overall average score for a survey"""
@@ -1,21 +1,55 @@
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.engine import Row
 
-from app.models.survey import Survey
-from app.repositories.base import BaseRepository
+from app.models.survey import Survey, SurveyStatus
+from app.repositories.base import BaseRepository, PageKey, SessionSource
 
 
 class SurveyRepository(BaseRepository[Survey]):
     """Repository for Survey model"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: SessionSource):
         super().__init__(Survey, db)
 
+    def create_bulk(
+            self,
+            surveys_data: List[dict],
+            team_members_data: List[dict],
+            invitations_data: Optional[List[dict]] = None
+    ):
+        """Insert many surveys with their team members (and invitations) in one transaction"""
+        from app.models.invitation import InvitationOutbox
+        from app.models.team_member import TeamMember
+
+        self.db.execute(insert(Survey), surveys_data)
+        self.db.execute(insert(TeamMember), team_members_data)
+        if invitations_data:
+            self.db.execute(insert(InvitationOutbox), invitations_data)
+        self.db.commit()
+
     def get_by_manager_id(self, manager_id: str) -> List[Survey]:
         """Get all surveys for a specific manager"""
         return self.db.query(Survey).filter(Survey.manager_id == manager_id).all()
 
+    def get_page_by_manager_id(
+            self,
+            manager_id: str,
+            limit: int,
+            after: Optional[PageKey] = None
+    ) -> List[Survey]:
+        """Get a keyset-paginated page of surveys for a manager"""
+        return self.get_page(limit, after, Survey.manager_id == manager_id)
+
+    def manager_has_surveys(self, manager_id: str) -> bool:
+        """Check if a manager owns at least one survey"""
+        return (
+            self.db.query(Survey.id)
+            .filter(Survey.manager_id == manager_id)
+            .first()
+        ) is not None
+
     def get_active_surveys(self) -> List[Survey]:
         """Get all active surveys"""
         return self.db.query(Survey).filter(Survey.status == "active").all()
@@ -29,11 +63,50 @@ class SurveyRepository(BaseRepository[Survey]):
             .first()
         )
 
+    def get_status_rows(self, survey_id: UUID) -> List[Row]:
+        """
+        Get the survey status and lean team member columns in a single query.
+
+        Returns one row per team member (or a single row with null member
+        columns for a survey without members), and no rows if the survey does
+        not exist.
+        """
+        from app.models.team_member import TeamMember
+        return self.db.execute(
+            select(
+                Survey.status,
+                TeamMember.id,
+                TeamMember.name,
+                TeamMember.email,
+                TeamMember.has_completed
+            )
+            .select_from(Survey)
+            .outerjoin(TeamMember, TeamMember.survey_id == Survey.id)
+            .where(Survey.id == survey_id)
+            .order_by(TeamMember.created_at, TeamMember.id)
+        ).all()
+
+    def get_unfinalized_completed_ids(self) -> List[UUID]:
+        """
+        Get IDs of surveys whose members have all answered but have no analytics snapshot yet
+        """
+        from app.models.analytics_snapshot import SurveyAnalyticsSnapshot
+        from app.models.team_member import TeamMember
+
+        return list(self.db.scalars(
+            select(Survey.id)
+            .join(TeamMember, TeamMember.survey_id == Survey.id)
+            .outerjoin(SurveyAnalyticsSnapshot, SurveyAnalyticsSnapshot.survey_id == Survey.id)
+            .where(SurveyAnalyticsSnapshot.id.is_(None))
+            .group_by(Survey.id)
+            .having(func.sum(case((TeamMember.has_completed == False, 1), else_=0)) == 0)
+        ))
+
     def mark_as_completed(self, survey_id: UUID) -> bool:
         """Mark survey as completed"""
         survey = self.get_by_id(survey_id)
         if survey:
-            survey.status = "completed"
+            survey.status = SurveyStatus.COMPLETED
             self.db.commit()
             return True
         return False
@@ -1,30 +1,48 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, or_, select, tuple_, update
+from sqlalchemy.engine import Row
 
 from app.models.team_member import TeamMember
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, PageKey, SessionSource
 
 
 class TeamMemberRepository(BaseRepository[TeamMember]):
     """Repository for TeamMember model"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: SessionSource):
         super().__init__(TeamMember, db)
 
     def get_by_unique_link(self, unique_link: str) -> Optional[TeamMember]:
         """Get team member by their unique survey link"""
         return self.db.query(TeamMember).filter(TeamMember.unique_link == unique_link).first()
 
+    def get_page_fields_by_unique_link(self, unique_link: str) -> Optional[Row]:
+        """Get the lean (survey_id, name, has_completed) row of a team member by their link"""
+        return self.db.execute(
+            select(TeamMember.survey_id, TeamMember.name, TeamMember.has_completed)
+            .where(TeamMember.unique_link == unique_link)
+        ).first()
+
     def get_by_survey_id(self, survey_id: UUID) -> List[TeamMember]:
         """Get all team members for a specific survey"""
         return self.db.query(TeamMember).filter(TeamMember.survey_id == survey_id).all()
 
+    def get_page_by_survey_id(
+            self,
+            survey_id: UUID,
+            limit: int,
+            after: Optional[PageKey] = None
+    ) -> List[TeamMember]:
+        """Get a keyset-paginated page of team members for a survey"""
+        return self.get_page(limit, after, TeamMember.survey_id == survey_id)
+
     def mark_as_completed(self, team_member_id: UUID) -> bool:
         """Mark team member survey as completed"""
         team_member = self.get_by_id(team_member_id)
         if team_member:
-            team_member.has_completed = True
+            team_member.mark_as_completed()
             self.db.commit()
             return True
         return False
@@ -47,6 +65,145 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
             "completion_rate": completion_rate
         }
 
+    def get_completion_stats_for_surveys(self, survey_ids: List[UUID]) -> Dict[UUID, dict]:
+        """
+        Get completion statistics for many surveys with one grouped query
+
+        Only existing surveys are returned, so the keys double as an
+        existence check.
+        """
+        from app.models.survey import Survey
+
+        rows = self.db.execute(
+            select(
+                Survey.id,
+                func.count(TeamMember.id).label("total"),
+                func.coalesce(func.sum(case((TeamMember.has_completed == True, 1), else_=0)), 0).label("completed")
+            )
+            .outerjoin(TeamMember, TeamMember.survey_id == Survey.id)
+            .where(Survey.id.in_(survey_ids))
+            .group_by(Survey.id)
+        ).all()
+
+        return {
+            row.id: {
+                "total": row.total,
+                "completed": row.completed,
+                "pending": row.total - row.completed,
+                "completion_rate": (row.completed / row.total * 100) if row.total > 0 else 0
+            }
+            for row in rows
+        }
+
+    def get_time_to_complete(self, survey_id: UUID, bucket_edges_hours: List[float]) -> Row:
+        """
+        Get time-to-complete aggregates of a survey's completed members
+
+        Hours between survey creation and each completion are bucketed by
+        conditional sums over an index range scan on (survey_id, completed_at).
+        Returns (completed, average_hours, first_completed_at,
+        last_completed_at, bucket_0..bucket_n) where bucket_i counts
+        completions under ``bucket_edges_hours[i]`` not counted by earlier
+        buckets and bucket_n the rest.
+        """
+        from app.models.survey import Survey
+
+        hours = (func.julianday(TeamMember.completed_at) - func.julianday(Survey.created_at)) * 24
+        buckets = []
+        for index, edge in enumerate(bucket_edges_hours):
+            lower = bucket_edges_hours[index - 1] if index else None
+            condition = hours < edge if lower is None else and_(hours >= lower, hours < edge)
+            buckets.append(func.sum(case((condition, 1), else_=0)).label(f"bucket_{index}"))
+        buckets.append(func.sum(case((hours >= bucket_edges_hours[-1], 1), else_=0)).label(
+            f"bucket_{len(bucket_edges_hours)}"
+        ))
+
+        return self.db.execute(
+            select(
+                func.count(TeamMember.id).label("completed"),
+                func.avg(hours).label("average_hours"),
+                func.min(TeamMember.completed_at).label("first_completed_at"),
+                func.max(TeamMember.completed_at).label("last_completed_at"),
+                *buckets
+            )
+            .join(Survey, TeamMember.survey_id == Survey.id)
+            .where(TeamMember.survey_id == survey_id, TeamMember.completed_at.is_not(None))
+        ).one()
+
+    def get_completion_curve(self, survey_id: UUID, period_format: str) -> List[Row]:
+        """
+        Get the number of completions per period of a survey
+
+        Completions are grouped by ``strftime(period_format, completed_at)``
+        over an index range scan on (survey_id, completed_at). Returns
+        (period, completed) rows in chronological order.
+        """
+        period = func.strftime(period_format, TeamMember.completed_at).label("period")
+        return self.db.execute(
+            select(period, func.count(TeamMember.id).label("completed"))
+            .where(TeamMember.survey_id == survey_id, TeamMember.completed_at.is_not(None))
+            .group_by(period)
+            .order_by(period)
+        ).all()
+
+    def get_pending_reminder_page(
+            self,
+            limit: int,
+            after: Optional[PageKey] = None,
+            reminded_before: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get a keyset page of pending members of active surveys due for a reminder
+
+        Members never reminded or last reminded before ``reminded_before`` are
+        returned as lean (id, created_at, name, email, unique_link,
+        survey_title) rows in (created_at, id) order, seeking through the
+        (has_completed, created_at, id) index.
+        """
+        from app.models.survey import Survey, SurveyStatus
+
+        stmt = (
+            select(
+                TeamMember.id,
+                TeamMember.created_at,
+                TeamMember.name,
+                TeamMember.email,
+                TeamMember.unique_link,
+                Survey.title.label("survey_title")
+            )
+            .join(Survey, TeamMember.survey_id == Survey.id)
+            .where(TeamMember.has_completed == False, Survey.status == SurveyStatus.ACTIVE)
+        )
+        if reminded_before is not None:
+            stmt = stmt.where(or_(
+                TeamMember.last_reminded_at.is_(None),
+                TeamMember.last_reminded_at < reminded_before
+            ))
+        if after is not None:
+            stmt = stmt.where(tuple_(TeamMember.created_at, TeamMember.id) > tuple_(*after))
+
+        return self.db.execute(
+            stmt.order_by(TeamMember.created_at, TeamMember.id).limit(limit)
+        ).all()
+
+    def mark_reminded(self, team_member_ids: List[UUID], reminded_at: datetime) -> int:
+        """Record a reminder for many team members with one UPDATE"""
+        result = self.db.execute(
+            update(TeamMember)
+            .where(TeamMember.id.in_(team_member_ids))
+            .values(last_reminded_at=reminded_at)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def count_pending(self, survey_id: UUID) -> int:
+        """Count team members who have not completed the survey"""
+        return (
+            self.db.query(TeamMember)
+            .filter(TeamMember.survey_id == survey_id, TeamMember.has_completed == False)
+            .count()
+        )
+
     def create_batch(self, team_members_data: List[dict]) -> List[TeamMember]:
         """Create multiple team members in a single transaction"""
         team_members = []
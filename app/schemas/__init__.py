@@ -1,11 +1,16 @@
-from .common import APIResponse, SuccessResponse, ErrorResponse
+from .common import APIResponse, SuccessResponse, ErrorResponse, Page, PageResponse
 from .survey import (
     SurveyCreate,
+    SurveyBulkCreate,
+    SurveyBulkCreateData,
+    SurveyBulkResponse,
     SurveyResponse,
     TeamMemberInput,
     TeamMemberWithLink,
     SurveyData,
-    SurveyQuestion
+    SurveyQuestion,
+    SurveyQuestionsResponse,
+    SurveySummary
 )
 from .response import (
     ResponseSubmit,
@@ -13,29 +18,58 @@ from .response import (
     ResponseData
 )
 from .analytics import (
+    ConfidenceInterval,
     QuestionAnalytics,
     SurveyAnalytics,
-    ProgressSummary
+    SurveyAnalyticsBatchRequest,
+    SurveyAnalyticsBatch,
+    ProgressSummary,
+    RatingsGroup,
+    RatingsAggregate,
+    SurveyTiming,
+    TimingGranularity
 )
+from .export import ExportFormat
+from .invitation import InvitationItem, InvitationSummary, SurveyInvitations
 
 __all__ = [
     # Common
     "APIResponse",
     "SuccessResponse",
     "ErrorResponse",
+    "Page",
+    "PageResponse",
     # Survey
     "SurveyCreate",
+    "SurveyBulkCreate",
+    "SurveyBulkCreateData",
+    "SurveyBulkResponse",
     "SurveyResponse",
     "TeamMemberInput",
     "TeamMemberWithLink",
     "SurveyData",
     "SurveyQuestion",
+    "SurveyQuestionsResponse",
+    "SurveySummary",
     # Response
     "ResponseSubmit",
     "SurveySubmission",
     "ResponseData",
     # Analytics
+    "ConfidenceInterval",
     "QuestionAnalytics",
     "SurveyAnalytics",
-    "ProgressSummary"
+    "SurveyAnalyticsBatchRequest",
+    "SurveyAnalyticsBatch",
+    "ProgressSummary",
+    "RatingsGroup",
+    "RatingsAggregate",
+    "SurveyTiming",
+    "TimingGranularity",
+    # Export
+    "ExportFormat",
+    # Invitation
+    "InvitationItem",
+    "InvitationSummary",
+    "SurveyInvitations"
 ]
@@ -1,13 +1,43 @@
-from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
 
 
+class ConfidenceInterval(BaseModel):
+    """Bootstrap confidence interval of an average score"""
+    lower: float = Field(..., ge=1.0, le=5.0, description="Lower bound of the average")
+    upper: float = Field(..., ge=1.0, le=5.0, description="Upper bound of the average")
+    level: float = Field(..., gt=0.0, lt=1.0, description="Confidence level, e.g. 0.95")
+
+
 class QuestionAnalytics(BaseModel):
     """Analytics for individual question"""
     questionId: str = Field(..., description="Question UUID")
     questionText: str = Field(..., description="Question text")
-    averageScore: float = Field(..., ge=1.0, le=5.0, description="Average score for this question")
     responseCount: int = Field(..., ge=0, description="Number of responses for this question")
+    suppressed: bool = Field(
+        default=False,
+        description="True when there are too few responses to show results without exposing individuals"
+    )
+    averageScore: Optional[float] = Field(None, ge=1.0, le=5.0,
+                                          description="Average score for this question (null when suppressed)")
+    ratingDistribution: Optional[Dict[str, int]] = Field(
+        None, description="Number of responses per rating, keyed 1-5 (null when suppressed)"
+    )
+    standardDeviation: Optional[float] = Field(None, ge=0.0, description="Standard deviation of the ratings")
+    median: Optional[float] = Field(None, ge=1.0, le=5.0, description="Median rating")
+    topBoxPercentage: Optional[float] = Field(None, ge=0.0, le=100.0, description="Percentage of 4 and 5 ratings")
+    bottomBoxPercentage: Optional[float] = Field(None, ge=0.0, le=100.0,
+                                                 description="Percentage of 1 and 2 ratings")
+    benchmarkPercentile: Optional[float] = Field(
+        None, ge=0.0, le=100.0,
+        description="Percentile rank of the average among all completed surveys (null until available)"
+    )
+    confidenceInterval: Optional[ConfidenceInterval] = Field(
+        None, description="Bootstrap confidence interval of the average (only when requested)"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -28,9 +58,142 @@ class SurveyAnalytics(BaseModel):
     questionAnalytics: List[QuestionAnalytics] = Field(..., description="Analytics per question")
     overallAverage: Optional[float] = Field(None, ge=1.0, le=5.0,
                                             description="Overall average score across all questions")
+    anonymityThreshold: int = Field(..., ge=0, description="Minimum responses before results are shown")
 
 
 class SurveyAnalyticsResponse(BaseModel):
     """Response wrapper for survey analytics"""
     success: bool = True
     data: SurveyAnalytics
+
+
+class SurveyAnalyticsBatchRequest(BaseModel):
+    """Surveys to compute analytics for in one request"""
+    surveyIds: List[UUID] = Field(..., min_length=1, max_length=100, description="Survey UUIDs")
+    confidence: bool = Field(default=False, description="Include bootstrap confidence intervals")
+
+
+class SurveyAnalyticsBatch(BaseModel):
+    """Analytics of many surveys"""
+    surveys: List[SurveyAnalytics] = Field(..., description="Analytics per survey, in request order")
+    notFound: List[str] = Field(default_factory=list, description="Requested survey UUIDs that do not exist")
+
+
+class SurveyAnalyticsBatchResponse(BaseModel):
+    """Response wrapper for batch survey analytics"""
+    success: bool = True
+    data: SurveyAnalyticsBatch
+
+
+class RatingsGroup(BaseModel):
+    """Aggregated ratings of one group (manager, survey, question or month)"""
+    key: str = Field(..., description="Group key: manager ID, survey/question UUID or YYYY-MM month")
+    responseCount: int = Field(..., ge=0, description="Number of ratings in the group")
+    suppressed: bool = Field(default=False, description="True when too few people rated to show results")
+    averageScore: Optional[float] = Field(None, ge=1.0, le=5.0,
+                                          description="Average rating in the group (null when suppressed)")
+    ratingDistribution: Optional[Dict[str, int]] = Field(
+        None, description="Number of ratings per value, keyed 1-5 (null when suppressed)"
+    )
+
+
+class RatingsAggregate(BaseModel):
+    """Grouped ratings aggregate across surveys"""
+    groupBy: str = Field(..., description="Dimension the ratings are grouped by")
+    totalRatings: int = Field(..., ge=0, description="Number of ratings matching the filters")
+    groups: List[RatingsGroup] = Field(..., description="Aggregates per group")
+
+
+class RatingsAggregateResponse(BaseModel):
+    """Response wrapper for grouped ratings aggregates"""
+    success: bool = True
+    data: RatingsAggregate
+
+
+class TrendPoint(BaseModel):
+    """One survey's result for a question in a manager's trend"""
+    surveyId: str = Field(..., description="Survey UUID")
+    createdAt: datetime = Field(..., description="Survey creation timestamp")
+    responseCount: int = Field(..., ge=0, description="Number of responses in this survey")
+    suppressed: bool = Field(default=False, description="True when there are too few responses to show results")
+    averageScore: Optional[float] = Field(None, ge=1.0, le=5.0,
+                                          description="Average score in this survey (null when suppressed)")
+    delta: Optional[float] = Field(None, description="Change of the average since the previous shown survey")
+    movingAverage: Optional[float] = Field(
+        None, ge=1.0, le=5.0,
+        description="Trailing moving average over the shown survey averages (null when suppressed)"
+    )
+    confidenceInterval: Optional[ConfidenceInterval] = Field(
+        None, description="Bootstrap confidence interval of the average (only when requested)"
+    )
+
+
+class QuestionTrend(BaseModel):
+    """Trend of one question across a manager's surveys"""
+    questionId: str = Field(..., description="Question UUID")
+    questionText: str = Field(..., description="Question text")
+    points: List[TrendPoint] = Field(..., description="Results per survey, oldest first")
+
+
+class ManagerTrend(BaseModel):
+    """Per-question trend across a manager's surveys"""
+    managerId: str = Field(..., description="Manager identifier")
+    window: int = Field(..., ge=1, description="Number of surveys in the moving average")
+    anonymityThreshold: int = Field(..., ge=0, description="Minimum responses before a point is shown")
+    surveyCount: int = Field(..., ge=0, description="Number of surveys with responses")
+    questionTrends: List[QuestionTrend] = Field(..., description="Trend per question")
+
+
+class ManagerTrendResponse(BaseModel):
+    """Response wrapper for manager trend analytics"""
+    success: bool = True
+    data: ManagerTrend
+
+
+class TimingGranularity(str, Enum):
+    """Period length of a submission curve"""
+    HOUR = "hour"
+    DAY = "day"
+
+    @property
+    def strftime_format(self) -> str:
+        return "%Y-%m-%d %H:00:00" if self is TimingGranularity.HOUR else "%Y-%m-%d"
+
+
+class TimeToCompleteBucket(BaseModel):
+    """Number of team members who completed within a time range after survey creation"""
+    label: str = Field(..., description="Human readable range, e.g. '1-6h'")
+    minHours: float = Field(..., ge=0.0, description="Inclusive lower bound in hours")
+    maxHours: Optional[float] = Field(None, description="Exclusive upper bound in hours (null for the last bucket)")
+    count: int = Field(..., ge=0, description="Completions in this range")
+
+
+class SubmissionCurvePoint(BaseModel):
+    """Completions in one period of a survey"""
+    period: datetime = Field(..., description="Start of the period")
+    completed: int = Field(..., ge=0, description="Completions in this period")
+    cumulativeCompleted: int = Field(..., ge=0, description="Completions up to and including this period")
+    cumulativeCompletionRate: float = Field(..., ge=0.0, le=100.0,
+                                            description="Completion rate at the end of this period")
+
+
+class SurveyTiming(BaseModel):
+    """Completion timing of a survey"""
+    surveyId: str = Field(..., description="Survey UUID")
+    createdAt: datetime = Field(..., description="Survey creation timestamp")
+    totalMembers: int = Field(..., ge=0, description="Total number of team members")
+    completedResponses: int = Field(..., ge=0, description="Number of completed responses")
+    pending: int = Field(..., ge=0, description="Number of pending responses")
+    averageHoursToComplete: Optional[float] = Field(None, ge=0.0,
+                                                    description="Average hours from creation to completion")
+    firstCompletedAt: Optional[datetime] = Field(None, description="First completion timestamp")
+    lastCompletedAt: Optional[datetime] = Field(None, description="Latest completion timestamp")
+    timeToComplete: List[TimeToCompleteBucket] = Field(..., description="Distribution of time to complete")
+    granularity: TimingGranularity = Field(..., description="Period length of the submission curve")
+    submissionCurve: List[SubmissionCurvePoint] = Field(..., description="Completions per period, oldest first")
+
+
+class SurveyTimingResponse(BaseModel):
+    """Response wrapper for survey timing analytics"""
+    success: bool = True
+    data: SurveyTiming
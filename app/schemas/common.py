@@ -1,5 +1,5 @@
-from typing import Any, Generic, TypeVar, Optional
-from pydantic import BaseModel
+from typing import Any, Generic, List, TypeVar, Optional
+from pydantic import BaseModel, Field
 
 T = TypeVar('T')
 
@@ -23,3 +23,15 @@ class ErrorResponse(BaseModel):
     success: bool = False
     error: str
     message: Optional[str] = None
+
+
+class Page(BaseModel, Generic[T]):
+    """Page of results with an opaque cursor for the next page"""
+    items: List[T]
+    nextCursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class PageResponse(BaseModel, Generic[T]):
+    """Response wrapper for paginated results"""
+    success: bool = True
+    data: Page[T]
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """Supported formats for raw response exports"""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        return "text/csv" if self is ExportFormat.CSV else "application/x-ndjson"
@@ -0,0 +1,39 @@
+from typing import List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from app.models.invitation import InvitationStatus
+
+
+class InvitationItem(BaseModel):
+    """Delivery status of one team member's invitation"""
+    teamMemberId: str = Field(..., description="Team member UUID")
+    name: str = Field(..., description="Team member full name")
+    email: str = Field(..., description="Team member email")
+    status: InvitationStatus = Field(..., description="Delivery status")
+    attempts: int = Field(..., description="Delivery attempts made so far")
+    lastError: Optional[str] = Field(None, description="Error of the latest failed attempt")
+    nextAttemptAt: Optional[datetime] = Field(None, description="Time of the next attempt while pending")
+    sentAt: Optional[datetime] = Field(None, description="Delivery timestamp")
+
+
+class InvitationSummary(BaseModel):
+    """Invitation counts per delivery status"""
+    pending: int
+    sending: int
+    sent: int
+    failed: int
+
+
+class SurveyInvitations(BaseModel):
+    """Invitation delivery status of a survey with a page of recipients"""
+    surveyId: str = Field(..., description="Survey UUID")
+    summary: InvitationSummary
+    items: List[InvitationItem]
+    nextCursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class SurveyInvitationsResponse(BaseModel):
+    """Response wrapper for survey invitations"""
+    success: bool = True
+    data: SurveyInvitations
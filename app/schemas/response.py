@@ -1,6 +1,6 @@
 from typing import List
 from uuid import UUID
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class ResponseSubmit(BaseModel):
@@ -8,7 +8,8 @@ class ResponseSubmit(BaseModel):
     questionId: str = Field(..., description="Question UUID")
     rating: int = Field(..., ge=1, le=5, description="Rating from 1 to 5")
 
-    @validator('rating')
+    @field_validator('rating')
+    @classmethod
     def validate_rating(cls, v):
         if not 1 <= v <= 5:
             raise ValueError('Rating must be between 1 and 5')
@@ -17,9 +18,10 @@ class ResponseSubmit(BaseModel):
 
 class SurveySubmission(BaseModel):
     """Complete survey submission (array of responses)"""
-    responses: List[ResponseSubmit] = Field(..., min_items=1, description="List of question responses")
+    responses: List[ResponseSubmit] = Field(..., min_length=1, description="List of question responses")
 
-    @validator('responses')
+    @field_validator('responses')
+    @classmethod
     def validate_responses(cls, v):
         if len(v) != 3:  # We have exactly 3 questions
             raise ValueError('Survey must contain exactly 3 responses')
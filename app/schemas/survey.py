@@ -13,7 +13,16 @@ class TeamMemberInput(BaseModel):
 class SurveyCreate(BaseModel):
     """Schema for creating a new survey (from frontend)"""
     managerId: str = Field(..., min_length=1, max_length=255, description="Manager identifier")
-    teamMembers: List[TeamMemberInput] = Field(..., min_items=1, max_items=10, description="List of team members")
+    teamMembers: List[TeamMemberInput] = Field(..., min_length=1, max_length=10, description="List of team members")
+    sendInvitations: bool = Field(
+        default=False,
+        description="Queue an invitation email with the survey link for every team member"
+    )
+
+
+class SurveyBulkCreate(BaseModel):
+    """Schema for creating many surveys at once, e.g. for an org-wide rollout"""
+    surveys: List[SurveyCreate] = Field(..., min_length=1, max_length=1000, description="Surveys to create")
 
 
 class TeamMemberWithLink(BaseModel):
@@ -31,6 +40,7 @@ class SurveyCreateData(BaseModel):
     """Data returned after creating survey"""
     surveyId: str = Field(..., description="Survey UUID")
     teamMembers: List[TeamMemberWithLink] = Field(..., description="Team members with generated links")
+    invitationsQueued: int = Field(default=0, description="Invitation emails queued for background delivery")
 
 
 class SurveyResponse(BaseModel):
@@ -39,6 +49,26 @@ class SurveyResponse(BaseModel):
     data: SurveyCreateData
 
 
+class SurveyBulkCreateData(SurveyCreateData):
+    """Data returned for one survey of a bulk creation"""
+    managerId: str = Field(..., description="Manager identifier")
+
+
+class SurveyBulkResponse(BaseModel):
+    """Response wrapper for bulk survey creation, in request order"""
+    success: bool = True
+    data: List[SurveyBulkCreateData]
+
+
+class SurveySummary(BaseModel):
+    """Survey listing entry"""
+    surveyId: str = Field(..., description="Survey UUID")
+    managerId: str = Field(..., description="Manager identifier")
+    title: str = Field(..., description="Survey title")
+    status: str = Field(..., description="Survey status")
+    createdAt: datetime = Field(..., description="Creation timestamp")
+
+
 class SurveyQuestion(BaseModel):
     """Survey question schema"""
     id: str = Field(..., description="Question UUID")
@@ -52,6 +82,12 @@ class SurveyQuestion(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SurveyQuestionsResponse(BaseModel):
+    """Response wrapper for the survey questions"""
+    success: bool = True
+    data: List[SurveyQuestion]
+
+
 class SurveyData(BaseModel):
     """Survey data for team member view (GET /survey/{token})"""
     surveyTitle: str = Field(default="Leadership Feedback Survey", description="Survey title")
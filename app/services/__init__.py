@@ -5,10 +5,15 @@ Service layer for business logic
 from .survey_service import SurveyService
 from .response_service import ResponseService
 from .analytics_service import AnalyticsService
+from .export_service import ExportService
+from .ratings_engine import RatingsEngine, RatingsGroupBy
 
 __all__ = [
     "SurveyService",
     "ResponseService",
-    "AnalyticsService"
+    "AnalyticsService",
+    "ExportService",
+    "RatingsEngine",
+    "RatingsGroupBy"
 ]
 
@@ -1,14 +1,39 @@
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
+from app.config import settings
+from app.core.benchmark import BenchmarkIndex
+from app.core.confidence import ConfidenceIntervals
+from app.models.analytics_snapshot import SurveyAnalyticsSnapshot
 from app.repositories.survey import SurveyRepository
 from app.repositories.team_member import TeamMemberRepository
 from app.repositories.response import ResponseRepository
+from app.repositories.analytics_snapshot import AnalyticsSnapshotRepository
 from app.schemas.analytics import (
+    ConfidenceInterval,
     SurveyAnalytics,
+    SurveyAnalyticsBatch,
     QuestionAnalytics,
-    ProgressSummary
+    ProgressSummary,
+    ManagerTrend,
+    QuestionTrend,
+    TrendPoint,
+    SubmissionCurvePoint,
+    SurveyTiming,
+    TimeToCompleteBucket,
+    TimingGranularity
 )
+from app.utils.statistics import (
+    RATING_SCALE,
+    box_percentage,
+    histogram_median,
+    histogram_std,
+    moving_average
+)
+
+# Upper bounds of the time-to-complete buckets: 1h, 6h, 1d, 3d, 1w and beyond
+TIME_TO_COMPLETE_EDGES_HOURS = [1, 6, 24, 72, 168]
 
 
 class AnalyticsService:
@@ -18,57 +43,218 @@ class AnalyticsService:
             self,
             survey_repo: SurveyRepository,
             team_member_repo: TeamMemberRepository,
-            response_repo: ResponseRepository
+            response_repo: ResponseRepository,
+            snapshot_repo: AnalyticsSnapshotRepository,
+            benchmark_index: BenchmarkIndex,
+            confidence_intervals: ConfidenceIntervals,
+            min_responses: int = settings.ANONYMITY_MIN_RESPONSES
     ):
         self.survey_repo = survey_repo
         self.team_member_repo = team_member_repo
         self.response_repo = response_repo
+        self.snapshot_repo = snapshot_repo
+        self.benchmark_index = benchmark_index
+        self.confidence_intervals = confidence_intervals
+        self.min_responses = min_responses
 
-    async def get_survey_analytics(self, survey_id: UUID) -> Optional[SurveyAnalytics]:
+    async def get_survey_analytics(
+            self,
+            survey_id: UUID,
+            include_confidence: bool = False
+    ) -> Optional[SurveyAnalytics]:
         """
         Calculate comprehensive analytics for a survey
 
+        Business Logic:
+        1. Serve completed surveys from their frozen analytics snapshot
+        2. Otherwise validate survey exists
+        3. Get completion statistics
+        4. Calculate question-level analytics and rating distributions
+        5. Suppress questions answered by fewer than the anonymity threshold
+        6. Rank question averages against the organization benchmark index
+        7. Optionally bootstrap confidence intervals from the distributions
+        8. Derive the overall average from the same aggregates
+        9. Return comprehensive analytics
+        """
+
+        snapshot = self.snapshot_repo.get_by_survey_id(survey_id)
+        if snapshot:
+            completion_stats = snapshot_completion_stats(snapshot)
+            question_analytics_data = snapshot.question_analytics
+        else:
+            # Validate survey exists
+            survey = self.survey_repo.get_by_id(survey_id)
+            if not survey:
+                return None
+
+            # Get completion statistics
+            completion_stats = self.team_member_repo.get_completion_stats(survey_id)
+
+            # Get question analytics (averages and histograms in one aggregate query)
+            question_analytics_data = self.response_repo.get_analytics_for_survey(survey_id)
+
+        self.benchmark_index.ensure_fresh()
+        intervals = [None] * len(question_analytics_data)
+        if include_confidence:
+            intervals = await self._confidence_intervals(
+                [qa_data["distribution"] for qa_data in question_analytics_data]
+            )
+
+        return self._build_survey_analytics(survey_id, completion_stats, question_analytics_data, intervals)
+
+    async def get_batch_analytics(
+            self,
+            survey_ids: List[UUID],
+            include_confidence: bool = False
+    ) -> SurveyAnalyticsBatch:
+        """
+        Calculate analytics for many surveys at once
+
+        Business Logic:
+        1. Load the frozen snapshots of completed surveys with one query
+        2. Get completion statistics of the other surveys with one grouped query
+        3. Report requested surveys that do not exist
+        4. Get question analytics of the other surveys with one grouped query
+        5. Optionally bootstrap confidence intervals for all questions at once
+        6. Build the analytics of each survey, in request order
+        """
+
+        # Duplicates are served once, in first-seen order
+        survey_ids = list(dict.fromkeys(survey_ids))
+
+        snapshots = self.snapshot_repo.get_by_survey_ids(survey_ids)
+        live_ids = [survey_id for survey_id in survey_ids if survey_id not in snapshots]
+
+        completion_stats = {
+            survey_id: snapshot_completion_stats(snapshot) for survey_id, snapshot in snapshots.items()
+        }
+        question_analytics_data = {
+            survey_id: snapshot.question_analytics for survey_id, snapshot in snapshots.items()
+        }
+        if live_ids:
+            live_stats = self.team_member_repo.get_completion_stats_for_surveys(live_ids)
+            completion_stats.update(live_stats)
+            if live_stats:
+                question_analytics_data.update(self.response_repo.get_analytics_for_surveys(list(live_stats)))
+
+        found_ids = [survey_id for survey_id in survey_ids if survey_id in completion_stats]
+        not_found = [str(survey_id) for survey_id in survey_ids if survey_id not in completion_stats]
+
+        self.benchmark_index.ensure_fresh()
+        intervals = {}
+        if include_confidence:
+            keys = [
+                (survey_id, index)
+                for survey_id in found_ids
+                for index in range(len(question_analytics_data.get(survey_id, [])))
+            ]
+            computed = await self._confidence_intervals([
+                question_analytics_data[survey_id][index]["distribution"] for survey_id, index in keys
+            ])
+            intervals = dict(zip(keys, computed))
+
+        surveys = []
+        for survey_id in found_ids:
+            survey_data = question_analytics_data.get(survey_id, [])
+            surveys.append(self._build_survey_analytics(
+                survey_id,
+                completion_stats[survey_id],
+                survey_data,
+                [intervals.get((survey_id, index)) for index in range(len(survey_data))]
+            ))
+
+        return SurveyAnalyticsBatch(surveys=surveys, notFound=not_found)
+
+    def _build_survey_analytics(
+            self,
+            survey_id: UUID,
+            completion_stats: dict,
+            question_analytics_data: List[dict],
+            intervals: List[Optional[ConfidenceInterval]]
+    ) -> SurveyAnalytics:
+        """Assemble survey analytics from completion stats and question aggregates"""
+        question_analytics = [
+            build_question_analytics(qa_data, self.benchmark_index, interval, self.min_responses)
+            for qa_data, interval in zip(question_analytics_data, intervals)
+        ]
+
+        # Overall average from the same aggregates, hidden if any question is suppressed
+        total_ratings = sum(qa_data["response_count"] for qa_data in question_analytics_data)
+        overall_average = None
+        if total_ratings and not any(qa.suppressed for qa in question_analytics):
+            overall_average = round(
+                sum(qa_data["rating_sum"] for qa_data in question_analytics_data) / total_ratings, 2
+            )
+
+        return SurveyAnalytics(
+            surveyId=str(survey_id),
+            totalMembers=completion_stats["total"],
+            completedResponses=completion_stats["completed"],
+            completionRate=round(completion_stats["completion_rate"], 2),
+            questionAnalytics=question_analytics,
+            overallAverage=overall_average,
+            anonymityThreshold=self.min_responses
+        )
+
+    async def get_survey_timing(
+            self,
+            survey_id: UUID,
+            granularity: TimingGranularity = TimingGranularity.HOUR
+    ) -> Optional[SurveyTiming]:
+        """
+        Calculate completion timing of a survey
+
         Business Logic:
         1. Validate survey exists
         2. Get completion statistics
-        3. Calculate question-level analytics
-        4. Calculate overall average
-        5. Return comprehensive analytics
+        3. Bucket the time from survey creation to each completion
+        4. Count completions per hour or day with cumulative completion rate
+        5. Return the timing analytics
         """
 
-        # Validate survey exists
         survey = self.survey_repo.get_by_id(survey_id)
         if not survey:
             return None
 
-        # Get completion statistics
         completion_stats = self.team_member_repo.get_completion_stats(survey_id)
+        timing = self.team_member_repo.get_time_to_complete(survey_id, TIME_TO_COMPLETE_EDGES_HOURS)
 
-        # Get question analytics
-        question_analytics_data = self.response_repo.get_analytics_for_survey(survey_id)
-
-        question_analytics = []
-        for qa_data in question_analytics_data:
-            question_analytic = QuestionAnalytics(
-                questionId=qa_data["question_id"],
-                questionText=qa_data["question_text"],
-                averageScore=round(qa_data["average_score"], 2),
-                responseCount=qa_data["response_count"]
+        edges = [0] + TIME_TO_COMPLETE_EDGES_HOURS + [None]
+        time_to_complete = [
+            TimeToCompleteBucket(
+                label=_hours_range_label(lower, upper),
+                minHours=lower,
+                maxHours=upper,
+                count=getattr(timing, f"bucket_{index}") or 0
             )
-            question_analytics.append(question_analytic)
+            for index, (lower, upper) in enumerate(zip(edges, edges[1:]))
+        ]
 
-        # Calculate overall average
-        overall_average = self.response_repo.get_overall_average_for_survey(survey_id)
-        if overall_average is not None:
-            overall_average = round(overall_average, 2)
+        submission_curve = []
+        cumulative = 0
+        for row in self.team_member_repo.get_completion_curve(survey_id, granularity.strftime_format):
+            cumulative += row.completed
+            submission_curve.append(SubmissionCurvePoint(
+                period=datetime.fromisoformat(row.period),
+                completed=row.completed,
+                cumulativeCompleted=cumulative,
+                cumulativeCompletionRate=round(cumulative / completion_stats["total"] * 100, 2)
+            ))
 
-        return SurveyAnalytics(
+        return SurveyTiming(
             surveyId=str(survey_id),
+            createdAt=survey.created_at,
             totalMembers=completion_stats["total"],
             completedResponses=completion_stats["completed"],
-            completionRate=round(completion_stats["completion_rate"], 2),
-            questionAnalytics=question_analytics,
-            overallAverage=overall_average
+            pending=completion_stats["pending"],
+            averageHoursToComplete=(
+                round(max(timing.average_hours, 0.0), 2) if timing.average_hours is not None else None
+            ),
+            firstCompletedAt=timing.first_completed_at,
+            lastCompletedAt=timing.last_completed_at,
+            timeToComplete=time_to_complete,
+            granularity=granularity,
+            submissionCurve=submission_curve
         )
 
     async def get_progress_summary(self, survey_id: UUID) -> Optional[ProgressSummary]:
@@ -122,3 +308,177 @@ class AnalyticsService:
             "overallCompletionRate": round(overall_completion_rate, 2),
             "surveys": survey_analytics
         }
+
+    async def get_manager_trend(
+            self,
+            manager_id: str,
+            window: int = 3,
+            include_confidence: bool = False
+    ) -> Optional[ManagerTrend]:
+        """
+        Calculate per-question trends across a manager's surveys
+
+        Business Logic:
+        1. Validate the manager has surveys
+        2. Get per-survey, per-question averages with one grouped query
+        3. Group the rows by question, keeping survey creation order
+        4. Suppress points answered by fewer than the anonymity threshold
+        5. Compute deltas to the previous shown point and a trailing moving
+           average over the shown points
+        6. Optionally bootstrap confidence intervals for every point at once
+        7. Return the trend per question
+        """
+
+        if window < 1:
+            raise ValueError("Moving average window must be at least 1")
+
+        if not self.survey_repo.manager_has_surveys(manager_id):
+            return None
+
+        rows = self.response_repo.get_manager_question_trend(manager_id)
+
+        intervals = {}
+        if include_confidence:
+            histograms = [[getattr(row, f"rating_{rating}") for rating in RATING_SCALE] for row in rows]
+            intervals = dict(zip(
+                ((row.survey_id, row.question_id) for row in rows),
+                await self._confidence_intervals(histograms)
+            ))
+
+        # Rows arrive ordered by survey creation, so each question's points are chronological
+        questions = {}
+        for row in rows:
+            question = questions.setdefault(str(row.question_id), {
+                "text": row.question_text,
+                "rows": []
+            })
+            question["rows"].append(row)
+
+        question_trends = []
+        for question_id, question in questions.items():
+            shown = [row for row in question["rows"] if row.response_count >= self.min_responses]
+            averages = [float(row.average_score) for row in shown]
+            moving = dict(zip((row.survey_id for row in shown), moving_average(averages, window)))
+
+            points = []
+            previous = None
+            for row in question["rows"]:
+                if row.response_count < self.min_responses:
+                    points.append(TrendPoint(
+                        surveyId=str(row.survey_id),
+                        createdAt=row.created_at,
+                        responseCount=row.response_count,
+                        suppressed=True
+                    ))
+                    continue
+
+                average = float(row.average_score)
+                points.append(TrendPoint(
+                    surveyId=str(row.survey_id),
+                    createdAt=row.created_at,
+                    responseCount=row.response_count,
+                    averageScore=round(average, 2),
+                    delta=round(average - previous, 2) if previous is not None else None,
+                    movingAverage=round(moving[row.survey_id], 2),
+                    confidenceInterval=intervals.get((row.survey_id, row.question_id))
+                ))
+                previous = average
+
+            question_trends.append(QuestionTrend(
+                questionId=question_id,
+                questionText=question["text"],
+                points=points
+            ))
+
+        return ManagerTrend(
+            managerId=manager_id,
+            window=window,
+            anonymityThreshold=self.min_responses,
+            surveyCount=len({row.survey_id for row in rows}),
+            questionTrends=question_trends
+        )
+
+    async def _confidence_intervals(self, histograms: List[List[int]]) -> List[Optional[ConfidenceInterval]]:
+        """
+        Bootstrap intervals for many histograms (process pool for large batches)
+
+        Histograms below the anonymity threshold are not resampled and get None.
+        """
+        shown = [index for index, counts in enumerate(histograms) if sum(counts) >= self.min_responses]
+        intervals = [None] * len(histograms)
+        for index, interval in zip(shown, await self.confidence_intervals.intervals(
+                [histograms[index] for index in shown]
+        )):
+            intervals[index] = interval
+
+        return [
+            ConfidenceInterval(
+                lower=round(interval[0], 2),
+                upper=round(interval[1], 2),
+                level=self.confidence_intervals.level
+            ) if interval else None
+            for interval in intervals
+        ]
+
+
+def _hours_range_label(lower: float, upper: Optional[float]) -> str:
+    """Label a time-to-complete range, e.g. '<1h', '6h-1d' or '7d+'"""
+    def duration(hours: float) -> str:
+        return f"{hours:g}h" if hours < 24 else f"{hours / 24:g}d"
+
+    if upper is None:
+        return f"{duration(lower)}+"
+    if lower == 0:
+        return f"<{duration(upper)}"
+    return f"{duration(lower)}-{duration(upper)}"
+
+
+def snapshot_completion_stats(snapshot: SurveyAnalyticsSnapshot) -> dict:
+    """Completion statistics of a frozen snapshot, shaped like get_completion_stats"""
+    total = snapshot.total_members
+    completed = snapshot.completed_responses
+    return {
+        "total": total,
+        "completed": completed,
+        "pending": total - completed,
+        "completion_rate": (completed / total * 100) if total > 0 else 0
+    }
+
+
+def build_question_analytics(
+        qa_data: dict,
+        benchmark_index: BenchmarkIndex,
+        confidence_interval: Optional[ConfidenceInterval] = None,
+        min_responses: int = 0
+) -> QuestionAnalytics:
+    """
+    Build question analytics from one row of the aggregate query
+
+    Below ``min_responses`` only the response count is returned, since the
+    average and distribution of so few ratings expose individual answers.
+    """
+    if qa_data["response_count"] < min_responses:
+        return QuestionAnalytics(
+            questionId=qa_data["question_id"],
+            questionText=qa_data["question_text"],
+            responseCount=qa_data["response_count"],
+            suppressed=True
+        )
+
+    counts = qa_data["distribution"]
+
+    return QuestionAnalytics(
+        questionId=qa_data["question_id"],
+        questionText=qa_data["question_text"],
+        averageScore=round(qa_data["average_score"], 2),
+        responseCount=qa_data["response_count"],
+        ratingDistribution={str(rating): count for rating, count in zip(RATING_SCALE, counts)},
+        standardDeviation=round(histogram_std(
+            qa_data["response_count"], qa_data["rating_sum"], qa_data["rating_sum_squares"]
+        ), 2),
+        median=histogram_median(counts),
+        topBoxPercentage=round(box_percentage(counts, (4, 5)), 2),
+        bottomBoxPercentage=round(box_percentage(counts, (1, 2)), 2),
+        benchmarkPercentile=benchmark_index.percentile(qa_data["question_id"], qa_data["average_score"]),
+        confidenceInterval=confidence_interval
+    )
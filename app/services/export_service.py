@@ -0,0 +1,118 @@
+"""
+Raw response export business logic service
+"""
+import csv
+import io
+import json
+import zlib
+from typing import Callable, Iterator, List, Optional
+from uuid import UUID
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.session import create_database_session
+from app.repositories.response import ResponseRepository
+from app.repositories.survey import SurveyRepository
+from app.schemas.export import ExportFormat
+
+EXPORT_COLUMNS = ["surveyId", "managerId", "questionId", "questionOrder", "rating"]
+
+
+class ExportService:
+    """Service for streaming raw survey responses as CSV or NDJSON"""
+
+    def __init__(
+            self,
+            survey_repo: SurveyRepository,
+            session_factory: Callable[[], Session] = create_database_session,
+            batch_size: int = 1000,
+            min_responses: int = settings.ANONYMITY_MIN_RESPONSES
+    ):
+        self.survey_repo = survey_repo
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.min_responses = min_responses
+
+    async def survey_exists(self, survey_id: UUID) -> bool:
+        """Check the survey exists before a stream is started"""
+        return self.survey_repo.get_by_id(survey_id) is not None
+
+    async def manager_exists(self, manager_id: str) -> bool:
+        """Check the manager owns surveys before a stream is started"""
+        return self.survey_repo.manager_has_surveys(manager_id)
+
+    def stream_responses(
+            self,
+            export_format: ExportFormat,
+            survey_id: Optional[UUID] = None,
+            manager_id: Optional[str] = None,
+            compress: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Yield encoded export chunks, one per database batch
+
+        Business Logic:
+        1. Open a dedicated session, since the stream outlives the request scope
+        2. Fetch rows batch by batch from the cursor, skipping surveys below
+           the anonymity threshold
+        3. Encode each batch as CSV or NDJSON
+        4. Optionally gzip the chunks on the fly
+        """
+        encode = _encode_csv if export_format is ExportFormat.CSV else _encode_ndjson
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+        def emit(chunk: bytes) -> bytes:
+            return compressor.compress(chunk) if compressor else chunk
+
+        db = self.session_factory()
+        try:
+            response_repo = ResponseRepository(db)
+
+            if export_format is ExportFormat.CSV:
+                yield emit(_encode_csv_header())
+
+            for batch in response_repo.stream_export_rows(
+                    survey_id=survey_id,
+                    manager_id=manager_id,
+                    batch_size=self.batch_size,
+                    min_responses=self.min_responses
+            ):
+                chunk = emit(encode(batch))
+                if chunk:
+                    yield chunk
+
+            if compressor:
+                yield compressor.flush()
+        finally:
+            db.close()
+
+
+def _export_values(row: Row) -> list:
+    return [
+        str(row.survey_id),
+        row.manager_id,
+        str(row.question_id),
+        row.question_order,
+        row.rating
+    ]
+
+
+def _encode_csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_COLUMNS)
+    return buffer.getvalue().encode()
+
+
+def _encode_csv(batch: List[Row]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(_export_values(row) for row in batch)
+    return buffer.getvalue().encode()
+
+
+def _encode_ndjson(batch: List[Row]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, _export_values(row)))) + "\n"
+        for row in batch
+    ).encode()
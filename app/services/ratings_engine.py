@@ -0,0 +1,313 @@
+"""
+Columnar in-memory ratings engine for cross-survey analytics
+"""
+import threading
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.database.session import create_database_session
+from app.repositories.response import ResponseRepository
+from app.utils.statistics import RATING_SCALE
+
+EPOCH = date(1970, 1, 1)
+
+
+class RatingsGroupBy(str, Enum):
+    """Dimensions the ratings engine can group by"""
+    MANAGER = "manager"
+    SURVEY = "survey"
+    QUESTION = "question"
+    MONTH = "month"
+
+
+class RatingsEngine:
+    """
+    Array-backed snapshot of every rating, answering grouped aggregates.
+
+    Each rating is one slot in four parallel columns: survey index (uint32),
+    question index (uint8), rating (uint8) and submission day since the epoch
+    (uint16), about 8 bytes per rating. Surveys map to managers through a
+    separate uint32 column, so grouping by manager, survey, question or month
+    is a mask plus ``np.bincount`` over the whole snapshot.
+
+    The snapshot is loaded from SQLite in bulk on first use and kept current
+    by appending submissions as they are stored. A load builds new columns
+    outside the lock and swaps them in at the end; submissions recorded
+    while it runs are buffered and replayed unless the load already read
+    them. numpy is only imported and the columns only allocated by the first
+    load, so processes that never serve cross-survey analytics do not pay
+    for either.
+    """
+
+    # Attributes making up one snapshot, swapped in as a whole by load()
+    _SNAPSHOT_STATE = (
+        "_size", "_survey_col", "_question_col", "_rating_col", "_day_col", "_survey_manager",
+        "_survey_index", "_survey_ids", "_manager_index", "_manager_ids", "_question_index", "_question_ids"
+    )
+
+    def __init__(self, initial_capacity: int = 1 << 16):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        # (team_member_id, survey_id hex, manager_id, ratings, day) recorded during a load
+        self._pending: Optional[List[tuple]] = None
+        self._size = 0
+        self._initial_capacity = initial_capacity
+
+        self._survey_index: Dict[str, int] = {}
+        self._survey_ids: List[str] = []
+        self._manager_index: Dict[str, int] = {}
+        self._manager_ids: List[str] = []
+        self._question_index: Dict[str, int] = {}
+        self._question_ids: List[str] = []
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def is_tracking(self) -> bool:
+        """Whether submissions are recorded, i.e. the snapshot is loaded or loading"""
+        return self._loaded or self._pending is not None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def question_count(self) -> int:
+        return len(self._question_ids)
+
+    def _allocate(self, capacity: int):
+        import numpy as np
+
+        self._survey_col = np.zeros(capacity, dtype=np.uint32)
+        self._question_col = np.zeros(capacity, dtype=np.uint8)
+        self._rating_col = np.zeros(capacity, dtype=np.uint8)
+        self._day_col = np.zeros(capacity, dtype=np.uint16)
+
+    def _reserve(self, extra: int):
+        """Grow the columns geometrically so appends stay amortized O(1)"""
+        import numpy as np
+
+        needed = self._size + extra
+        capacity = len(self._rating_col)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_survey_col", "_question_col", "_rating_col", "_day_col"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def _intern_manager(self, manager_id: str) -> int:
+        index = self._manager_index.get(manager_id)
+        if index is None:
+            index = self._manager_index[manager_id] = len(self._manager_ids)
+            self._manager_ids.append(manager_id)
+        return index
+
+    def _intern_survey(self, survey_id: str, manager_id: str) -> int:
+        index = self._survey_index.get(survey_id)
+        if index is None:
+            index = self._survey_index[survey_id] = len(self._survey_ids)
+            self._survey_ids.append(survey_id)
+            if index >= len(self._survey_manager):
+                import numpy as np
+
+                grown = np.zeros(max(2 * len(self._survey_manager), 1024), dtype=np.uint32)
+                grown[:index] = self._survey_manager[:index]
+                self._survey_manager = grown
+            self._survey_manager[index] = self._intern_manager(manager_id)
+        return index
+
+    def _intern_question(self, question_id: str) -> int:
+        index = self._question_index.get(question_id)
+        if index is None:
+            index = self._question_index[question_id] = len(self._question_ids)
+            self._question_ids.append(question_id)
+        return index
+
+    def load(self, session_factory: Callable[[], Session] = create_database_session):
+        """(Re)load the whole snapshot from the database in bulk"""
+        with self._load_lock:
+            self._load(session_factory)
+
+    def ensure_loaded(self, session_factory: Callable[[], Session] = create_database_session):
+        """Load the snapshot on first use"""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load(session_factory)
+
+    def _load(self, session_factory: Callable[[], Session]):
+        import numpy as np
+
+        with self._lock:
+            self._pending = []
+
+        snapshot = RatingsEngine(self._initial_capacity)
+        snapshot._allocate(self._initial_capacity)
+        snapshot._survey_manager = np.zeros(0, dtype=np.uint32)
+
+        db = session_factory()
+        try:
+            response_repo = ResponseRepository(db)
+            # Rows inserted later have a higher rowid, so this fixes what the load reads
+            max_rowid = response_repo.get_max_rowid()
+
+            for batch in response_repo.stream_rating_columns(max_rowid):
+                count = len(batch)
+                snapshot._reserve(count)
+                end = snapshot._size + count
+                survey_ids, manager_ids, question_ids, ratings, days = zip(*batch)
+                snapshot._survey_col[snapshot._size:end] = [
+                    snapshot._intern_survey(survey_id, manager_id)
+                    for survey_id, manager_id in zip(survey_ids, manager_ids)
+                ]
+                snapshot._question_col[snapshot._size:end] = [snapshot._intern_question(q) for q in question_ids]
+                snapshot._rating_col[snapshot._size:end] = ratings
+                snapshot._day_col[snapshot._size:end] = days
+                snapshot._size = end
+
+            # Replay submissions recorded meanwhile that the load did not read;
+            # the final round finds nothing new and swaps under the same lock
+            while True:
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                    if not pending:
+                        for name in self._SNAPSHOT_STATE:
+                            setattr(self, name, getattr(snapshot, name))
+                        self._pending = None
+                        self._loaded = True
+                        return
+
+                read = {
+                    team_member_id.hex
+                    for team_member_id in response_repo.get_team_members_with_responses(
+                        [submission[0] for submission in pending], max_rowid
+                    )
+                }
+                for team_member_id, *submission in pending:
+                    if team_member_id.hex not in read:
+                        snapshot._append(*submission)
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+        finally:
+            db.close()
+
+    def _append(self, survey_id: str, manager_id: str, ratings: Dict[UUID, int], day: int):
+        survey_index = self._intern_survey(survey_id, manager_id)
+        self._reserve(len(ratings))
+        for question_id, rating in ratings.items():
+            self._survey_col[self._size] = survey_index
+            self._question_col[self._size] = self._intern_question(question_id.hex)
+            self._rating_col[self._size] = rating
+            self._day_col[self._size] = day
+            self._size += 1
+
+    def record_submission(
+            self,
+            team_member_id: UUID,
+            survey_id: UUID,
+            manager_id: str,
+            ratings: Dict[UUID, int],
+            submitted_at: Optional[datetime] = None
+    ):
+        """Append one team member's ratings once they are stored"""
+        day = ((submitted_at or datetime.now(timezone.utc)).date() - EPOCH).days
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((team_member_id, survey_id.hex, manager_id, ratings, day))
+            if self._loaded:
+                self._append(survey_id.hex, manager_id, ratings, day)
+
+    def aggregate(
+            self,
+            group_by: RatingsGroupBy,
+            question_id: Optional[UUID] = None,
+            manager_id: Optional[str] = None,
+            since: Optional[date] = None,
+            until: Optional[date] = None
+    ) -> List[dict]:
+        """
+        Count, average and 1-5 distribution of ratings per group
+
+        Filters are combined into one boolean mask, group keys are computed
+        for the masked rows and every statistic comes from a single
+        ``np.bincount`` over ``key * 5 + (rating - 1)``.
+        """
+        import numpy as np
+
+        if not self._loaded:
+            return []
+        with self._lock:
+            size = self._size
+            surveys = self._survey_col[:size]
+            questions = self._question_col[:size]
+            ratings = self._rating_col[:size]
+            days = self._day_col[:size]
+            survey_manager = self._survey_manager[:len(self._survey_ids)]
+
+        mask = np.ones(size, dtype=bool)
+        if question_id is not None:
+            question_index = self._question_index.get(question_id.hex)
+            if question_index is None:
+                return []
+            mask &= questions == question_index
+        if manager_id is not None:
+            manager_index = self._manager_index.get(manager_id)
+            if manager_index is None:
+                return []
+            mask &= survey_manager[surveys] == manager_index
+        if since is not None:
+            mask &= days >= (since - EPOCH).days
+        if until is not None:
+            mask &= days <= (until - EPOCH).days
+
+        if group_by is RatingsGroupBy.MANAGER:
+            keys = survey_manager[surveys[mask]].astype(np.int64)
+            label_of = self._manager_ids.__getitem__
+        elif group_by is RatingsGroupBy.SURVEY:
+            keys = surveys[mask].astype(np.int64)
+            label_of = lambda key: str(UUID(hex=self._survey_ids[key]))
+        elif group_by is RatingsGroupBy.QUESTION:
+            keys = questions[mask].astype(np.int64)
+            label_of = lambda key: str(UUID(hex=self._question_ids[key]))
+        else:
+            months = days[mask].astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+            first_month = int(months.min()) if len(months) else 0
+            keys = months - first_month
+            label_of = lambda key: str(np.datetime64(first_month + key, "M"))
+
+        group_count = int(keys.max()) + 1 if len(keys) else 0
+        scale = len(RATING_SCALE)
+        histogram = np.bincount(
+            keys * scale + (ratings[mask].astype(np.int64) - RATING_SCALE[0]),
+            minlength=group_count * scale
+        ).reshape(group_count, scale)
+
+        counts = histogram.sum(axis=1)
+        sums = histogram @ np.asarray(RATING_SCALE)
+
+        groups = []
+        for key in np.flatnonzero(counts).tolist():
+            groups.append({
+                "key": label_of(key),
+                "response_count": int(counts[key]),
+                "average_score": float(sums[key] / counts[key]),
+                "distribution": histogram[key].tolist()
+            })
+        return groups
+
+
+ratings_engine = RatingsEngine()
@@ -0,0 +1,147 @@
+"""
+Reminder business logic service for team members who have not completed their survey
+"""
+import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.mail import EmailSender, OutgoingEmail
+from app.database.session import create_database_session
+from app.repositories.team_member import TeamMemberRepository
+from app.utils.link_generator import build_survey_link
+
+
+@dataclass(frozen=True)
+class Reminder:
+    """One reminder to deliver to a pending team member"""
+    team_member_id: UUID
+    name: str
+    email: str
+    survey_title: str
+    survey_link: str
+
+    def to_email(self) -> OutgoingEmail:
+        return OutgoingEmail(
+            reference=str(self.team_member_id),
+            to=self.email,
+            subject=f"Reminder: {self.survey_title}",
+            body=(
+                f"Hi {self.name},\n\n"
+                f"Your anonymous feedback for \"{self.survey_title}\" is still pending.\n"
+                f"It only takes a minute: {self.survey_link}\n"
+            )
+        )
+
+
+class ReminderService:
+    """Service for reminding pending team members of active surveys"""
+
+    def __init__(
+            self,
+            sender: EmailSender,
+            session_factory: Callable[[], Session] = create_database_session,
+            interval: timedelta = timedelta(hours=settings.REMINDER_INTERVAL_HOURS),
+            page_size: int = settings.REMINDER_PAGE_SIZE,
+            batch_size: int = settings.REMINDER_BATCH_SIZE,
+            concurrency: int = settings.REMINDER_CONCURRENCY
+    ):
+        self.sender = sender
+        self.session_factory = session_factory
+        self.interval = interval
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+    async def send_reminders(self, limit: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Remind every pending member not reminded within the interval
+
+        Business Logic:
+        1. Stream pending members of active surveys in keyset pages of lean rows
+        2. Render each member's survey link
+        3. Deliver batches through the sender, at most ``concurrency`` at a time
+        4. Record last_reminded_at for each delivered member, so an interrupted
+           or repeated run only picks up members still due
+        5. Return delivery counts
+        """
+        now = datetime.now(timezone.utc)
+        reminded_before = now - self.interval
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stats = {"pages": 0, "sent": 0, "failed": 0}
+
+        db = self.session_factory()
+        try:
+            team_member_repo = TeamMemberRepository(db)
+            db_lock = threading.Lock()
+
+            def fetch_page(after):
+                with db_lock:
+                    return team_member_repo.get_pending_reminder_page(self.page_size, after, reminded_before)
+
+            def mark_reminded(ids: List[UUID]):
+                with db_lock:
+                    team_member_repo.mark_reminded(ids, now)
+
+            async def deliver(batch: List[Reminder]):
+                async with semaphore:
+                    if dry_run:
+                        stats["sent"] += len(batch)
+                        return
+                    try:
+                        failures = await asyncio.to_thread(
+                            self.sender.send_batch, [reminder.to_email() for reminder in batch]
+                        )
+                    except Exception:
+                        stats["failed"] += len(batch)
+                        return
+
+                    delivered = [
+                        reminder.team_member_id for reminder in batch
+                        if str(reminder.team_member_id) not in failures
+                    ]
+                    if delivered:
+                        await asyncio.to_thread(mark_reminded, delivered)
+                    stats["sent"] += len(delivered)
+                    stats["failed"] += len(batch) - len(delivered)
+
+            after = None
+            remaining = limit
+            while remaining is None or remaining > 0:
+                rows = await asyncio.to_thread(fetch_page, after)
+                if not rows:
+                    break
+                if remaining is not None:
+                    rows = rows[:remaining]
+                    remaining -= len(rows)
+
+                stats["pages"] += 1
+                after = (rows[-1].created_at, rows[-1].id)
+
+                reminders = [
+                    Reminder(
+                        team_member_id=row.id,
+                        name=row.name,
+                        email=row.email,
+                        survey_title=row.survey_title,
+                        survey_link=build_survey_link(row.unique_link)
+                    )
+                    for row in rows
+                ]
+                await asyncio.gather(*(
+                    deliver(reminders[start:start + self.batch_size])
+                    for start in range(0, len(reminders), self.batch_size)
+                ))
+
+                if len(rows) < self.page_size:
+                    break
+        finally:
+            db.close()
+            self.sender.close()
+
+        return stats
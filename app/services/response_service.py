@@ -2,10 +2,14 @@ from typing import List
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 
+from app.core.analytics_worker import AnalyticsWorker
+from app.core.question_catalog import QuestionCatalog
+from app.models.survey import SurveyStatus
 from app.repositories.response import ResponseRepository
 from app.repositories.team_member import TeamMemberRepository
 from app.repositories.question import QuestionRepository
 from app.schemas.response import SurveySubmission, ResponseData
+from app.services.ratings_engine import RatingsEngine
 
 
 class ResponseService:
@@ -15,11 +19,17 @@ class ResponseService:
             self,
             response_repo: ResponseRepository,
             team_member_repo: TeamMemberRepository,
-            question_repo: QuestionRepository
+            question_repo: QuestionRepository,
+            analytics_worker: AnalyticsWorker,
+            ratings_engine: RatingsEngine,
+            question_catalog: QuestionCatalog
     ):
         self.response_repo = response_repo
         self.team_member_repo = team_member_repo
         self.question_repo = question_repo
+        self.analytics_worker = analytics_worker
+        self.ratings_engine = ratings_engine
+        self.question_catalog = question_catalog
 
     async def submit_survey_response(self, token: str, submission: SurveySubmission) -> ResponseData:
         """
@@ -27,11 +37,14 @@ class ResponseService:
 
         Business Logic:
         1. Find team member by token
-        2. Validate team member exists and hasn't completed survey
+        2. Validate team member exists, hasn't completed the survey and the
+           survey is still active
         3. Validate all question IDs exist
         4. Create response records
         5. Mark team member as completed
-        6. Return success message
+        6. Queue the survey for finalization if this was the last member
+        7. Append the ratings to the in-memory ratings engine
+        8. Return success message
         """
 
         # Find team member by token
@@ -43,12 +56,16 @@ class ResponseService:
         if team_member.has_completed:
             raise ValueError("Survey has already been completed")
 
+        # Only active surveys accept answers; completed ones are read-only
+        if team_member.survey.status != SurveyStatus.ACTIVE:
+            raise ValueError("Survey is no longer accepting responses")
+
         # Validate team member hasn't submitted responses before
         if self.response_repo.team_member_has_responses(team_member.id):
             raise ValueError("Responses have already been submitted for this survey")
 
         # Validate all question IDs exist
-        all_questions = self.question_repo.get_all_ordered()
+        all_questions = self.question_catalog.get_ordered(self.question_repo)
         valid_question_ids = {str(q.id) for q in all_questions}
 
         submitted_question_ids = {response.questionId for response in submission.responses}
@@ -81,6 +98,18 @@ class ResponseService:
         # Mark team member as completed
         self.team_member_repo.mark_as_completed(team_member.id)
 
+        # The background worker marks the survey completed and freezes its analytics
+        if self.team_member_repo.count_pending(team_member.survey_id) == 0:
+            self.analytics_worker.enqueue(team_member.survey_id)
+
+        if self.ratings_engine.is_tracking:
+            self.ratings_engine.record_submission(
+                team_member.id,
+                team_member.survey_id,
+                team_member.survey.manager_id,
+                {data["question_id"]: data["rating"] for data in responses_data}
+            )
+
         return ResponseData(message="Survey submitted successfully")
 
     async def get_team_member_responses(self, token: str) -> List[dict]:
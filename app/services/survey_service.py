@@ -3,21 +3,33 @@
 """
 Survey business logic service
 """
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 
+from app.core.invitation_worker import InvitationWorker
+from app.core.question_catalog import QuestionCatalog, to_survey_questions
+from app.core.survey_page_cache import SurveyPageCache, render_survey_page
+from app.models.invitation import InvitationStatus
+from app.models.survey import SurveyStatus
 from app.repositories.survey import SurveyRepository
 from app.repositories.team_member import TeamMemberRepository
 from app.repositories.question import QuestionRepository
+from app.repositories.invitation import InvitationRepository
 from app.schemas.survey import (
+    SurveyBulkCreate,
+    SurveyBulkCreateData,
     SurveyCreate,
     SurveyCreateData,
+    SurveyQuestion,
     TeamMemberWithLink,
-    SurveyData,
-    SurveyQuestion
+    SurveySummary
 )
-from app.utils.link_generator import generate_unique_token
+from app.schemas.common import Page
+from app.schemas.invitation import InvitationItem, InvitationSummary, SurveyInvitations
+from app.utils.link_generator import build_survey_link, generate_unique_token, generate_unique_tokens
+from app.utils.pagination import decode_cursor, split_page
 from app.config import get_settings
 
 settings = get_settings()
@@ -30,11 +42,19 @@ class SurveyService:
             self,
             survey_repo: SurveyRepository,
             team_member_repo: TeamMemberRepository,
-            question_repo: QuestionRepository
+            question_repo: QuestionRepository,
+            invitation_repo: InvitationRepository,
+            invitation_worker: InvitationWorker,
+            question_catalog: QuestionCatalog,
+            survey_page_cache: SurveyPageCache
     ):
         self.survey_repo = survey_repo
         self.team_member_repo = team_member_repo
         self.question_repo = question_repo
+        self.invitation_repo = invitation_repo
+        self.invitation_worker = invitation_worker
+        self.question_catalog = question_catalog
+        self.survey_page_cache = survey_page_cache
 
     async def create_survey(self, survey_data: SurveyCreate) -> SurveyCreateData:
         """
@@ -45,11 +65,13 @@ class SurveyService:
         2. Create survey record
         3. Generate unique links for each team member
         4. Create team member records
-        5. Return survey data with links
+        5. Optionally queue one invitation per member in the outbox and wake
+           the invitation worker; delivery happens in the background
+        6. Return survey data with links
         """
 
         # Validate we have the required questions
-        question_count = self.question_repo.count_questions()
+        question_count = len(self.question_catalog.get_ordered(self.question_repo))
         if question_count != 3:
             raise ValueError(f"System must have exactly 3 questions, found {question_count}")
 
@@ -85,9 +107,9 @@ class SurveyService:
         # Build response data with survey links
         team_members_with_links = []
         for team_member in created_team_members:
-            survey_link = f"{settings.FRONTEND_URL}/survey/{team_member.unique_link}"
+            survey_link = build_survey_link(team_member.unique_link, settings.FRONTEND_URL)
 
-            team_member_response = TeamMemberWithLink(
+            team_member_response = TeamMemberWithLink.model_construct(
                 id=str(team_member.id),
                 name=team_member.name,
                 email=team_member.email,
@@ -96,86 +118,296 @@ class SurveyService:
             )
             team_members_with_links.append(team_member_response)
 
-        return SurveyCreateData(
+        invitations_queued = 0
+        if survey_data.sendInvitations:
+            invitations_queued = self.invitation_repo.enqueue(
+                survey_id,
+                [team_member.id for team_member in created_team_members],
+                datetime.now(timezone.utc)
+            )
+            self.invitation_worker.notify()
+
+        return SurveyCreateData.model_construct(
             surveyId=str(created_survey.id),
-            teamMembers=team_members_with_links
+            teamMembers=team_members_with_links,
+            invitationsQueued=invitations_queued
         )
 
-    async def get_survey_by_token(self, token: str) -> Optional[SurveyData]:
+    async def create_surveys_bulk(self, bulk_data: SurveyBulkCreate) -> List[SurveyBulkCreateData]:
         """
-        Get survey data for a team member by their unique token
+        Create many surveys with their team members in one transaction
 
         Business Logic:
-        1. Find team member by unique link token
-        2. Check if survey exists and is active
-        3. Get all questions ordered
-        4. Return survey data for completion
+        1. Validate we have exactly 3 questions in database, once for the batch
+        2. Generate the tokens of every team member in one batched pass
+        3. Insert all surveys, team members and requested invitations with
+           set-based INSERTs and a single commit
+        4. Wake the invitation worker if invitations were queued
+        5. Return one entry per survey, in request order, with its links
+        """
+        question_count = len(self.question_catalog.get_ordered(self.question_repo))
+        if question_count != 3:
+            raise ValueError(f"System must have exactly 3 questions, found {question_count}")
+
+        now = datetime.now(timezone.utc)
+        tokens = iter(generate_unique_tokens(
+            sum(len(survey.teamMembers) for survey in bulk_data.surveys)
+        ))
+
+        surveys_data = []
+        team_members_data = []
+        invitations_data = []
+        created = []
+        for survey in bulk_data.surveys:
+            survey_id = uuid4()
+            surveys_data.append({
+                "id": survey_id,
+                "manager_id": survey.managerId,
+                "title": "Leadership Feedback Survey",
+                "description": "Anonymous feedback survey for leadership effectiveness",
+                "status": SurveyStatus.ACTIVE,
+                "created_at": now
+            })
+
+            team_member_ids = []
+            team_members = []
+            for member in survey.teamMembers:
+                team_member_id = uuid4()
+                team_member_ids.append(team_member_id)
+                unique_token = next(tokens)
+                team_members_data.append({
+                    "id": team_member_id,
+                    "survey_id": survey_id,
+                    "name": member.name,
+                    "email": member.email,
+                    "unique_link": unique_token,
+                    "has_completed": False,
+                    "created_at": now
+                })
+                team_members.append(TeamMemberWithLink.model_construct(
+                    id=str(team_member_id),
+                    name=member.name,
+                    email=member.email,
+                    surveyLink=build_survey_link(unique_token, settings.FRONTEND_URL),
+                    hasCompleted=False
+                ))
+
+            invitations_queued = 0
+            if survey.sendInvitations:
+                rows = self.invitation_repo.pending_rows(survey_id, team_member_ids, now)
+                invitations_data.extend(rows)
+                invitations_queued = len(rows)
+
+            created.append(SurveyBulkCreateData.model_construct(
+                surveyId=str(survey_id),
+                teamMembers=team_members,
+                invitationsQueued=invitations_queued,
+                managerId=survey.managerId
+            ))
+
+        self.survey_repo.create_bulk(surveys_data, team_members_data, invitations_data)
+        if invitations_data:
+            self.invitation_worker.notify()
+
+        return created
+
+    async def get_survey_by_token(self, token: str) -> Optional[bytes]:
+        """
+        Get the survey page of a team member by their unique token, as JSON bytes
+
+        Business Logic:
+        1. Find the team member's survey, name and completion flag by token
+        2. Serve the survey's pre-rendered page from the page cache
+        3. On a miss, check the survey exists and is active or completed (a
+           completed survey is shown read-only, every member having answered),
+           then render its title, description and ordered questions once and
+           cache them
+        4. Splice the member's name and completion flag into the page
         """
 
         # Find team member by token
-        team_member = self.team_member_repo.get_by_unique_link(token)
+        team_member = self.team_member_repo.get_page_fields_by_unique_link(token)
         if not team_member:
             return None
 
-        # Get survey and validate it's active
-        survey = self.survey_repo.get_by_id(team_member.survey_id)
-        if not survey or survey.status != "active":
-            return None
+        questions = self.question_catalog.get_ordered(self.question_repo)
+        page = self.survey_page_cache.get(team_member.survey_id, questions)
+        if page is None:
+            # Get survey and validate it's open or finished
+            survey = self.survey_repo.get_by_id(team_member.survey_id)
+            if not survey or survey.status not in (SurveyStatus.ACTIVE, SurveyStatus.COMPLETED):
+                return None
 
-        # Get all questions ordered
-        questions = self.question_repo.get_all_ordered()
-        if len(questions) != 3:
-            raise ValueError("Survey must have exactly 3 questions")
-
-        # Convert questions to response format
-        survey_questions = []
-        for question in questions:
-            survey_question = SurveyQuestion(
-                id=str(question.id),
-                questionText=question.question_text,
-                questionOrder=question.question_order,
-                scaleMin=question.scale_min,
-                scaleMax=question.scale_max,
-                scaleMinLabel=question.scale_min_label,
-                scaleMaxLabel=question.scale_max_label
-            )
-            survey_questions.append(survey_question)
-
-        return SurveyData(
-            surveyTitle=survey.title,
-            description=survey.description,
-            teamMemberName=team_member.name,
-            hasCompleted=team_member.has_completed,
-            questions=survey_questions
-        )
+            if len(questions) != 3:
+                raise ValueError("Survey must have exactly 3 questions")
 
-    async def get_survey_status(self, survey_id: UUID) -> Optional[dict]:
-        """Get survey status and team member completion info"""
+            page = render_survey_page(survey.title, survey.description, questions)
+            self.survey_page_cache.put(team_member.survey_id, page)
 
-        survey = self.survey_repo.get_by_id(survey_id)
-        if not survey:
-            return None
+        return page.render(team_member.name, team_member.has_completed)
+
+    async def get_questions(self) -> List[SurveyQuestion]:
+        """
+        Get the predefined survey questions
+
+        Business Logic:
+        1. Load the ordered questions from the question catalog
+        2. Return them in response format
+        """
+        return to_survey_questions(self.question_catalog.get_ordered(self.question_repo))
+
+    async def get_survey_status(self, survey_id: UUID, pending_only: bool = False) -> Optional[dict]:
+        """
+        Get survey status and team member completion info
 
-        team_members = self.team_member_repo.get_by_survey_id(survey_id)
-        completion_stats = self.team_member_repo.get_completion_stats(survey_id)
+        Business Logic:
+        1. Load the survey status and lean member columns in one query
+        2. Count completed/pending members in the same pass
+        3. Optionally keep only pending members in the member list
+        """
+
+        rows = self.survey_repo.get_status_rows(survey_id)
+        if not rows:
+            return None
 
+        total = 0
+        completed = 0
         team_members_data = []
-        for member in team_members:
+        for row in rows:
+            if row.id is None:
+                continue
+
+            total += 1
+            if row.has_completed:
+                completed += 1
+                if pending_only:
+                    continue
+
             team_members_data.append({
-                "id": str(member.id),
-                "name": member.name,
-                "email": member.email,
-                "hasCompleted": member.has_completed,
-                "completedAt": None  # Could add timestamp if needed
+                "id": str(row.id),
+                "name": row.name,
+                "email": row.email,
+                "hasCompleted": row.has_completed,
+                # Never exposed: a named completion time can be matched to answers
+                "completedAt": None
             })
 
         return {
-            "surveyId": str(survey.id),
-            "status": survey.status,
+            "surveyId": str(survey_id),
+            "status": rows[0].status.value,
             "teamMembers": team_members_data,
             "progressSummary": {
-                "completed": completion_stats["completed"],
-                "pending": completion_stats["pending"],
-                "completionRate": completion_stats["completion_rate"]
+                "completed": completed,
+                "pending": total - completed,
+                "completionRate": (completed / total * 100) if total > 0 else 0
             }
         }
+
+    async def list_manager_surveys(
+            self,
+            manager_id: str,
+            limit: int,
+            cursor: Optional[str] = None
+    ) -> Page[SurveySummary]:
+        """
+        Get a page of a manager's surveys, oldest first
+
+        Business Logic:
+        1. Decode the cursor into the last (created_at, id) already returned
+        2. Fetch one extra row to know whether another page exists
+        3. Return the page with the cursor of its last survey
+        """
+        after = decode_cursor(cursor) if cursor else None
+        surveys = self.survey_repo.get_page_by_manager_id(manager_id, limit + 1, after)
+        surveys, next_cursor = split_page(surveys, limit)
+
+        return Page[SurveySummary](
+            items=[
+                SurveySummary(
+                    surveyId=str(survey.id),
+                    managerId=survey.manager_id,
+                    title=survey.title,
+                    status=survey.status.value,
+                    createdAt=survey.created_at
+                )
+                for survey in surveys
+            ],
+            nextCursor=next_cursor
+        )
+
+    async def list_team_members(
+            self,
+            survey_id: UUID,
+            limit: int,
+            cursor: Optional[str] = None
+    ) -> Optional[Page[TeamMemberWithLink]]:
+        """
+        Get a page of a survey's team members with their links, oldest first
+
+        Returns None if the survey does not exist.
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        if not self.survey_repo.get_by_id(survey_id):
+            return None
+
+        team_members = self.team_member_repo.get_page_by_survey_id(survey_id, limit + 1, after)
+        team_members, next_cursor = split_page(team_members, limit)
+
+        return Page[TeamMemberWithLink].model_construct(
+            items=[
+                TeamMemberWithLink.model_construct(
+                    id=str(team_member.id),
+                    name=team_member.name,
+                    email=team_member.email,
+                    surveyLink=build_survey_link(team_member.unique_link, settings.FRONTEND_URL),
+                    hasCompleted=team_member.has_completed
+                )
+                for team_member in team_members
+            ],
+            nextCursor=next_cursor
+        )
+
+    async def get_invitations(
+            self,
+            survey_id: UUID,
+            limit: int,
+            cursor: Optional[str] = None
+    ) -> Optional[SurveyInvitations]:
+        """
+        Get the invitation delivery status of a survey
+
+        Business Logic:
+        1. Count the survey's invitations per status
+        2. Fetch a keyset page of per-recipient delivery status
+        3. Return None if the survey does not exist
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        if not self.survey_repo.get_by_id(survey_id):
+            return None
+
+        counts = self.invitation_repo.get_status_counts(survey_id)
+        rows = self.invitation_repo.get_page_by_survey_id(survey_id, limit + 1, after)
+        rows, next_cursor = split_page(rows, limit)
+
+        return SurveyInvitations(
+            surveyId=str(survey_id),
+            summary=InvitationSummary(**{
+                invitation_status.value: count for invitation_status, count in counts.items()
+            }),
+            items=[
+                InvitationItem(
+                    teamMemberId=str(row.team_member_id),
+                    name=row.name,
+                    email=row.email,
+                    status=row.status,
+                    attempts=row.attempts,
+                    lastError=row.last_error,
+                    nextAttemptAt=row.next_attempt_at if row.status == InvitationStatus.PENDING else None,
+                    sentAt=row.sent_at
+                )
+                for row in rows
+            ],
+            nextCursor=next_cursor
+        )
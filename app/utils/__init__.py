@@ -1,15 +1,35 @@
-from app.utils.link_generator import (
-    generate_unique_token,
-    generate_unique_survey_link,
-    create_survey_link_for_member,
-    validate_survey_token,
-    is_survey_completed
-)
-
-__all__ = [
-    "generate_unique_token",
-    "generate_unique_survey_link",
-    "create_survey_link_for_member",
-    "validate_survey_token",
-    "is_survey_completed"
-]
\ No newline at end of file
+"""
+Utility helpers.
+
+Names are resolved from their submodule on first access, so importing one
+utility module (e.g. ``app.utils.statistics``) does not drag in the others
+and the ORM models they depend on.
+"""
+import importlib
+
+_EXPORTS = {
+    "generate_unique_token": "link_generator",
+    "generate_unique_tokens": "link_generator",
+    "generate_unique_survey_link": "link_generator",
+    "build_survey_link": "link_generator",
+    "create_survey_link_for_member": "link_generator",
+    "validate_survey_token": "link_generator",
+    "is_survey_completed": "link_generator",
+    "encode_cursor": "pagination",
+    "decode_cursor": "pagination",
+    "split_page": "pagination",
+    "get_type_adapter": "serialization",
+    "dump_json": "serialization",
+    "json_response": "serialization"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
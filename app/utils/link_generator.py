@@ -1,8 +1,10 @@
 import secrets
 import string
-from typing import Optional
-from sqlalchemy.orm import Session
-from app.models.team_member import TeamMember
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from app.models.team_member import TeamMember
 
 
 def generate_unique_token(length: int = 32) -> str:
@@ -20,7 +22,42 @@ def generate_unique_token(length: int = 32) -> str:
     return ''.join(secrets.choice(alphabet) for _ in range(length))
 
 
-def generate_unique_survey_link(db: Session, max_attempts: int = 10) -> str:
+_TOKEN_ALPHABET = (string.ascii_letters + string.digits).encode()
+# Map every random byte below the largest multiple of the alphabet size to a
+# character; higher bytes are dropped so each character stays uniform
+_TOKEN_BYTE_LIMIT = 256 - 256 % len(_TOKEN_ALPHABET)
+_TOKEN_TABLE = bytes(_TOKEN_ALPHABET[b % len(_TOKEN_ALPHABET)] for b in range(256))
+_TOKEN_REJECTED = bytes(range(_TOKEN_BYTE_LIMIT, 256))
+
+
+def generate_unique_tokens(count: int, length: int = 32) -> List[str]:
+    """
+    Generates many distinct tokens in one pass, for bulk survey creation.
+
+    Draws random bytes in bulk and maps them onto the same alphabet as
+    generate_unique_token instead of making one ``secrets.choice`` call per
+    character.
+
+    Args:
+        count: Number of tokens to generate
+        length: Token length (default 32 characters)
+
+    Returns:
+        List of ``count`` distinct tokens
+    """
+    tokens = set()
+    while len(tokens) < count:
+        needed = (count - len(tokens)) * length
+        # Draw slightly more bytes than needed to cover rejected ones
+        chars = secrets.token_bytes(needed + needed // 16 + length).translate(_TOKEN_TABLE, _TOKEN_REJECTED)
+        for start in range(0, len(chars) - length + 1, length):
+            tokens.add(chars[start:start + length].decode())
+            if len(tokens) == count:
+                break
+    return list(tokens)
+
+
+def generate_unique_survey_link(db: "Session", max_attempts: int = 10) -> str:
     """
     Generates a unique link for a survey, verifying it doesn't exist in the DB.
 
@@ -34,6 +71,8 @@ def generate_unique_survey_link(db: Session, max_attempts: int = 10) -> str:
     Raises:
         RuntimeError: If a unique token cannot be generated after max_attempts
     """
+    from app.models.team_member import TeamMember
+
     for attempt in range(max_attempts):
         # Generate candidate token
         token = generate_unique_token()
@@ -48,8 +87,26 @@ def generate_unique_survey_link(db: Session, max_attempts: int = 10) -> str:
     raise RuntimeError(f"Could not generate a unique token after {max_attempts} attempts")
 
 
+def build_survey_link(token: str, frontend_url: Optional[str] = None) -> str:
+    """
+    Builds the complete survey link for a token.
+
+    Args:
+        token: Team member's unique survey token
+        frontend_url: Frontend base URL (optional, defaults to settings.FRONTEND_URL)
+
+    Returns:
+        Complete survey link
+    """
+    if frontend_url is None:
+        from app.config import settings
+        frontend_url = settings.FRONTEND_URL
+
+    return f"{frontend_url}/survey/{token}"
+
+
 def create_survey_link_for_member(
-        db: Session,
+        db: "Session",
         name: str,
         email: str,
         survey_id: str,
@@ -72,16 +129,12 @@ def create_survey_link_for_member(
     unique_token = generate_unique_survey_link(db)
 
     # Create complete link
-    if frontend_url is None:
-        from app.config import settings
-        frontend_url = settings.FRONTEND_URL
-
-    full_link = f"{frontend_url}/survey/{unique_token}"
+    full_link = build_survey_link(unique_token, frontend_url)
 
     return unique_token, full_link
 
 
-def validate_survey_token(db: Session, token: str) -> Optional[TeamMember]:
+def validate_survey_token(db: "Session", token: str) -> Optional["TeamMember"]:
     """
     Validates a survey token and returns the associated TeamMember if it exists.
 
@@ -92,10 +145,12 @@ def validate_survey_token(db: Session, token: str) -> Optional[TeamMember]:
     Returns:
         TeamMember if the token is valid, None if it doesn't exist
     """
+    from app.models.team_member import TeamMember
+
     return db.query(TeamMember).filter(TeamMember.unique_link == token).first()
 
 
-def is_survey_completed(db: Session, token: str) -> bool:
+def is_survey_completed(db: "Session", token: str) -> bool:
     """
     Verifies if a survey has been completed based on the token.
 
@@ -0,0 +1,61 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from app.repositories.base import PageKey
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encodes the position of a row as an opaque, URL-safe cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row of the page
+        id: ID of the last row of the page
+
+    Returns:
+        Cursor string to pass back to get the next page
+    """
+    raw = f"{created_at.isoformat()}|{id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> PageKey:
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple with (created_at, id) of the last row already returned
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id_hex = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(hex=id_hex)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def split_page(rows: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Splits a page fetched with ``limit + 1`` rows into items and the next cursor.
+
+    Args:
+        rows: Rows fetched with one extra row to detect further pages
+        limit: Requested page size
+
+    Returns:
+        Tuple with (items, next_cursor); next_cursor is None on the last page
+    """
+    items = rows[:limit]
+    if len(rows) <= limit:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,63 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model_type: Any) -> TypeAdapter:
+    """
+    Returns the TypeAdapter for a type, building it only once per process.
+
+    Args:
+        model_type: Schema class (or any type pydantic understands)
+
+    Returns:
+        Shared TypeAdapter whose serializer is compiled once
+    """
+    return TypeAdapter(model_type)
+
+
+def dump_json(content: BaseModel) -> bytes:
+    """
+    Serializes a response model straight to JSON bytes.
+
+    The model is not validated again, so responses built from trusted
+    database values can be created with ``model_construct``.
+
+    Args:
+        content: Response model to serialize
+
+    Returns:
+        UTF-8 encoded JSON body
+    """
+    return get_type_adapter(type(content)).dump_json(content)
+
+
+def json_response(
+        content: BaseModel,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Builds a JSON response from a model serialized once to bytes.
+
+    Returning a Response makes FastAPI skip the ``response_model``
+    validation and re-encoding of the endpoint result, which is still used
+    for the OpenAPI document.
+
+    Args:
+        content: Response model to serialize
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        Response carrying the pre-serialized body
+    """
+    return Response(
+        content=dump_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
@@ -0,0 +1,127 @@
+import math
+from typing import List, Optional, Sequence, Tuple
+
+# Ratings are on a fixed 1-5 scale (see Response.check_rating_range)
+RATING_SCALE = (1, 2, 3, 4, 5)
+
+
+def histogram_std(count: int, rating_sum: float, rating_sum_squares: float) -> float:
+    """
+    Population standard deviation from aggregate sums.
+
+    Args:
+        count: Number of ratings
+        rating_sum: Sum of the ratings
+        rating_sum_squares: Sum of the squared ratings
+
+    Returns:
+        Standard deviation, 0.0 when there are no ratings
+    """
+    if count == 0:
+        return 0.0
+    mean = rating_sum / count
+    variance = max(rating_sum_squares / count - mean * mean, 0.0)
+    return math.sqrt(variance)
+
+
+def histogram_median(counts: Sequence[int]) -> float:
+    """
+    Median rating of a 1-5 histogram.
+
+    Args:
+        counts: Number of ratings per scale value, in RATING_SCALE order
+
+    Returns:
+        Median rating (average of the two middle values for even counts),
+        0.0 when there are no ratings
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+
+    def value_at(position: int) -> int:
+        cumulative = 0
+        for rating, count in zip(RATING_SCALE, counts):
+            cumulative += count
+            if cumulative > position:
+                return rating
+        return RATING_SCALE[-1]
+
+    middle = total // 2
+    if total % 2:
+        return float(value_at(middle))
+    return (value_at(middle - 1) + value_at(middle)) / 2
+
+
+def box_percentage(counts: Sequence[int], ratings: Sequence[int]) -> float:
+    """
+    Share of ratings that fall on the given scale values, as a percentage.
+
+    Args:
+        counts: Number of ratings per scale value, in RATING_SCALE order
+        ratings: Scale values in the box, e.g. (4, 5) for top-box
+
+    Returns:
+        Percentage between 0 and 100
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    in_box = sum(count for rating, count in zip(RATING_SCALE, counts) if rating in ratings)
+    return in_box / total * 100
+
+
+def moving_average(values: Sequence[float], window: int) -> List[float]:
+    """
+    Trailing simple moving average.
+
+    Args:
+        values: Values in chronological order
+        window: Number of trailing values to average (shorter at the start)
+
+    Returns:
+        One average per value
+    """
+    averages = []
+    running = 0.0
+    for index, value in enumerate(values):
+        running += value
+        if index >= window:
+            running -= values[index - window]
+        averages.append(running / min(index + 1, window))
+    return averages
+
+
+def bootstrap_mean_interval(
+        counts: Sequence[int],
+        resamples: int = 2000,
+        level: float = 0.95
+) -> Optional[Tuple[float, float]]:
+    """
+    Percentile bootstrap confidence interval of the mean rating of a histogram.
+
+    Resampling n ratings with replacement from a 1-5 histogram is one
+    multinomial draw over the five scale values, so all resamples are drawn
+    at once. The generator is seeded with the histogram itself, making the
+    interval deterministic for the same counts.
+
+    Args:
+        counts: Number of ratings per scale value, in RATING_SCALE order
+        resamples: Number of bootstrap resamples
+        level: Confidence level, e.g. 0.95
+
+    Returns:
+        (lower, upper) bounds of the mean, None when there are no ratings
+    """
+    import numpy as np
+
+    total = sum(counts)
+    if total == 0:
+        return None
+
+    rng = np.random.default_rng([int(count) for count in counts])
+    draws = rng.multinomial(total, np.asarray(counts) / total, size=resamples)
+    means = draws @ np.asarray(RATING_SCALE) / total
+    tail = (1 - level) / 2
+    lower, upper = np.quantile(means, [tail, 1 - tail])
+    return float(lower), float(upper)
@@ -0,0 +1,185 @@
+"""
+Response size and latency benchmark for compression and caching headers.
+
+Creates surveys for one manager, answers part of them, then requests the
+read endpoints with each Accept-Encoding (identity, gzip and br when the
+server supports it) and reports, per endpoint and encoding, the bytes on
+the wire, the compression ratio, p50/p95 latency and the Cache-Control
+header that was sent.
+
+    # Spin up the app in-process on a temporary SQLite database
+    python scripts/compression_benchmark.py --local --surveys 50 --requests 50
+
+    # Against an already running server
+    python scripts/compression_benchmark.py --base-url http://127.0.0.1:8000
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+root_dir = Path(__file__).parent.parent
+sys.path.append(str(root_dir))
+
+from scripts.load_test import API_PREFIX, free_port, percentile, start_local_server  # noqa: E402
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+@dataclass
+class Measurement:
+    """Wire sizes and latencies of one endpoint requested with one encoding."""
+    endpoint: str
+    encoding: str
+    sizes: List[int] = field(default_factory=list)
+    latencies: List[float] = field(default_factory=list)
+    content_encoding: str = ""
+    cache_control: str = ""
+
+
+class Client:
+    """Keep-alive HTTP/1.1 client returning bodies as sent (not decompressed)."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+
+    def request(
+            self,
+            method: str,
+            path: str,
+            payload: Optional[dict] = None,
+            accept_encoding: str = "identity"
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = {"Accept-Encoding": accept_encoding, "Content-Type": "application/json"}
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        content = response.read()
+        return response.status, {name.lower(): value for name, value in response.getheaders()}, content
+
+    def json(self, method: str, path: str, payload: Optional[dict] = None) -> dict:
+        status_code, _, content = self.request(method, path, payload)
+        if status_code >= 300:
+            raise RuntimeError(f"{method} {path} failed with {status_code}: {content[:200]!r}")
+        return json.loads(content)
+
+
+def seed(client: Client, surveys: int, answered: int) -> Dict[str, str]:
+    """Create surveys for one manager, answer some links and return the benchmarked paths."""
+    manager_id = f"compression-benchmark-{int(time.time())}"
+    survey_ids, tokens = [], []
+    for index in range(surveys):
+        data = client.json("POST", f"{API_PREFIX}/surveys/", {
+            "managerId": manager_id,
+            "teamMembers": [
+                {"name": f"Member {index}-{member}", "email": f"member{index}.{member}@example.com"}
+                for member in range(10)
+            ]
+        })["data"]
+        survey_ids.append(data["surveyId"])
+        tokens.extend(member["surveyLink"].rsplit("/", 1)[-1] for member in data["teamMembers"])
+
+    question_ids = [question["id"] for question in client.json("GET", f"{API_PREFIX}/questions/")["data"]]
+    for index, token in enumerate(tokens[:answered]):
+        client.json("POST", f"{API_PREFIX}/survey/{token}/response", {
+            "responses": [
+                {"questionId": question_id, "rating": (index + offset) % 5 + 1}
+                for offset, question_id in enumerate(question_ids)
+            ]
+        })
+
+    survey_id = survey_ids[0]
+    return {
+        "questions": f"{API_PREFIX}/questions/",
+        "survey page": f"{API_PREFIX}/survey/{tokens[-1]}",
+        "status": f"{API_PREFIX}/surveys/{survey_id}/status",
+        "team members": f"{API_PREFIX}/surveys/{survey_id}/team-members?limit=500",
+        "analytics": f"{API_PREFIX}/surveys/{survey_id}/analytics",
+        "manager surveys": f"{API_PREFIX}/surveys/?managerId={manager_id}&limit=100",
+        "manager trend": f"{API_PREFIX}/surveys/managers/{manager_id}/trend",
+        "manager export": f"{API_PREFIX}/surveys/managers/{manager_id}/responses/export?format=csv",
+    }
+
+
+def measure(client: Client, endpoints: Dict[str, str], requests: int) -> List[Measurement]:
+    """Request every endpoint ``requests`` times per encoding."""
+    measurements = []
+    for name, path in endpoints.items():
+        for encoding in ENCODINGS:
+            measurement = Measurement(name, encoding)
+            client.request("GET", path, accept_encoding=encoding)  # warm caches
+            for _ in range(requests):
+                started = time.perf_counter()
+                status_code, headers, content = client.request("GET", path, accept_encoding=encoding)
+                measurement.latencies.append(time.perf_counter() - started)
+                if status_code != 200:
+                    raise RuntimeError(f"GET {path} failed with {status_code}: {content[:200]!r}")
+                measurement.sizes.append(len(content))
+                measurement.content_encoding = headers.get("content-encoding", "")
+                measurement.cache_control = headers.get("cache-control", "")
+            measurements.append(measurement)
+    return measurements
+
+
+def print_report(measurements: List[Measurement]):
+    """Print bytes, ratio against identity and latency per endpoint and encoding."""
+    print()
+    print(
+        f"{'endpoint':<16} {'accept':<9} {'sent as':<9} {'bytes':>9} {'ratio':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8}  cache-control"
+    )
+    identity_sizes = {}
+    for measurement in measurements:
+        size = int(sum(measurement.sizes) / len(measurement.sizes))
+        if measurement.encoding == "identity":
+            identity_sizes[measurement.endpoint] = size
+        ratio = size / identity_sizes[measurement.endpoint] if identity_sizes.get(measurement.endpoint) else 1.0
+        print(
+            f"{measurement.endpoint:<16} {measurement.encoding:<9} "
+            f"{measurement.content_encoding or 'identity':<9} {size:>9} {ratio:>7.2f} "
+            f"{percentile(measurement.latencies, 50) * 1000:>8.2f} "
+            f"{percentile(measurement.latencies, 95) * 1000:>8.2f}  {measurement.cache_control}"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Response compression and caching header benchmark")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server base URL")
+    parser.add_argument("--local", action="store_true", help="Run the app in-process on a temporary database")
+    parser.add_argument("--surveys", type=int, default=20, help="Surveys (10 members each) to create")
+    parser.add_argument("--answered", type=int, default=100, help="Links to answer")
+    parser.add_argument("--requests", type=int, default=30, help="Requests per endpoint and encoding")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    server = None
+    if args.local:
+        port = free_port()
+        args.base_url = f"http://127.0.0.1:{port}"
+        server, _ = start_local_server(port)
+        print(f"🚀 App running in-process at {args.base_url}")
+
+    try:
+        client = Client(args.base_url, args.timeout)
+        print(f"🌱 Creating {args.surveys} surveys and answering {args.answered} links...")
+        endpoints = seed(client, args.surveys, args.answered)
+        print(f"📦 Requesting {len(endpoints)} endpoints {args.requests}x per encoding...")
+        print_report(measure(client, endpoints, args.requests))
+    finally:
+        if server is not None:
+            server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Concurrent load generator for the survey lifecycle.
+
+Drives the real HTTP API through the whole flow:
+
+1. Create surveys (POST /surveys/)
+2. Fetch every member's survey concurrently (GET /survey/{token})
+3. Submit every member's responses concurrently (POST /survey/{token}/response)
+   while managers poll analytics (GET /surveys/{id}/analytics)
+
+and reports p50/p95/p99 latencies, throughput and an error breakdown per stage.
+Only the standard library is used for the client side.
+
+    # Against a running server
+    python scripts/load_test.py --base-url http://127.0.0.1:8000 --surveys 200
+
+    # Spin up the app in-process on a temporary SQLite database
+    python scripts/load_test.py --local --surveys 200 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+root_dir = Path(__file__).parent.parent
+sys.path.append(str(root_dir))
+
+API_PREFIX = "/api/v1"
+
+
+@dataclass
+class StageStats:
+    """Latency samples and error counts for one stage of the lifecycle."""
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    started: float = 0.0
+    finished: float = 0.0
+
+    def record(self, latency: float, error: Optional[str] = None):
+        self.latencies.append(latency)
+        if error:
+            self.errors[error] += 1
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        elapsed = self.finished - self.started
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of the given samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+class HTTPClient:
+    """Minimal asyncio HTTP/1.1 client (one connection per request)."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.timeout = timeout
+
+    async def request(self, method: str, path: str, payload: Optional[dict] = None) -> Tuple[int, bytes]:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Accept: application/json\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode()
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        try:
+            writer.write(head + body)
+            await writer.drain()
+            raw = await asyncio.wait_for(reader.read(), self.timeout)
+        finally:
+            writer.close()
+
+        header_blob, _, content = raw.partition(b"\r\n\r\n")
+        status_line = header_blob.split(b"\r\n", 1)[0]
+        status_code = int(status_line.split()[1])
+        if b"transfer-encoding: chunked" in header_blob.lower():
+            content = _decode_chunked(content)
+        return status_code, content
+
+
+def _decode_chunked(content: bytes) -> bytes:
+    """Decode a chunked transfer-encoded body."""
+    decoded = bytearray()
+    while content:
+        size_line, _, content = content.partition(b"\r\n")
+        size = int(size_line.split(b";")[0], 16)
+        if size == 0:
+            break
+        decoded += content[:size]
+        content = content[size + 2:]
+    return bytes(decoded)
+
+
+def classify_error(status_code: int, content: bytes) -> Optional[str]:
+    """Map a response to an error category, or None on success."""
+    if 200 <= status_code < 300:
+        return None
+    try:
+        detail = str(json.loads(content).get("detail", ""))
+    except (ValueError, AttributeError):
+        detail = content[:80].decode(errors="replace")
+    if "locked" in detail.lower():
+        return f"{status_code} sqlite_lock"
+    return f"{status_code} {detail}"[:120]
+
+
+async def timed(client: HTTPClient, stats: StageStats, method: str, path: str,
+                payload: Optional[dict] = None) -> Optional[dict]:
+    """Issue one request, record its latency/outcome and return the JSON body on success."""
+    started = time.perf_counter()
+    try:
+        status_code, content = await client.request(method, path, payload)
+    except asyncio.TimeoutError:
+        stats.record(time.perf_counter() - started, "timeout")
+        return None
+    except OSError as e:
+        stats.record(time.perf_counter() - started, f"connection {e.__class__.__name__}")
+        return None
+
+    error = classify_error(status_code, content)
+    stats.record(time.perf_counter() - started, error)
+    if error:
+        return None
+    return json.loads(content) if content else {}
+
+
+async def run_load(args: argparse.Namespace) -> Dict[str, StageStats]:
+    """Run the full survey lifecycle and return per-stage statistics."""
+    client = HTTPClient(args.base_url, args.timeout)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    stages = {name: StageStats(name) for name in ("create", "fetch", "submit", "analytics")}
+
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+
+    # 1. Create surveys
+    stages["create"].started = time.perf_counter()
+    created = await asyncio.gather(*(
+        limited(timed(client, stages["create"], "POST", f"{API_PREFIX}/surveys/", {
+            "managerId": f"load-manager-{index}",
+            "teamMembers": [
+                {"name": f"Member {index}-{member}", "email": f"member{index}.{member}@example.com"}
+                for member in range(args.members)
+            ]
+        }))
+        for index in range(args.surveys)
+    ))
+    stages["create"].finished = time.perf_counter()
+
+    survey_ids = [body["data"]["surveyId"] for body in created if body]
+    tokens = [
+        member["surveyLink"].rsplit("/", 1)[-1]
+        for body in created if body
+        for member in body["data"]["teamMembers"]
+    ]
+
+    # 2. Concurrent token fetches
+    stages["fetch"].started = time.perf_counter()
+    fetched = await asyncio.gather(*(
+        limited(timed(client, stages["fetch"], "GET", f"{API_PREFIX}/survey/{token}"))
+        for token in tokens
+    ))
+    stages["fetch"].finished = time.perf_counter()
+
+    questions = next((body["data"]["questions"] for body in fetched if body), [])
+    question_ids = [question["id"] for question in questions]
+
+    # 3. Concurrent submissions with analytics polling alongside
+    submissions_done = asyncio.Event()
+
+    async def poll_analytics():
+        # Managers are separate clients, so polling is not bound by the submit semaphore
+        while not submissions_done.is_set() and survey_ids:
+            await asyncio.gather(*(
+                timed(client, stages["analytics"], "GET", f"{API_PREFIX}/surveys/{survey_id}/analytics")
+                for survey_id in survey_ids[:args.poll_surveys]
+            ))
+            await asyncio.sleep(args.poll_interval)
+
+    stages["analytics"].started = stages["submit"].started = time.perf_counter()
+    poller = asyncio.create_task(poll_analytics())
+    await asyncio.gather(*(
+        limited(timed(client, stages["submit"], "POST", f"{API_PREFIX}/survey/{token}/response", {
+            "responses": [
+                {"questionId": question_id, "rating": (index + offset) % 5 + 1}
+                for offset, question_id in enumerate(question_ids)
+            ]
+        }))
+        for index, token in enumerate(tokens)
+    ))
+    stages["submit"].finished = time.perf_counter()
+    submissions_done.set()
+    await poller
+    stages["analytics"].finished = time.perf_counter()
+
+    return stages
+
+
+def print_report(stages: Dict[str, StageStats], lock_errors: Optional[int]):
+    """Print latency percentiles, throughput and error breakdown per stage."""
+    print()
+    print(f"{'stage':<10} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for stats in stages.values():
+        print(
+            f"{stats.name:<10} {stats.requests:>9} {sum(stats.errors.values()):>7} "
+            f"{stats.throughput:>9.1f} "
+            f"{percentile(stats.latencies, 50) * 1000:>9.1f} "
+            f"{percentile(stats.latencies, 95) * 1000:>9.1f} "
+            f"{percentile(stats.latencies, 99) * 1000:>9.1f}"
+        )
+
+    breakdown = defaultdict(list)
+    for stats in stages.values():
+        for error, count in stats.errors.most_common():
+            breakdown[stats.name].append((error, count))
+
+    if breakdown:
+        print("\nErrors:")
+        for stage, errors in breakdown.items():
+            for error, count in errors:
+                print(f"  {stage:<10} {count:>7}  {error}")
+
+    if lock_errors is not None:
+        print(f"\nSQLite 'database is locked' errors raised in-process: {lock_errors}")
+
+
+def start_local_server(port: int):
+    """
+    Start the app with uvicorn in a background thread on a temporary database.
+
+    Returns the server and a callable counting SQLite lock errors seen by the
+    engine, since the API reports them as generic 500s.
+    """
+    db_path = Path(tempfile.mkdtemp()) / "load_test.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["ENVIRONMENT"] = "loadtest"
+    # Every simulated team member shares one client IP
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+    import uvicorn
+    from sqlalchemy import event
+    from app.database.connection import Base, engine
+    from app.database.session import SessionLocal
+    from app.main import app
+    from app.models import SurveyQuestion  # noqa: F401 - registers all models
+    from scripts.seed_data import seed_questions
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed_questions(db)
+    finally:
+        db.close()
+
+    lock_errors = Counter()
+
+    @event.listens_for(engine, "handle_error")
+    def count_lock_errors(context):
+        if "database is locked" in str(context.original_exception):
+            lock_errors["locked"] += 1
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    return server, lambda: lock_errors["locked"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Survey lifecycle load generator")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server base URL")
+    parser.add_argument("--local", action="store_true", help="Run the app in-process on a temporary database")
+    parser.add_argument("--surveys", type=int, default=50, help="Number of surveys to create")
+    parser.add_argument("--members", type=int, default=10, help="Team members per survey")
+    parser.add_argument("--concurrency", type=int, default=10, help="Maximum in-flight requests")
+    parser.add_argument("--poll-surveys", type=int, default=10, help="Surveys whose analytics are polled")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds between analytics polls")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    server = None
+    lock_errors = None
+    if args.local:
+        port = free_port()
+        args.base_url = f"http://127.0.0.1:{port}"
+        server, lock_errors = start_local_server(port)
+        print(f"🚀 App running in-process at {args.base_url}")
+
+    print(f"⏱️  {args.surveys} surveys x {args.members} members, concurrency {args.concurrency}")
+    try:
+        stages = asyncio.run(run_load(args))
+    finally:
+        if server:
+            server.should_exit = True
+
+    print_report(stages, lock_errors() if lock_errors else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,28 @@
 """
 Script to insert initial data into the database.
 It runs after creating migrations to insert the 3 predefined questions.
+
+It can also generate a large synthetic dataset (managers, surveys, team
+members and responses) to reproduce production-scale volumes:
+
+    python scripts/seed_data.py synthetic --managers 5000 --seed 42
 """
 
-import asyncio
+import argparse
+import base64
+import bisect
+import math
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
 from sqlalchemy.orm import Session
 from app.database.connection import engine
 from app.database.session import SessionLocal
 from app.models.question import SurveyQuestion
+from app.models.survey import Survey, SurveyStatus
 
 
 def seed_questions(db: Session):
@@ -43,10 +58,233 @@ def seed_questions(db: Session):
     print("🎉 Seed completed successfully!")
 
 
+class _SyntheticIds:
+    """
+    Deterministic, monotonically increasing UUID4 hex values.
+
+    A random 64-bit prefix is drawn from the seeded generator and the low bits
+    are a counter, so values stay unique per seed while index inserts append
+    to the end of the B-tree instead of landing at random pages.
+    """
+
+    # RFC 4122 variant bits for the low half of the UUID
+    _VARIANT = 0x8000000000000000
+
+    def __init__(self, rng: random.Random):
+        self._prefix = uuid.UUID(int=rng.getrandbits(64) << 64, version=4).hex[:16]
+        self._counter = 0
+
+    def next(self) -> str:
+        self._counter += 1
+        return self._prefix + format(self._VARIANT | self._counter, "016x")
+
+
+def _synthetic_token(rng: random.Random) -> str:
+    """Deterministic 32-character alphanumeric token, shaped like generate_unique_token."""
+    return base64.b64encode(rng.getrandbits(192).to_bytes(24, "big"), altchars=b"xy").decode()
+
+
+def _rating_cdf(mean: float, spread: float = 0.9) -> List[float]:
+    """Cumulative probabilities of a normal rating rounded and clipped to 1-5."""
+    def normal_cdf(x: float) -> float:
+        return 0.5 * (1 + math.erf((x - mean) / (spread * math.sqrt(2))))
+
+    return [normal_cdf(rating + 0.5) for rating in range(1, 5)]
+
+
+def _sql_datetime(value: datetime) -> str:
+    """Format a naive UTC datetime the way SQLAlchemy stores it in SQLite."""
+    return value.isoformat(" ", "microseconds")
+
+
+SYNTHETIC_INSERTS = {
+    "surveys": (
+        "INSERT INTO surveys (id, manager_id, title, description, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "team_members": (
+        "INSERT INTO team_members (id, survey_id, name, email, unique_link, has_completed, "
+        "completed_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "responses": (
+        "INSERT INTO responses (id, team_member_id, question_id, rating, submitted_at, "
+        "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    ),
+}
+
+
+def seed_synthetic(
+        db: Session,
+        managers: int = 100,
+        surveys_per_manager: int = 4,
+        members_per_survey: int = 8,
+        completion_ratio: float = 0.7,
+        days: int = 365,
+        seed: int = 42,
+        anchor: Optional[datetime] = None,
+        batch_size: int = 100_000
+) -> Dict[str, int]:
+    """
+    Generate a large, deterministic synthetic dataset using bulk inserts.
+
+    Every manager gets a latent leadership score that drives the ratings of
+    all their surveys, with a small per-question offset so question averages
+    differ. Completion per survey is drawn from a beta distribution centred on
+    ``completion_ratio``. Surveys are spread over the ``days`` preceding
+    ``anchor``; fully completed surveys are marked as completed.
+
+    Rows are pre-encoded in SQLite's storage format and written with the
+    driver's ``executemany`` in batches of ``batch_size`` rows, bypassing the
+    ORM unit of work and per-value type processing.
+
+    :return: Number of rows inserted per table.
+    """
+    print("🧪 Generating synthetic dataset...")
+
+    if db.bind.dialect.name != "sqlite":
+        raise RuntimeError("Synthetic seeding writes SQLite storage formats directly")
+
+    questions = db.query(SurveyQuestion).order_by(SurveyQuestion.question_order).all()
+    if not questions:
+        raise RuntimeError("Questions must be seeded before generating synthetic data")
+    question_ids = [question.id.hex for question in questions]
+
+    manager_prefix = f"manager-{seed}-"
+    if db.query(Survey.id).filter(Survey.manager_id == f"{manager_prefix}000000").first():
+        raise RuntimeError(f"Synthetic data for seed {seed} already exists; use another --seed")
+
+    rng = random.Random(seed)
+    ids = _SyntheticIds(rng)
+    if anchor is None:
+        anchor = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    anchor = anchor.astimezone(timezone.utc).replace(tzinfo=None) if anchor.tzinfo else anchor
+
+    # Beta(a, b) with mean completion_ratio and a moderate spread
+    completion_ratio = min(max(completion_ratio, 0.01), 0.99)
+    beta_a = completion_ratio * 8
+    beta_b = (1 - completion_ratio) * 8
+
+    rows: Dict[str, List[tuple]] = {table: [] for table in SYNTHETIC_INSERTS}
+    totals = {table: 0 for table in SYNTHETIC_INSERTS}
+    connection = db.connection()
+
+    def flush():
+        # Parents first so the batches stay consistent if foreign keys are enforced
+        for table, statement in SYNTHETIC_INSERTS.items():
+            if rows[table]:
+                connection.exec_driver_sql(statement, rows[table])
+                totals[table] += len(rows[table])
+                rows[table].clear()
+
+    started = time.perf_counter()
+    connection.exec_driver_sql("PRAGMA synchronous = OFF")
+    connection.exec_driver_sql("PRAGMA cache_size = -262144")
+
+    for manager_index in range(managers):
+        manager_id = f"{manager_prefix}{manager_index:06d}"
+        manager_mean = min(4.8, max(1.5, rng.gauss(3.7, 0.6)))
+        question_cdfs = [_rating_cdf(manager_mean + rng.gauss(0, 0.3)) for _ in question_ids]
+
+        for _ in range(surveys_per_manager):
+            survey_id = ids.next()
+            created_at = anchor - timedelta(seconds=rng.randrange(days * 86400))
+            created_at_sql = _sql_datetime(created_at)
+            team_size = rng.randint(max(1, members_per_survey // 2), members_per_survey + members_per_survey // 2)
+            survey_completion = rng.betavariate(beta_a, beta_b)
+
+            completed_count = 0
+            for member_index in range(team_size):
+                member_id = ids.next()
+                completed_at_sql = None
+
+                if rng.random() < survey_completion:
+                    completed_count += 1
+                    # Most answers arrive in the first days, with a long tail
+                    completed_at_sql = _sql_datetime(created_at + timedelta(seconds=min(
+                        rng.expovariate(1 / 86400) + 60, 30 * 86400
+                    )))
+                    for question_id, cdf in zip(question_ids, question_cdfs):
+                        rows["responses"].append((
+                            ids.next(),
+                            member_id,
+                            question_id,
+                            bisect.bisect(cdf, rng.random()) + 1,
+                            completed_at_sql,
+                            completed_at_sql,
+                            completed_at_sql
+                        ))
+
+                rows["team_members"].append((
+                    member_id,
+                    survey_id,
+                    f"Member {manager_index}-{member_index}",
+                    f"member{manager_index}.{member_index}@example.com",
+                    _synthetic_token(rng),
+                    completed_at_sql is not None,
+                    completed_at_sql,
+                    created_at_sql,
+                    completed_at_sql or created_at_sql
+                ))
+
+            status = SurveyStatus.COMPLETED if completed_count == team_size else SurveyStatus.ACTIVE
+            rows["surveys"].append((
+                survey_id,
+                manager_id,
+                "Leadership Feedback Survey",
+                "Anonymous feedback survey for leadership effectiveness",
+                status.name,
+                created_at_sql,
+                created_at_sql
+            ))
+
+            if len(rows["responses"]) + len(rows["team_members"]) >= batch_size:
+                flush()
+
+    flush()
+    db.commit()
+
+    elapsed = time.perf_counter() - started
+    total_rows = sum(totals.values())
+    print(
+        f"✅ Inserted {totals['surveys']} surveys, {totals['team_members']} team members and "
+        f"{totals['responses']} responses ({total_rows} rows) in {elapsed:.1f}s "
+        f"({total_rows / elapsed if elapsed else 0:,.0f} rows/s)"
+    )
+
+    return totals
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments for the seed script."""
+    parser = argparse.ArgumentParser(description="Seed the leadership survey database")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("questions", help="Insert the predefined questions (default)")
+
+    synthetic = subparsers.add_parser("synthetic", help="Generate a large synthetic dataset")
+    synthetic.add_argument("--managers", type=int, default=100, help="Number of managers")
+    synthetic.add_argument("--surveys-per-manager", type=int, default=4, help="Surveys per manager")
+    synthetic.add_argument("--members-per-survey", type=int, default=8, help="Average team size")
+    synthetic.add_argument("--completion-ratio", type=float, default=0.7, help="Mean completion ratio")
+    synthetic.add_argument("--days", type=int, default=365, help="Days of history to spread surveys over")
+    synthetic.add_argument("--seed", type=int, default=42, help="Random seed")
+    synthetic.add_argument(
+        "--anchor",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Latest survey date (ISO format, defaults to today); fix it for identical datasets"
+    )
+    synthetic.add_argument("--batch-size", type=int, default=100_000, help="Rows per bulk insert")
+
+    return parser.parse_args(argv)
+
+
 def main():
     """
     Main function to execute the seed.
     """
+    args = parse_args()
+
     print("🚀 Starting database seed process...")
 
     # Create database session
@@ -56,6 +294,19 @@ def main():
         # Execute questions seed
         seed_questions(db)
 
+        if args.command == "synthetic":
+            seed_synthetic(
+                db,
+                managers=args.managers,
+                surveys_per_manager=args.surveys_per_manager,
+                members_per_survey=args.members_per_survey,
+                completion_ratio=args.completion_ratio,
+                days=args.days,
+                seed=args.seed,
+                anchor=args.anchor,
+                batch_size=args.batch_size
+            )
+
     except Exception as e:
         print(f"❌ Error during seed: {e}")
         db.rollback()
@@ -67,4 +318,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,78 @@
+"""
+Remind team members who have not completed their survey yet.
+
+Pending members of active surveys who were never reminded, or not within
+REMINDER_INTERVAL_HOURS, are streamed in keyset pages and reminded in
+concurrent batches. Each delivered batch records last_reminded_at, so the
+job can run on a schedule and each run only touches members still due.
+
+    # Write reminders to a JSON-lines file (local development)
+    python scripts/send_reminders.py --sender file --output reminders.jsonl
+
+    # Deliver through an SMTP server, e.g. python -m aiosmtpd -n -l localhost:1025
+    python scripts/send_reminders.py --sender smtp --smtp-host localhost --smtp-port 1025
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional
+
+root_dir = Path(__file__).parent.parent
+sys.path.append(str(root_dir))
+
+from app.config import settings
+from app.core.mail import FileEmailSender, SMTPEmailSender
+from app.services.reminder_service import ReminderService
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Remind pending survey respondents")
+    parser.add_argument("--sender", choices=["file", "smtp"], default="file", help="Delivery backend")
+    parser.add_argument("--output", type=Path, default=Path("reminders.jsonl"), help="File sink path")
+    parser.add_argument("--smtp-host", default=settings.SMTP_HOST, help="SMTP server host")
+    parser.add_argument("--smtp-port", type=int, default=settings.SMTP_PORT, help="SMTP server port")
+    parser.add_argument("--interval-hours", type=float, default=settings.REMINDER_INTERVAL_HOURS,
+                        help="Minimum hours between two reminders to the same member")
+    parser.add_argument("--page-size", type=int, default=settings.REMINDER_PAGE_SIZE, help="Members per page")
+    parser.add_argument("--batch-size", type=int, default=settings.REMINDER_BATCH_SIZE,
+                        help="Reminders per delivery batch")
+    parser.add_argument("--concurrency", type=int, default=settings.REMINDER_CONCURRENCY,
+                        help="Batches delivered concurrently")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum reminders in this run")
+    parser.add_argument("--dry-run", action="store_true", help="Count due reminders without sending")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    if args.sender == "smtp":
+        sender = SMTPEmailSender(args.smtp_host, args.smtp_port)
+    else:
+        sender = FileEmailSender(args.output)
+
+    service = ReminderService(
+        sender,
+        interval=timedelta(hours=args.interval_hours),
+        page_size=args.page_size,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency
+    )
+
+    print(f"📬 Sending reminders via {args.sender}{' (dry run)' if args.dry_run else ''}...")
+    started = time.perf_counter()
+    stats = asyncio.run(service.send_reminders(limit=args.limit, dry_run=args.dry_run))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"✅ {stats['sent']} reminders {'due' if args.dry_run else 'sent'}, {stats['failed']} failed, "
+        f"{stats['pages']} pages in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
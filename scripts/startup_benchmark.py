@@ -0,0 +1,122 @@
+"""
+Cold-start benchmark for the API process.
+
+Imports the app in fresh interpreters under ``python -X importtime`` and
+reports the median import time of ``app.main``, the wall time of the whole
+process and the modules that cost the most, then checks the median import
+time against a budget (exit code 1 when over it, for CI).
+
+    python scripts/startup_benchmark.py --runs 5 --budget-ms 1500
+
+    # Look for regressions in a specific module
+    python scripts/startup_benchmark.py --module app.api.deps --top 30
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+root_dir = Path(__file__).parent.parent
+
+# (self microseconds, cumulative microseconds) per imported module
+ImportTimes = Dict[str, Tuple[int, int]]
+
+
+def parse_importtime(output: str) -> ImportTimes:
+    """Parse the ``-X importtime`` report written to stderr."""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def run_once(module: str, env: Dict[str, str]) -> Tuple[ImportTimes, float]:
+    """Import ``module`` in a fresh interpreter; returns import times and process wall time."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root_dir,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr), elapsed
+
+
+def print_report(module: str, runs: List[Tuple[ImportTimes, float]], top: int) -> float:
+    """Print median timings and the most expensive modules; returns the median import time in ms."""
+    import_ms = statistics.median(times[module][1] / 1000 for times, _ in runs)
+    wall_ms = statistics.median(elapsed * 1000 for _, elapsed in runs)
+
+    self_us = defaultdict(list)
+    cumulative_us = defaultdict(list)
+    for times, _ in runs:
+        for name, (self_time, cumulative) in times.items():
+            self_us[name].append(self_time)
+            cumulative_us[name].append(cumulative)
+
+    print(f"\n{'import of ' + module:<40} {import_ms:>9.1f} ms (median of {len(runs)})")
+    print(f"{'process wall time':<40} {wall_ms:>9.1f} ms")
+
+    print(f"\nSlowest modules by self time (top {top}):")
+    by_self = sorted(self_us, key=lambda name: statistics.median(self_us[name]), reverse=True)
+    for name in by_self[:top]:
+        print(
+            f"  {statistics.median(self_us[name]) / 1000:>8.1f} ms self "
+            f"{statistics.median(cumulative_us[name]) / 1000:>8.1f} ms cumulative  {name}"
+        )
+
+    app_modules = [name for name in cumulative_us if name.startswith("app.")]
+    print(f"\nApplication modules by cumulative time (top {top}):")
+    by_cumulative = sorted(app_modules, key=lambda name: statistics.median(cumulative_us[name]), reverse=True)
+    for name in by_cumulative[:top]:
+        print(f"  {statistics.median(cumulative_us[name]) / 1000:>8.1f} ms  {name}")
+
+    return import_ms
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import-time / cold-start benchmark")
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--top", type=int, default=15, help="Modules to list per table")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Maximum median import time")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    env = dict(os.environ)
+    # Import against a throwaway database and without SQL echo
+    env.setdefault("DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp()) / 'startup_benchmark.db'}")
+    env.setdefault("ENVIRONMENT", "benchmark")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(root_dir), env.get("PYTHONPATH")]))
+
+    print(f"⏱️  Importing {args.module} in {args.runs} fresh interpreters...")
+    # One untimed run so every run reads warm .pyc files
+    run_once(args.module, env)
+    runs = [run_once(args.module, env) for _ in range(args.runs)]
+    import_ms = print_report(args.module, runs, args.top)
+
+    if import_ms > args.budget_ms:
+        print(f"\n❌ Import time {import_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+    print(f"\n✅ Import time {import_ms:.1f} ms is within the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
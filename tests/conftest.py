@@ -0,0 +1,89 @@
+"""
+Shared fixtures: the app runs against a temporary SQLite database per test session
+"""
+import os
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="skillup-tests-")
+
+# Settings are read once at import time, so they must be set before the app is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/test.db"
+os.environ["ENVIRONMENT"] = "test"
+os.environ["DEBUG"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["EMAIL_FILE_PATH"] = os.path.join(_TMP_DIR, "outbox.jsonl")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import app.models  # noqa: E402,F401  registers every table on Base
+from app.database.connection import Base, engine  # noqa: E402
+from app.database.session import SessionLocal  # noqa: E402
+from scripts.seed_data import seed_questions  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Create the schema and the 3 predefined questions once per test session"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed_questions(db)
+    finally:
+        db.close()
+    yield engine
+
+
+@pytest.fixture(scope="module")
+def client():
+    """API client running the app lifespan (warmup and background workers)"""
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Session factory bound to an empty database of its own, for repository-level tests"""
+    isolated_engine = create_engine(
+        f"sqlite:///{tmp_path}/isolated.db",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=isolated_engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=isolated_engine)
+    isolated_engine.dispose()
+
+
+@pytest.fixture
+def question_ids(client):
+    """IDs of the predefined questions, in display order"""
+    return [question["id"] for question in client.get("/api/v1/questions/").json()["data"]]
+
+
+def create_survey(client, manager_id: str, members: int) -> dict:
+    """Create a survey with ``members`` team members and return its data"""
+    response = client.post("/api/v1/surveys/", json={
+        "managerId": manager_id,
+        "teamMembers": [
+            {"name": f"Member {index}", "email": f"member{index}@example.com"}
+            for index in range(members)
+        ]
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["data"]
+
+
+def member_token(team_member: dict) -> str:
+    """Token of a team member's survey link"""
+    return team_member["surveyLink"].rsplit("/", 1)[-1]
+
+
+def answer(client, token: str, question_ids, rating: int = 4):
+    """Submit the same rating for every question through a member's link"""
+    response = client.post(f"/api/v1/survey/{token}/response", json={
+        "responses": [{"questionId": question_id, "rating": rating} for question_id in question_ids]
+    })
+    assert response.status_code == 201, response.text
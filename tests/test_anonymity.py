@@ -0,0 +1,61 @@
+"""
+Suppression of results answered by fewer than ANONYMITY_MIN_RESPONSES people
+"""
+from app.config import settings
+from tests.conftest import answer, create_survey, member_token
+
+
+def _analytics(client, survey_id: str) -> dict:
+    response = client.get(f"/api/v1/surveys/{survey_id}/analytics")
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def test_question_results_are_suppressed_below_the_threshold(client, question_ids):
+    survey = create_survey(client, "anonymity-manager", members=settings.ANONYMITY_MIN_RESPONSES + 1)
+    tokens = [member_token(member) for member in survey["teamMembers"]]
+
+    for token in tokens[:settings.ANONYMITY_MIN_RESPONSES - 1]:
+        answer(client, token, question_ids, rating=2)
+
+    analytics = _analytics(client, survey["surveyId"])
+    assert analytics["overallAverage"] is None
+    for question in analytics["questionAnalytics"]:
+        assert question["suppressed"] is True
+        assert question["responseCount"] == settings.ANONYMITY_MIN_RESPONSES - 1
+        assert question["averageScore"] is None
+        assert question["ratingDistribution"] is None
+        assert question["standardDeviation"] is None
+
+    answer(client, tokens[settings.ANONYMITY_MIN_RESPONSES - 1], question_ids, rating=5)
+
+    analytics = _analytics(client, survey["surveyId"])
+    assert analytics["overallAverage"] is not None
+    for question in analytics["questionAnalytics"]:
+        assert question["suppressed"] is False
+        assert question["responseCount"] == settings.ANONYMITY_MIN_RESPONSES
+        assert question["averageScore"] is not None
+        assert sum(question["ratingDistribution"].values()) == settings.ANONYMITY_MIN_RESPONSES
+
+
+def test_exports_skip_surveys_below_the_threshold(client, question_ids):
+    survey = create_survey(client, "anonymity-export", members=settings.ANONYMITY_MIN_RESPONSES)
+    answer(client, member_token(survey["teamMembers"][0]), question_ids)
+
+    response = client.get(f"/api/v1/surveys/{survey['surveyId']}/responses/export", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_ratings_groups_are_suppressed_below_the_threshold(client, question_ids):
+    survey = create_survey(client, "anonymity-ratings", members=settings.ANONYMITY_MIN_RESPONSES)
+    answer(client, member_token(survey["teamMembers"][0]), question_ids)
+
+    response = client.get("/api/v1/analytics/ratings", params={"groupBy": "survey"})
+    assert response.status_code == 200
+    group = next(group for group in response.json()["data"]["groups"] if group["key"] == survey["surveyId"])
+
+    assert group["suppressed"] is True
+    assert group["averageScore"] is None
+    assert group["ratingDistribution"] is None
@@ -0,0 +1,64 @@
+"""
+Benchmark index rebuilds racing surveys that complete meanwhile
+"""
+from uuid import uuid4
+
+import pytest
+
+from app.core.benchmark import BenchmarkIndex
+from app.repositories.response import ResponseRepository
+
+QUESTION = str(uuid4())
+
+
+class Session:
+    def close(self):
+        pass
+
+
+def _refresh_with(index: BenchmarkIndex, monkeypatch, rows, during_query=lambda: None):
+    """Run a rebuild whose query returns ``rows`` after calling ``during_query``"""
+    def query(self):
+        during_query()
+        return rows
+
+    monkeypatch.setattr(ResponseRepository, "get_completed_survey_question_averages", query)
+    index._refreshing = True
+    index._refresh(Session)
+
+
+@pytest.fixture
+def index(monkeypatch):
+    built = BenchmarkIndex()
+    _refresh_with(built, monkeypatch, [(uuid4(), QUESTION, 1.0)])
+    return built
+
+
+def test_survey_seen_by_the_rebuild_query_is_counted_once(index, monkeypatch):
+    survey_id = uuid4()
+    # Frozen before the query runs, added to the index only after it
+    _refresh_with(index, monkeypatch, [(uuid4(), QUESTION, 1.0), (survey_id, QUESTION, 5.0)],
+                  during_query=lambda: index.add_survey(survey_id, {QUESTION: 5.0}))
+    index.add_survey(survey_id, {QUESTION: 5.0})
+
+    assert list(index._scores[QUESTION]) == [1.0, 5.0]
+
+
+def test_survey_added_after_the_rebuild_query_is_kept(index, monkeypatch):
+    survey_id = uuid4()
+    _refresh_with(index, monkeypatch, [(uuid4(), QUESTION, 1.0)],
+                  during_query=lambda: index.add_survey(survey_id, {QUESTION: 5.0}))
+
+    assert list(index._scores[QUESTION]) == [1.0, 5.0]
+    assert index.percentile(QUESTION, 5.0) == 75.0
+
+
+def test_refresh_flag_is_reset_when_the_query_fails(index, monkeypatch):
+    def fail():
+        raise RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        _refresh_with(index, monkeypatch, [], during_query=fail)
+
+    assert index._refreshing is False
+    assert index._added == {}
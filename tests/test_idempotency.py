@@ -0,0 +1,83 @@
+"""
+Idempotency-Key handling of survey creation and response submission
+"""
+import asyncio
+from uuid import uuid4
+
+from app.core.idempotency import REPLAY_HEADER, idempotency_store
+from app.schemas.survey import SurveyCreate
+from tests.conftest import create_survey, member_token
+
+SURVEY = {
+    "managerId": "idempotency-manager",
+    "teamMembers": [{"name": "Ada", "email": "ada@example.com"}]
+}
+
+
+def test_retry_replays_the_stored_response(client):
+    first = client.post("/api/v1/surveys/", json=SURVEY, headers={"Idempotency-Key": "replay-1"})
+    retry = client.post("/api/v1/surveys/", json=SURVEY, headers={"Idempotency-Key": "replay-1"})
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.headers[REPLAY_HEADER] == "true"
+    assert retry.content == first.content
+
+    surveys = client.get("/api/v1/surveys/", params={"managerId": "idempotency-manager", "limit": 100})
+    survey_ids = [item["surveyId"] for item in surveys.json()["data"]["items"]]
+    assert survey_ids.count(first.json()["data"]["surveyId"]) == 1
+    assert len(survey_ids) == 1
+
+
+def test_same_key_with_a_different_payload_is_rejected(client):
+    client.post("/api/v1/surveys/", json=SURVEY, headers={"Idempotency-Key": "mismatch-1"})
+    other = {**SURVEY, "teamMembers": [{"name": "Grace", "email": "grace@example.com"}]}
+
+    response = client.post("/api/v1/surveys/", json=other, headers={"Idempotency-Key": "mismatch-1"})
+
+    assert response.status_code == 422
+    assert "different request" in response.json()["detail"]
+
+
+def test_retry_while_the_original_is_in_flight_conflicts(client):
+    payload = {**SURVEY, "managerId": "idempotency-in-flight"}
+    scope = "POST /surveys"
+    # Simulates the original request still running in this process
+    assert asyncio.run(idempotency_store.begin(scope, "in-flight-1", SurveyCreate(**payload))) is None
+    try:
+        response = client.post("/api/v1/surveys/", json=payload, headers={"Idempotency-Key": "in-flight-1"})
+        assert response.status_code == 409
+    finally:
+        idempotency_store.release(scope, "in-flight-1")
+
+    response = client.post("/api/v1/surveys/", json=payload, headers={"Idempotency-Key": "in-flight-1"})
+    assert response.status_code == 201
+
+
+def test_submission_retry_is_replayed_not_rejected(client, question_ids):
+    token = member_token(create_survey(client, "idempotency-submit", members=2)["teamMembers"][0])
+    body = {"responses": [{"questionId": question_id, "rating": 5} for question_id in question_ids]}
+
+    first = client.post(f"/api/v1/survey/{token}/response", json=body, headers={"Idempotency-Key": "submit-1"})
+    retry = client.post(f"/api/v1/survey/{token}/response", json=body, headers={"Idempotency-Key": "submit-1"})
+    without_key = client.post(f"/api/v1/survey/{token}/response", json=body)
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.headers[REPLAY_HEADER] == "true"
+    assert without_key.status_code == 400
+
+
+def test_failed_requests_are_not_stored(client, question_ids):
+    token = member_token(create_survey(client, "idempotency-failed", members=1)["teamMembers"][0])
+    unknown_question = {"responses": [
+        {"questionId": question_id, "rating": 3} for question_id in question_ids[:2] + [str(uuid4())]
+    ]}
+
+    failed = client.post(f"/api/v1/survey/{token}/response", json=unknown_question, headers={"Idempotency-Key": "fail-1"})
+    assert failed.status_code == 400
+
+    complete = {"responses": [{"questionId": question_id, "rating": 3} for question_id in question_ids]}
+    retried = client.post(f"/api/v1/survey/{token}/response", json=complete, headers={"Idempotency-Key": "fail-1"})
+    assert retried.status_code == 201
+    assert REPLAY_HEADER not in retried.headers
@@ -0,0 +1,215 @@
+"""
+Invitation outbox claims, retries with exponential backoff and final states
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Sequence
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.invitation_worker import InvitationWorker
+from app.core.mail import EmailSender, OutgoingEmail
+from app.models.invitation import InvitationOutbox, InvitationStatus
+from app.models.survey import Survey
+from app.models.team_member import TeamMember
+from app.repositories.invitation import InvitationRepository
+
+RETRY_SECONDS = 60
+
+
+class RecordingSender(EmailSender):
+    """Fails every email while ``failing`` is set and records the delivered ones"""
+
+    def __init__(self):
+        self.failing = False
+        self.delivered: List[OutgoingEmail] = []
+
+    def send_batch(self, emails: Sequence[OutgoingEmail]) -> Dict[str, str]:
+        if self.failing:
+            return {email.reference: "mailbox unavailable" for email in emails}
+        self.delivered.extend(emails)
+        return {}
+
+
+@pytest.fixture
+def queued(session_factory):
+    """Queue one due invitation per member of a 3-member survey; returns the survey ID"""
+    db = session_factory()
+    try:
+        survey = Survey(manager_id="outbox-manager", title="Leadership Feedback Survey")
+        db.add(survey)
+        db.flush()
+        members = [
+            TeamMember(survey_id=survey.id, name=f"Member {index}", email=f"member{index}@example.com",
+                       unique_link=f"outbox-token-{index}")
+            for index in range(3)
+        ]
+        db.add_all(members)
+        db.commit()
+        InvitationRepository(db).enqueue(survey.id, [member.id for member in members], _now())
+        return survey.id
+    finally:
+        db.close()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _rows(session_factory) -> List[InvitationOutbox]:
+    db = session_factory()
+    try:
+        return db.execute(select(InvitationOutbox).order_by(InvitationOutbox.created_at)).scalars().all()
+    finally:
+        db.close()
+
+
+def _make_due(session_factory):
+    db = session_factory()
+    try:
+        db.execute(update(InvitationOutbox).values(next_attempt_at=_now() - timedelta(seconds=1)))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _worker(session_factory, sender: EmailSender, max_attempts: int = 3) -> InvitationWorker:
+    worker = InvitationWorker(
+        sender_factory=lambda: sender,
+        session_factory=session_factory,
+        batch_size=2,
+        concurrency=2,
+        max_attempts=max_attempts,
+        retry_seconds=RETRY_SECONDS,
+        claim_timeout_seconds=300
+    )
+    # drain_once is driven directly, without the polling loop start() would run
+    worker._sender = sender
+    return worker
+
+
+def test_claims_are_exclusive(session_factory, queued):
+    first = InvitationRepository(session_factory()).claim_due(2, _now())
+    second = InvitationRepository(session_factory()).claim_due(10, _now())
+
+    assert len(first) == 2
+    assert len(second) == 1
+    assert not {row.id for row in first} & {row.id for row in second}
+    assert all(row.attempts == 1 for row in first + second)
+    assert all(row.status == InvitationStatus.SENDING for row in _rows(session_factory))
+    assert InvitationRepository(session_factory()).claim_due(10, _now()) == []
+
+
+def test_rows_claimed_by_another_worker_meanwhile_are_not_returned(session_factory, queued, monkeypatch):
+    db = session_factory()
+    selected = db.execute(select(InvitationOutbox.id)).scalars().all()
+    # Another worker claims the rows between this worker's SELECT and UPDATE
+    assert len(InvitationRepository(session_factory()).claim_due(10, _now())) == len(selected)
+
+    class StaleSelection:
+        def scalars(self):
+            return self
+
+        def all(self):
+            return selected
+
+    execute = db.execute
+    results = iter([StaleSelection()])
+    monkeypatch.setattr(db, "execute", lambda *args, **kwargs: next(results, None) or execute(*args, **kwargs))
+
+    assert InvitationRepository(db).claim_due(10, _now()) == []
+    db.close()
+
+
+def test_only_expired_claims_are_released(session_factory, queued):
+    repo = InvitationRepository(session_factory())
+    claimed = repo.claim_due(10, _now())
+
+    assert repo.release_expired_claims(_now() - timedelta(seconds=300)) == 0
+    assert all(row.status == InvitationStatus.SENDING for row in _rows(session_factory))
+
+    assert repo.release_expired_claims(_now() + timedelta(seconds=1)) == len(claimed)
+    rows = _rows(session_factory)
+    assert all(row.status == InvitationStatus.PENDING and row.claim_token is None for row in rows)
+    assert len(repo.claim_due(10, _now())) == len(claimed)
+
+
+def test_delivered_invitations_are_marked_sent(session_factory, queued):
+    sender = RecordingSender()
+
+    assert asyncio.run(_worker(session_factory, sender).drain_once()) == 3
+
+    assert sorted(email.to for email in sender.delivered) == [f"member{index}@example.com" for index in range(3)]
+    for row in _rows(session_factory):
+        assert row.status == InvitationStatus.SENT
+        assert row.sent_at is not None
+        assert row.attempts == 1
+        assert row.last_error is None
+
+
+def test_failures_are_retried_with_backoff_until_max_attempts(session_factory, queued):
+    sender = RecordingSender()
+    sender.failing = True
+    worker = _worker(session_factory, sender, max_attempts=3)
+
+    for attempt in (1, 2):
+        started = _now().replace(tzinfo=None)
+        assert asyncio.run(worker.drain_once()) == 3
+        for row in _rows(session_factory):
+            assert row.status == InvitationStatus.PENDING
+            assert row.attempts == attempt
+            assert row.last_error == "mailbox unavailable"
+            delay = (row.next_attempt_at.replace(tzinfo=None) - started).total_seconds()
+            assert RETRY_SECONDS * 2 ** (attempt - 1) <= delay < RETRY_SECONDS * 2 ** (attempt - 1) + 5
+
+        # Not due yet: nothing is claimed before the backoff runs out
+        assert asyncio.run(worker.drain_once()) == 0
+        _make_due(session_factory)
+
+    assert asyncio.run(worker.drain_once()) == 3
+    for row in _rows(session_factory):
+        assert row.status == InvitationStatus.FAILED
+        assert row.attempts == 3
+        assert row.sent_at is None
+
+    _make_due(session_factory)
+    assert asyncio.run(worker.drain_once()) == 0
+
+
+def test_a_retry_can_still_succeed(session_factory, queued):
+    sender = RecordingSender()
+    sender.failing = True
+    worker = _worker(session_factory, sender)
+
+    asyncio.run(worker.drain_once())
+    _make_due(session_factory)
+    sender.failing = False
+    asyncio.run(worker.drain_once())
+
+    for row in _rows(session_factory):
+        assert row.status == InvitationStatus.SENT
+        assert row.attempts == 2
+        assert row.last_error is None
+
+
+def test_outcomes_of_an_expired_claim_are_ignored(session_factory, queued):
+    repo = InvitationRepository(session_factory())
+    stale = repo.claim_due(10, _now())
+    repo.release_expired_claims(_now() + timedelta(seconds=1))
+    current = repo.claim_due(10, _now())
+    stale_token = stale[0].claim_token
+
+    assert stale_token != current[0].claim_token
+    assert repo.mark_failed(stale[0].id, stale_token, "too late", _now()) == 0
+    assert repo.mark_sent([row.id for row in stale], stale_token, _now()) == 0
+    assert all(row.status == InvitationStatus.SENDING and row.last_error is None for row in _rows(session_factory))
+
+    assert repo.mark_sent([row.id for row in current], current[0].claim_token, _now()) == len(current)
+    # A late failure report must not send a delivered invitation back to the queue
+    assert repo.mark_failed(stale[0].id, stale_token, "too late", _now()) == 0
+    assert repo.mark_failed(current[0].id, current[0].claim_token, "too late", _now()) == 0
+    for row in _rows(session_factory):
+        assert row.status == InvitationStatus.SENT
+        assert row.claim_token is None
+        assert row.last_error is None
@@ -0,0 +1,85 @@
+"""
+Keyset (created_at, id) pagination and its opaque cursors
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor, split_page
+
+MEMBER = {"name": "Ada", "email": "ada@example.com"}
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 6, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "bm90fGE"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_split_page_returns_a_cursor_only_when_more_rows_exist():
+    class Row:
+        def __init__(self):
+            self.created_at = datetime(2025, 6, 1, tzinfo=timezone.utc)
+            self.id = uuid4()
+
+    rows = [Row() for _ in range(3)]
+
+    items, next_cursor = split_page(rows, 2)
+    assert items == rows[:2]
+    assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+    assert split_page(rows, 3) == (rows, None)
+
+
+def _pages(client, path: str, params: dict) -> list:
+    pages, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        page = response.json()["data"]
+        pages.append(page["items"])
+        cursor = page["nextCursor"]
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_rows_sharing_a_timestamp_exactly_once(client):
+    # Bulk creation gives every survey the same created_at, so only the id orders them
+    response = client.post("/api/v1/surveys:bulk", json={
+        "surveys": [{"managerId": "pagination-manager", "teamMembers": [MEMBER]} for _ in range(11)]
+    })
+    assert response.status_code == 201
+    created = {survey["surveyId"] for survey in response.json()["data"]}
+
+    pages = _pages(client, "/api/v1/surveys/", {"managerId": "pagination-manager", "limit": 3})
+    survey_ids = [item["surveyId"] for page in pages for item in page]
+
+    assert [len(page) for page in pages] == [3, 3, 3, 2]
+    assert len(survey_ids) == len(set(survey_ids)) == 11
+    assert set(survey_ids) == created
+    assert survey_ids == sorted(survey_ids)
+
+
+def test_team_member_pages_follow_creation_order(client):
+    members = [{"name": f"Member {index}", "email": f"member{index}@example.com"} for index in range(10)]
+    survey = client.post("/api/v1/surveys/", json={"managerId": "pagination-members", "teamMembers": members})
+    survey_id = survey.json()["data"]["surveyId"]
+
+    pages = _pages(client, f"/api/v1/surveys/{survey_id}/team-members", {"limit": 4})
+    member_ids = [item["id"] for page in pages for item in page]
+
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert sorted(member_ids) == sorted(member["id"] for member in survey.json()["data"]["teamMembers"])
+
+
+def test_invalid_cursor_is_a_bad_request(client):
+    response = client.get("/api/v1/surveys/", params={"managerId": "pagination-manager", "cursor": "garbage"})
+
+    assert response.status_code == 400
@@ -0,0 +1,28 @@
+"""
+Reloading of the in-memory question catalog
+"""
+from sqlalchemy import update
+
+from app.core.question_catalog import QuestionCatalog
+from app.models.question import SurveyQuestion
+from app.repositories.question import QuestionRepository
+from scripts.seed_data import seed_questions
+
+
+def test_catalog_reloads_edited_questions_after_its_ttl(session_factory):
+    db = session_factory()
+    seed_questions(db)
+    repo = QuestionRepository(db)
+
+    cached = QuestionCatalog(ttl_seconds=3600)
+    expiring = QuestionCatalog(ttl_seconds=0)
+    first = cached.get_ordered(repo)
+    # An unchanged reload keeps the snapshot rendered pages were built from
+    assert expiring.get_ordered(repo) is expiring.get_ordered(repo)
+
+    db.execute(update(SurveyQuestion).where(SurveyQuestion.id == first[0].id).values(question_text="Edited question"))
+    db.commit()
+
+    assert cached.get_ordered(repo) is first
+    assert expiring.get_ordered(repo)[0].question_text == "Edited question"
+    db.close()